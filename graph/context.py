@@ -0,0 +1,100 @@
+"""
+Bounded prompt context of the code_writing / code_eval repair loop.
+
+Instead of formatting the whole message history on every iteration, each call gets a
+prompt rebuilt from the loop's state: the system prompt, the task, the planner's
+strategy and page summary, the latest script, a digest of its last run (exit status,
+head and tail of stdout, tail of stderr, evaluator verdict) and a rolling one-line
+summary per earlier attempt. Every section is clipped to its own token budget, so a
+prompt stays within CONTEXT_BUDGET whatever the iteration.
+"""
+from langchain_core.messages import SystemMessage, HumanMessage, ToolMessage
+
+from python.rate_governor import estimate_tokens
+
+PLAN_BUDGET     = 800   # estimated tokens of the planner's strategy
+PAGE_BUDGET     = 1500  # career page summary from the planner's web tools
+CODE_BUDGET     = 2500  # latest script
+DIGEST_BUDGET   = 800   # latest run: exit status, stdout, stderr and verdict
+SUMMARY_BUDGET  = 600   # earlier attempts, newest kept
+PROMPT_BUDGET   = 500   # system prompt, task and section headers
+CONTEXT_BUDGET  = PLAN_BUDGET + PAGE_BUDGET + CODE_BUDGET + DIGEST_BUDGET + SUMMARY_BUDGET + PROMPT_BUDGET
+CHARS_PER_TOKEN = 4     # same estimate as python/rate_governor.estimate_tokens
+LINE_CHARS      = 200   # one earlier attempt in the rolling summary
+
+
+# FUNCTIONS
+# =======================
+
+def clip(text: str, tokens: int, tail_share: float = 0.5) -> str:
+    """Keep the head and tail of `text` within ~`tokens` tokens, marking the cut."""
+    text  = (text or '').strip()
+    limit = tokens * CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    tail = int(limit * tail_share)
+    head = limit - tail
+    return f'{text[:head]}\n[... {len(text) - limit} characters cut ...]\n{text[len(text) - tail:] if tail else ""}'.rstrip()
+
+
+def run_digest(returncode: int, stdout: str, stderr: str, verdict: str = '') -> str:
+    """Digest of one run of the script: exit status, stdout head and tail, stderr tail (errors end tracebacks)."""
+    budget = DIGEST_BUDGET // 4 if verdict else DIGEST_BUDGET // 3
+    digest = (f'* exit status: {returncode}\n'
+              f'* stdout ({len(stdout.splitlines())} lines):\n{clip(stdout, 2 * budget) or "(empty)"}\n'
+              f'* stderr:\n{clip(stderr, budget, tail_share=0.8) or "(empty)"}')
+    if verdict:
+        digest += f'\n* evaluator: {clip(verdict, budget)}'
+    return digest
+
+
+def attempt_line(attempt: int, returncode: int, stdout: str, stderr: str, verdict: str) -> str:
+    """One line of the rolling summary: how an attempt ended and its last error."""
+    errors  = [line.strip() for line in (stderr or '').splitlines() if line.strip()]
+    verdict = (verdict or '').strip().splitlines()
+    reason  = errors[-1] if errors else verdict[0] if verdict else 'no error'
+    line    = f'attempt {attempt}: exit {returncode}, {len((stdout or "").splitlines())} stdout lines - {reason}'
+    return line[:LINE_CHARS]
+
+
+def rolling_summary(attempts: list[str], tokens: int = SUMMARY_BUDGET) -> str:
+    """The newest attempt lines that fit in `tokens`, oldest first."""
+    kept, used = [], 0
+    for line in reversed(attempts):
+        cost = estimate_tokens(line)
+        if used + cost > tokens:
+            break
+        kept.append(line)
+        used += cost
+    omitted = len(attempts) - len(kept)
+    return '\n'.join(([f'({omitted} earlier attempts omitted)'] if omitted else []) + kept[::-1])
+
+
+def page_summary(messages: list) -> str:
+    """Content of the last web tool answer (the career page summary the planner worked from)."""
+    for message in reversed(messages):
+        if isinstance(message, ToolMessage):
+            return str(message.content)
+    return ''
+
+
+def writer_messages(system: str, task: str, plan: str, page: str,
+                    code: str = '', digest: str = '', attempts: list[str] | None = None) -> list:
+    """Prompt of code_writing: the task, then on repairs the latest code, its run digest and the earlier attempts."""
+    sections = [task]
+    if plan:
+        sections.append(f'Strategy:\n{clip(plan, PLAN_BUDGET)}')
+    if page:
+        sections.append(f'Career page summary:\n{clip(page, PAGE_BUDGET, tail_share=0)}')
+    if attempts:
+        sections.append(f'Earlier attempts:\n{rolling_summary(attempts)}')
+    if code:
+        sections.append(f'Here is the code that you previously wrote:\n{clip(code, CODE_BUDGET)}')
+        sections.append(f'It ran with this result:\n{digest}\nCan you re-write the code by fixing the error?')
+    return [SystemMessage(content=system), HumanMessage(content='\n\n'.join(sections))]
+
+
+def eval_messages(system: str, task: str, digest: str) -> list:
+    """Prompt of code_eval: the task and the digest of the run to judge."""
+    return [SystemMessage(content=system),
+            HumanMessage(content=f'{task}\n\nCheck whether the code ran successfully based on the following output:\n{digest}')]
@@ -13,6 +13,8 @@ from langgraph.graph import START, END, StateGraph, MessagesState
 ## Typing
 from pydantic import BaseModel, Field
 from typing import List,Sequence,TypedDict,Annotated,Literal
+## registered scrapers
+from python.tools import scraper_for
 
 # CLASSES
 # =======================
@@ -20,6 +22,17 @@ from typing import List,Sequence,TypedDict,Annotated,Literal
 # FUNCTIONS
 # =======================
 
+def Router0(state)-> Literal['dispatcher','agent']:
+    """
+    Entry point, companies with a registered scraper skip the agent and call it directly
+    """
+    print('>> 0.0 Router0')
+
+    if scraper_for(state.get('company', '')):
+        print('> 0.0 registered scraper')
+        return 'dispatcher'
+    return 'agent'
+
 def Router1(state)-> Literal['jobTools','codePlanner','filterer']:
     """
     first pass, decides whether to call tool -> formatting or write code to extract jobs
@@ -1,6 +1,6 @@
 import os
+import asyncio
 from typing import List,Sequence,TypedDict,Annotated,Literal
-import subprocess as sub
 ## langchain
 from langchain_core.messages import ToolMessage, BaseMessage, AIMessage, HumanMessage, SystemMessage
 from langchain_core.prompts import PromptTemplate, ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
@@ -17,6 +17,11 @@ from typing import List,Sequence,TypedDict,Annotated,Literal
 
 ## Custom scripts:
 from python.tools import *
+from python.records import records_from_json, records_to_json
+from python.job_filter import FILTER_CRITERIA, filter_jobs
+from python.llm_clients import chat
+from python.warm_eval import evaluate
+from graph.context import writer_messages, eval_messages, run_digest, attempt_line, page_summary
 
 # Tools
 # =======================
@@ -40,9 +45,23 @@ class JobList(BaseModel):
 # FUNCTIONS
 # =======================
 
+async def dispatch_scraper(state):
+    """
+    Calls the scraper registered for the company directly, no LLM round trip (see Router0)
+    """
+
+    print(f'>> 0. Registered scraper >>')
+
+    name = scraper_for(state['company'])
+    # scrapers run their own event loop, so they go to a worker thread
+    jobs = await asyncio.to_thread(JOB_SCRAPERS[name])
+    print(f'> {name}: {len(jobs)} jobs')
+    content = records_to_json(jobs)
+    return { "messages": [AIMessage(content=content)], "joblist": content }
+
 async def call_agent(state):
     """
-    First pass to know what to do, if it cannot find a tool to extract job list, then refer to code-writing agent
+    First pass for companies without a registered scraper: the LLM looks for a matching tool, if it cannot find one then refer to code-writing agent
     """
 
     print(f'>> 0. First pass >>')
@@ -55,7 +74,7 @@ Do not explain, do not apologize, do not add any other text.
     """) # 
     
     # model    = ChatAnthropic(model="claude-sonnet-4-5",temperature=0).bind_tools(job_tools)
-    model    = ChatOpenAI(model=['gpt-4o-mini','gpt-5'][1],temperature=0).bind_tools(job_tools)
+    model    = chat(['gpt-4o-mini','gpt-5'][1], tools=job_tools)
     state['question'] = ''
     response = { "messages": [await model.ainvoke([system_message]+ state["messages"])],"question": ''}
     return response
@@ -77,7 +96,7 @@ async def code_planning(state):
     question   = f"""can you design a strategy to extract jobs and urls from this career webpage: '{webpage}'?""" 
     human_message = HumanMessage(content=question)
     # 3. ask model
-    model = ChatAnthropic(model="claude-sonnet-4-5",temperature=0).bind_tools(web_tools)
+    model = chat("claude-sonnet-4-5", tools=web_tools)
     messages = [system_message]+ [human_message] + state["messages"]
     # print(messages)
     result= await model.ainvoke(messages)
@@ -88,34 +107,41 @@ async def code_planning(state):
     
     return response
 
+FILTER_PROMPT = FILTER_CRITERIA + """
+Return ONLY the filtered job list in the same format."""
+FILTER_MODEL_NAME = ['gpt-4o-mini','gpt-5','gpt-5.2-2025-12-11'][-1]
+
 async def joblist_filtering(state):
     """
     Takes the list of job and filter
+    When the list is a {"jobs": [...]} JSON it goes through the same filter layers as the simplified
+    pipeline (python/job_filter.py): only the titles no earlier layer can decide go to the model cascade
     """
 
     print(f'>> 1.a filtering relevant jobs >>')
     
     messages = state['messages']
     state['joblist'] = messages[-1].content
+    company = state.get('company', '')
 
-    system_message = SystemMessage(content="""You are a strict job filter. ONLY return jobs that are directly related to:
-- Machine Learning / AI
-- Cheminformatics
-- Computational Assisted Drug Discovery (CADD)
-- Computational Chemistry
-- Data Science
+    # 1. structured job list: the shared triage layers, then the model cascade (see python/job_filter.py)
+    jobs = records_from_json(state['joblist'], company)
+    if jobs is not None:
+        kept    = await filter_jobs(jobs, company)
+        content = records_to_json(kept)
+        return { "messages": [AIMessage(content=content)], "joblist": content }
 
-EXCLUDE jobs like: DevOps, statistician, Software Engineering, Tech Lead, general Post-Doc positions, general scientific associate, or any role not directly involving the above fields.
-Return ONLY the filtered job list in the same format.""")
+    system_message = SystemMessage(content=FILTER_PROMPT)
 
     question   = f"Filter and return ONLY relevant jobs from:\n{state['joblist']}"
     human_message = HumanMessage(content=question)
     # 3. ask model
-    model = ChatOpenAI(model=['gpt-4o-mini','gpt-5','gpt-5.2-2025-12-11'][-1],temperature=0)
+    model = chat(FILTER_MODEL_NAME)
     messages = [system_message]+ [human_message]
     # print(messages)
     result = await model.ainvoke(messages)
     # print(result)
+
     response = { "messages": [result], "joblist":result.content }
         
     return response
@@ -139,7 +165,7 @@ async def joblist_formatting(state):
     question     = f"""can you split this list {state['joblist']}, which contains job name and url into a nice json format?
     ONLY ouput a json format without JSON block markers (```json and ```)"""
     request      = chat_prompt.format_prompt(request=question,format_instructions=parser.get_format_instructions()).to_messages()
-    model        = ChatAnthropic(model='claude-sonnet-4-5',temperature=0)
+    model        = chat('claude-sonnet-4-5')
     response     = await model.ainvoke(request)
 
     state['messages'].append(response)
@@ -166,23 +192,22 @@ async def code_writing(state):
     # 3. you end with with 'await main()' instead of 'asyncio.run(main())
     sel_               = state['company']
     company2careerpage = state['company2careerpage']
-    question   = f"""can you write a short python code to list the jobs from the company {sel_} career page ({company2careerpage[sel_]})?\n
-    {state['question']}""" 
+    question   = f"""can you write a short python code to list the jobs from the company {sel_} career page ({company2careerpage[sel_]})?"""
+    # the planner's strategy arrives in 'question', keep it for the repair iterations
+    if not state.get('codeplan'):
+        state['codeplan'] = state['question']
 
-    state["messages"].append(HumanMessage(content=question))
-    state["messages"].append(system_message)
-    # print('> question:',state["question"])
-    
     if 1<3:
-        # define the messages
-        prompt   = ChatPromptTemplate.from_messages(state['messages']).format()
+        # bounded prompt: task, strategy, page summary and on repairs the latest code, run digest and earlier attempts (see graph/context.py)
+        prompt   = writer_messages(system_message.content, question, state['codeplan'], page_summary(state['messages']),
+                                   state.get('codescript', ''), state.get('evaldigest', ''), state.get('attempts', [])[:-1])
         # select coding model (here gpt 5)
-        model    = ChatOpenAI(model=['gpt-4o-mini','gpt-5','gpt-5.2-2025-12-11'][-1],temperature=0)
+        model    = chat(['gpt-4o-mini','gpt-5','gpt-5.2-2025-12-11'][-1])
         # model      = ChatAnthropic(model="claude-sonnet-4-5",temperature=0)
         # get response and prb
         response = await model.ainvoke(prompt) # you are calling the llm here!
         state['messages'].append(response) # don't forget to add message to the response!
-        state['codescript'] = state['messages'][-1].content #
+        state['codescript'] = response.content #
         state['codeiter'] += 1
         
     return state
@@ -204,22 +229,14 @@ async def code_eval(state):
 
     print('>> 2. Code Evaluation >>')
 
-    if 1 < 3:
-        # save code to file to check whether it works
-        with open("./tmp/tmp.py", "w") as f:
-            f.write(state['codescript'])
-        f.close()
-    
-    # run and check outputs
-    p = sub.run( 'python ./tmp/tmp.py',shell=True, capture_output=True )
-    exit_status = '\n* exit status: '+ str(p.returncode)
-    stdout      = '\n* stdout: ' + p.stdout.decode()
-    stderr      = '\n* stderr:' + p.stderr.decode()
-    print( exit_status )
-    print( stdout )
-    print( stderr )
-
-    state['joblist'] = p.stdout.decode()
+    # run the code on the warm worker (imports and browser ready) under the sandbox limits (see python/warm_eval.py)
+    p = await evaluate(state['codescript'])
+    stdout, stderr = p.stdout, p.stderr
+    digest         = run_digest(p.returncode, stdout, stderr)
+    print( digest )
+    print(f'> ran in {p.seconds:.1f}s')
+
+    state['joblist'] = stdout
     
     ## use LLM to check whether the code was run correcly and ouptut matches expectation, otherwise return code to code writer
     # define the system message
@@ -234,24 +251,21 @@ async def code_eval(state):
         """
     )
     
-    question   = f'Check whether the code ran successfully based on the following output {exit_status+stdout+stderr} '
-
-    state["messages"].append(HumanMessage(content=question))
-    state["messages"].append(system_message)
+    sel_     = state['company']
+    question = f"The code should list the jobs from the company {sel_} career page ({state['company2careerpage'][sel_]})."
 
-    # define the messages
-    messages = state['messages']
-    prompt   = ChatPromptTemplate.from_messages(messages).format()
+    # bounded prompt: only the digest of this run is judged (see graph/context.py)
+    prompt   = eval_messages(system_message.content, question, digest)
     # select coding model (here gpt 5)
     # model    = ChatOpenAI(model=['gpt-4o-mini','gpt-5'][1],openai_api_key=os.environ['OPENAI_API_KEY'],temperature=0)
-    model    = ChatAnthropic(model="claude-sonnet-4-5",temperature=0)
+    model    = chat("claude-sonnet-4-5")
     # get response and prb
     response = await model.ainvoke(prompt)    # you are calling the llm here!
     print('\n> response:',response.content)
     state['messages'].append(response) # don't forget to add message to the response!
-    # update the request in case we need to re-write the code
-    question = f'Here is the code that you previously wrote:\n "{state['codescript']}"\n, which got this output "{p.stdout.decode()}" and got this error: "{response.content}" - can you re-write the code by fixing the error?'
-    state["question"] = question
+    # keep what the code writer needs for a repair: this run's digest and one summary line per attempt
+    state['evaldigest'] = run_digest(p.returncode, stdout, stderr, response.content)
+    state['attempts']   = state.get('attempts', []) + [attempt_line(state['codeiter'], p.returncode, stdout, stderr, response.content)]
     
     return state
 pass
@@ -14,4 +14,6 @@ class ChatMessages(TypedDict):
     joblist: str # the job list results from parsing career page
     # mytools: List[{}] # the list of tools to access the company jobs # !! YOU CANNOT PASS TOOLS HERE, OTHERWISE ERROR!!
     company2careerpage: dict # associates the company with their jobs postings
-    codeplan: str # holds the string describing how to write code from planner
\ No newline at end of file
+    codeplan: str # holds the string describing how to write code from planner
+    evaldigest: str # digest of the last code run and its evaluation (see graph/context.py)
+    attempts: List[str] # one summary line per code attempt
\ No newline at end of file
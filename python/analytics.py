@@ -0,0 +1,166 @@
+"""
+Posting analytics over the job history kept in the job store (see python/jobstore.py).
+
+Two summary tables are materialized in the store database and updated incrementally
+after each run (only the weeks touched since the last update are recomputed):
+
+    stats_weekly     (company, week, posted, closed)   jobs first seen / closed per ISO week
+    stats_open_days  (company, week, bucket, jobs)     how long the jobs closed that week stayed open
+
+Reports read the small summary tables only, never the job history:
+
+    python -m python.analytics --velocity          # posts per week per company (last --weeks weeks)
+    python -m python.analytics --durations         # time-to-close distribution per company
+    python -m python.analytics --trend --weeks 26  # weekly posted / closed totals
+    python -m python.analytics --full              # rebuild, e.g. after --import-backups
+"""
+import sqlite3
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from python.jobstore import STORE_PATH, get_job_store
+
+WEEKS        = 12  # default report window
+BUCKET_EDGES = [0, 7, 14, 30, 60, 90, 180, 100_000]  # days open
+BUCKETS      = ['<1w', '1-2w', '2w-1m', '1-2m', '2-3m', '3-6m', '>6m']
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS stats_weekly (
+    company TEXT NOT NULL,
+    week    TEXT NOT NULL,    -- Monday of the ISO week, YYYY-MM-DD
+    posted  INTEGER NOT NULL,
+    closed  INTEGER NOT NULL,
+    PRIMARY KEY (company, week)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS stats_open_days (
+    company TEXT NOT NULL,
+    week    TEXT NOT NULL,    -- week the jobs were closed
+    bucket  TEXT NOT NULL,
+    jobs    INTEGER NOT NULL,
+    PRIMARY KEY (company, week, bucket)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS stats_state (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _connect(path: str = STORE_PATH) -> sqlite3.Connection:
+    get_job_store()  # make sure the store exists and is migrated
+    conn = sqlite3.connect(path, timeout=30)
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _week(dates: pd.Series) -> pd.Series:
+    """Monday of the week of each YYYY-MM-DD date, as YYYY-MM-DD."""
+    days = pd.to_datetime(dates, format='%Y-%m-%d')
+    return (days - pd.to_timedelta(days.dt.weekday, unit='D')).dt.strftime('%Y-%m-%d')
+
+
+def update(full: bool = False, path: str = STORE_PATH) -> int:
+    """
+    Recompute the summary rows of the weeks touched since the last update (all weeks with `full`).
+    :return: number of summary rows written
+    """
+    conn = _connect(path)
+    try:
+        row   = conn.execute("SELECT value FROM stats_state WHERE key='updated_until'").fetchone()
+        since = '' if full or row is None else _week(pd.Series([row[0]])).iloc[0]
+
+        posted = pd.read_sql_query('SELECT company, date FROM jobs WHERE date >= ? '
+                                   'UNION ALL SELECT company, date FROM jobs_closed WHERE date >= ?', conn, params=(since, since))
+        closed = pd.read_sql_query('SELECT company, date, closed_on FROM jobs_closed WHERE closed_on >= ?', conn, params=(since,))
+
+        posted['week'] = _week(posted['date'])
+        closed['week'] = _week(closed['closed_on'])
+        days = (pd.to_datetime(closed['closed_on'], format='%Y-%m-%d') - pd.to_datetime(closed['date'], format='%Y-%m-%d')).dt.days
+        closed['bucket'] = pd.cut(days.clip(lower=0), bins=BUCKET_EDGES, labels=BUCKETS, right=False)
+
+        weekly = pd.concat([posted.groupby(['company', 'week']).size().rename('posted'),
+                            closed.groupby(['company', 'week']).size().rename('closed')], axis=1)
+        weekly = weekly.fillna(0).astype(int).reset_index()
+        open_days = closed.groupby(['company', 'week', 'bucket'], observed=True).size().rename('jobs').reset_index()
+        open_days['bucket'] = open_days['bucket'].astype(str)
+
+        with conn:
+            conn.execute('DELETE FROM stats_weekly WHERE week >= ?', (since,))
+            conn.execute('DELETE FROM stats_open_days WHERE week >= ?', (since,))
+            # plain ints: sqlite3 cannot bind numpy integers
+            conn.executemany('INSERT INTO stats_weekly VALUES (?, ?, ?, ?)',
+                             [(c, w, int(p), int(n)) for c, w, p, n in weekly.itertuples(index=False, name=None)])
+            conn.executemany('INSERT INTO stats_open_days VALUES (?, ?, ?, ?)',
+                             [(c, w, b, int(n)) for c, w, b, n in open_days.itertuples(index=False, name=None)])
+            conn.execute("INSERT OR REPLACE INTO stats_state VALUES ('updated_until', ?)", (datetime.today().strftime('%Y-%m-%d'),))
+    finally:
+        conn.close()
+    print(f'>> Analytics: {len(weekly)} weekly and {len(open_days)} time-to-close rows updated'
+          + (f' (weeks since {since})' if since else ' (full rebuild)'))
+    return len(weekly) + len(open_days)
+
+
+def _window_start(weeks: int) -> str:
+    return _week(pd.Series([(datetime.today() - timedelta(weeks=weeks)).strftime('%Y-%m-%d')])).iloc[0]
+
+
+def velocity(weeks: int = WEEKS, path: str = STORE_PATH) -> pd.DataFrame:
+    """Per company: jobs posted and closed in the last `weeks` weeks and posts per week, most active first."""
+    conn = _connect(path)
+    try:
+        df = pd.read_sql_query('SELECT company, SUM(posted) AS posted, SUM(closed) AS closed FROM stats_weekly '
+                               'WHERE week >= ? GROUP BY company', conn, params=(_window_start(weeks),))
+    finally:
+        conn.close()
+    df['per_week'] = (df['posted'] / weeks).round(2)
+    return df.sort_values('posted', ascending=False).reset_index(drop=True)
+
+
+def open_durations(weeks: int | None = None, path: str = STORE_PATH) -> pd.DataFrame:
+    """Per company: closed jobs per time-open bucket (optionally only those closed in the last `weeks` weeks) and the median bucket."""
+    conn = _connect(path)
+    try:
+        df = pd.read_sql_query('SELECT company, bucket, SUM(jobs) AS jobs FROM stats_open_days WHERE week >= ? '
+                               'GROUP BY company, bucket', conn, params=(_window_start(weeks) if weeks else '',))
+    finally:
+        conn.close()
+    table = df.pivot(index='company', columns='bucket', values='jobs').reindex(columns=BUCKETS).fillna(0).astype(int)
+    share = table.cumsum(axis=1).div(table.sum(axis=1), axis=0)
+    table['closed'] = table[BUCKETS].sum(axis=1)
+    table['median'] = (share >= 0.5).idxmax(axis=1)
+    return table.sort_values('closed', ascending=False)
+
+
+def weekly_trend(weeks: int = WEEKS, path: str = STORE_PATH) -> pd.DataFrame:
+    """Jobs posted and closed per week over all companies."""
+    conn = _connect(path)
+    try:
+        return pd.read_sql_query('SELECT week, SUM(posted) AS posted, SUM(closed) AS closed FROM stats_weekly '
+                                 'WHERE week >= ? GROUP BY week ORDER BY week', conn, params=(_window_start(weeks),))
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Posting velocity, time-to-close and weekly trends')
+    parser.add_argument('--full', action='store_true', help='Rebuild the summary tables from the whole history')
+    parser.add_argument('--import-backups', action='store_true', help='Load the ./output/bak history into the store first (implies --full)')
+    parser.add_argument('--velocity', action='store_true', help='Posts per week per company')
+    parser.add_argument('--durations', action='store_true', help='Time-to-close distribution per company')
+    parser.add_argument('--trend', action='store_true', help='Weekly posted / closed totals')
+    parser.add_argument('--weeks', type=int, default=WEEKS, help='Report window in weeks')
+    args = parser.parse_args()
+
+    if args.import_backups:
+        get_job_store().import_backups()
+    update(full=args.full or args.import_backups)
+    with pd.option_context('display.max_rows', None, 'display.width', 200):
+        if args.velocity:
+            print(velocity(args.weeks))
+        if args.durations:
+            print(open_durations())
+        if args.trend:
+            print(weekly_trend(args.weeks))
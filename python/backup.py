@@ -0,0 +1,80 @@
+"""
+Append-only backups of the job store.
+
+Every batch of newly inserted jobs is appended as a small zstd-compressed Parquet
+file under ./output/bak/date=YYYY-MM-DD/, partitioned by first-seen date, so backup
+storage and write I/O grow with the new jobs only. The store as it was at the end
+of any past day is the union of all partitions up to that day:
+
+    python -m python.backup --as-of 2026-10-01 --csv ./output/joblist_2026-10-01.csv
+"""
+import os
+import uuid
+from datetime import datetime
+
+import pandas as pd
+
+from python.canonical import fingerprint
+
+BACKUP_DIR = './output/bak'
+COLUMNS    = ['name', 'url', 'company', 'canonical_url', 'date']
+
+
+def write_delta(rows: list[dict], backup_dir: str = BACKUP_DIR) -> list[str]:
+    """Append new job rows to their date partitions; returns the files written."""
+    if not rows:
+        return []
+    df    = pd.DataFrame(rows)[COLUMNS]
+    stamp = datetime.now().strftime('%H%M%S')
+    paths = []
+    for date, part in df.groupby('date'):
+        folder = os.path.join(backup_dir, f'date={date}')
+        os.makedirs(folder, exist_ok=True)
+        # unique name: several writers may append to the same day
+        path = os.path.join(folder, f'part-{stamp}-{uuid.uuid4().hex[:8]}.parquet')
+        part.drop(columns='date').to_parquet(path, compression='zstd', index=False)
+        paths.append(path)
+    return paths
+
+
+def partitions(backup_dir: str = BACKUP_DIR) -> list[str]:
+    """Dates that have a delta partition, oldest first."""
+    if not os.path.isdir(backup_dir):
+        return []
+    return sorted(d.removeprefix('date=') for d in os.listdir(backup_dir) if d.startswith('date='))
+
+
+def read_as_of(date: str, backup_dir: str = BACKUP_DIR) -> pd.DataFrame:
+    """Job list (name, url, company, date) as it stood at the end of `date` (YYYY-MM-DD)."""
+    frames = []
+    for day in partitions(backup_dir):
+        if day > date:
+            break
+        folder = os.path.join(backup_dir, f'date={day}')
+        for file in sorted(os.listdir(folder)):
+            if file.endswith('.parquet'):
+                frames.append(pd.read_parquet(os.path.join(folder, file)).assign(date=day))
+    if not frames:
+        return pd.DataFrame(columns=['name', 'url', 'company', 'date'])
+    df = pd.concat(frames, ignore_index=True).sort_values('date', kind='stable')
+    # a job re-appended later (e.g. an older sighting imported afterwards) keeps its first date;
+    # fingerprints are recomputed so deltas written under older canonicalization rules still match
+    df['fingerprint'] = [fingerprint(company, url) for company, url in zip(df['company'], df['url'])]
+    df = df.drop_duplicates('fingerprint', keep='first')
+    return df[['name', 'url', 'company', 'date']].reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Reconstruct the job list from the delta backups')
+    parser.add_argument('--as-of', default=datetime.today().strftime('%Y-%m-%d'), help='Day to reconstruct (YYYY-MM-DD)')
+    parser.add_argument('--csv', help='Write the reconstructed job list to this CSV')
+    args = parser.parse_args()
+
+    df = read_as_of(args.as_of)
+    print(f'>> {len(df)} jobs known at the end of {args.as_of}')
+    if args.csv:
+        df.to_csv(args.csv, sep=',', index=False)
+    else:
+        print(df)
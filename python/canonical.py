@@ -0,0 +1,80 @@
+"""
+Job URL canonicalization and fingerprints for cross-run deduplication.
+
+The same posting can come back with a different locale prefix (/en-US/ vs /en-EN/),
+tracking query strings or a trailing slash. Known platforms are reduced to their
+stable posting ID; anything else to a normalized URL:
+
+    Workday       https://roche.wd3.myworkdayjobs.com/en-US/roche-ext/job/Basel/Data-Scientist_202409-123456
+                  -> workday:roche:202409-123456
+    Greenhouse    https://job-boards.greenhouse.io/isomorphiclabs/jobs/4012345 (or ?gh_jid=4012345)
+                  -> greenhouse:4012345
+    PhenomPeople  https://careers.takeda.com/global/en/job/R0123456/Senior-Data-Scientist
+                  -> phenom:careers.takeda.com:R0123456
+    Novartis REQ  https://www.novartis.com/careers/career-search/job/details/req-10012345-data-scientist
+                  -> req:novartis.com:REQ-10012345
+
+fingerprint() hashes (company, canonical key) into the short string indexed by the job store.
+"""
+import re
+import hashlib
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+TRACKING_PARAMS = {'gclid', 'fbclid', 'msclkid', 'mc_cid', 'mc_eid', 'src', 'source', 'ref', 'referrer', 'trk',
+                   'trackingid', 'sourcetype', 'codes', 'ss', 'iis', 'iisn'}
+
+_LOCALE_RE    = re.compile(r'^[a-z]{2}(?:[-_][a-zA-Z]{2})?$')
+_WORKDAY_RE   = re.compile(r'_([A-Za-z]*-?\d[\w-]*)$')
+_GREENHOUSE_RE = re.compile(r'/jobs/(\d+)')
+_PHENOM_RE    = re.compile(r'^(?:/[a-z]{2,6}){0,2}/job/([A-Za-z]*-?\d[\w-]*)(?:/|$)')
+_REQ_RE       = re.compile(r'\b(req-\d+)', re.IGNORECASE)
+
+
+def _host(netloc: str) -> str:
+    return netloc.lower().split(':')[0].removeprefix('www.')
+
+
+def canonical_url(url: str) -> str:
+    """Stable key of a job posting URL (platform posting ID, or a normalized URL)."""
+    parts = urlsplit((url or '').strip())
+    host  = _host(parts.netloc)
+    path  = parts.path.rstrip('/')
+    query = parse_qsl(parts.query, keep_blank_values=True)
+
+    # Workday: .../job/<location>/<title>_<requisition id>
+    if host.endswith(('myworkdayjobs.com', 'myworkdaysite.com')) and '/job/' in path:
+        match = _WORKDAY_RE.search(path.rsplit('/', 1)[-1])
+        if match:
+            return f'workday:{host.split(".")[0]}:{match.group(1).upper()}'
+
+    # Greenhouse: boards hosted by greenhouse, or embedded on the company site with gh_jid
+    gh_jid = next((v for k, v in query if k == 'gh_jid' and v.isdigit()), None)
+    if gh_jid:
+        return f'greenhouse:{gh_jid}'
+    if host.endswith('greenhouse.io'):
+        match = _GREENHOUSE_RE.search(path)
+        if match:
+            return f'greenhouse:{match.group(1)}'
+
+    # Novartis / Sandoz style requisition numbers
+    match = _REQ_RE.search(path)
+    if match:
+        return f'req:{host}:{match.group(1).upper()}'
+
+    # PhenomPeople: [/<site>/<locale>]/job/<job id>/<slug>
+    match = _PHENOM_RE.search(path)
+    if match:
+        return f'phenom:{host}:{match.group(1).upper()}'
+
+    # anything else: normalized URL without locale prefix, tracking parameters or fragment
+    segments = [s for s in path.split('/') if s]
+    if segments and _LOCALE_RE.match(segments[0]) and host.endswith(('myworkdayjobs.com', 'myworkdaysite.com')):
+        segments = segments[1:]
+    query = sorted((k, v) for k, v in query if k.lower() not in TRACKING_PARAMS and not k.lower().startswith('utm_'))
+    return host + '/' + '/'.join(segments) + (f'?{urlencode(query)}' if query else '')
+
+
+def fingerprint(company: str, url: str) -> str:
+    """Short stable hash of (company, canonical URL) used for O(1) "seen before?" lookups."""
+    key = f'{(company or "").lower()}|{canonical_url(url)}'
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:20]
@@ -0,0 +1,184 @@
+"""
+Model cascade for the LLM relevance filters.
+
+A fast, cheap model scores every job with a probability of being relevant; only jobs
+whose probability falls inside that tier's uncertainty band are escalated to the next,
+larger model. The last tier decides everything it receives at 0.5.
+
+Tiers are configured as "model[:low-high],model[:low-high],...,model", e.g.
+JSA_FILTER_CASCADE="gpt-4o-mini:0.15-0.85,gpt-5.2-2025-12-11". A single model is
+a plain one-tier filter. Per-tier latency, token use and escalation rate are
+collected in STATS and printed with report().
+"""
+import os
+import re
+import json
+import time
+import asyncio
+from collections import Counter
+
+from langchain_core.messages import HumanMessage, SystemMessage
+from python.rate_governor import RateGovernor, estimate_tokens
+from python.llm_clients import chat, loop_state
+
+DEFAULT_CASCADE    = 'gpt-4o-mini:0.15-0.85,gpt-5.2-2025-12-11'
+BATCH_TOKEN_BUDGET = 3000     # estimated prompt tokens of numbered job lines per call
+TIER_CONCURRENCY   = 4        # calls in flight per tier
+TIER_RPM           = 500      # provider requests-per-minute limit per model
+TIER_TPM           = 200_000  # provider tokens-per-minute limit per model
+REPORT_FLOOR       = 0.1      # jobs below this probability may be left out of the answer
+
+SCORE_INSTRUCTIONS = f"""
+You receive a numbered list of job titles (sometimes followed by the company in brackets).
+For every job with a probability of at least {REPORT_FLOOR} of being relevant, return its number and that probability (0 to 1).
+Return ONLY a JSON array of [number, probability] pairs, e.g. [[0, 0.95], [4, 0.4]], or [] if no job is relevant.
+Jobs you leave out count as not relevant. Do NOT include any markdown code blocks or explanations."""
+
+STATS = {}  # model -> Counter of calls, jobs, escalated, failed, seconds, input_tokens, output_tokens
+
+# one rate governor per model, shared by every cascade of the running event loop (its asyncio lock
+# belongs to that loop, see llm_clients.loop_state); clients come from the shared registry without
+# retries, which are left to the governor so retry-after hints pause all callers at once
+
+
+def _client(model: str):
+    return chat(model, max_retries=0)
+
+
+def _governor(model: str) -> RateGovernor:
+    governors = loop_state().setdefault('governors', {})
+    if model not in governors:
+        governors[model] = RateGovernor(rpm=TIER_RPM, tpm=TIER_TPM)
+    return governors[model]
+
+
+def parse_tiers(spec: str) -> list[tuple[str, tuple[float, float] | None]]:
+    """Parse "model:low-high,...,model" into [(model, (low, high)), ..., (model, None)]."""
+    tiers = []
+    for part in [p.strip() for p in spec.split(',') if p.strip()]:
+        model, _, band = part.partition(':')
+        low, _, high   = band.partition('-')
+        tiers.append((model, (float(low), float(high)) if band else None))
+    if not tiers:
+        raise ValueError(f'empty model cascade: {spec!r}')
+    # the last tier always decides
+    tiers[-1] = (tiers[-1][0], None)
+    return tiers
+
+
+def _parse_scores(text: str, size: int) -> list[float] | None:
+    """Read the [[number, probability], ...] answer into one probability per job (None if unreadable)."""
+    match = re.search(r'\[.*\]', text or '', re.DOTALL)
+    if match is None:
+        return None
+    try:
+        pairs = json.loads(match.group())
+    except json.JSONDecodeError:
+        return None
+    scores = [0.0] * size
+    for pair in pairs:
+        if isinstance(pair, list) and len(pair) == 2 and all(isinstance(x, (int, float)) for x in pair) and 0 <= pair[0] < size:
+            scores[int(pair[0])] = float(pair[1])
+    return scores
+
+
+def pack_batches(lines: list[str], budget: int = BATCH_TOKEN_BUDGET) -> list[list[int]]:
+    """Greedily pack line positions into batches whose numbered lines fit the token budget."""
+    batches, batch, used = [], [], 0
+    for pos, line in enumerate(lines):
+        tokens = estimate_tokens(f'{len(batch)}. {line}')
+        if batch and used + tokens > budget:
+            batches.append(batch)
+            batch, used = [], 0
+        batch.append(pos)
+        used += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class ModelCascade:
+    """Relevance classifier that escalates uncertain jobs through increasingly capable models."""
+
+    def __init__(self, criteria: str, spec: str | None = None):
+        self.tiers  = parse_tiers(spec or os.environ.get('JSA_FILTER_CASCADE', DEFAULT_CASCADE))
+        self.prompt = criteria.strip() + '\n' + SCORE_INSTRUCTIONS
+        # identifies the configuration in the LLM cache (bands change the outcome too)
+        self.name   = '>'.join(f'{m}[{b[0]}-{b[1]}]' if b else m for m, b in self.tiers)
+
+    async def _score_batch(self, model: str, lines: list[str]) -> list[float] | None:
+        stats          = STATS.setdefault(model, Counter())
+        numbered       = '\n'.join(f'{i}. {line}' for i, line in enumerate(lines))
+        system_message = SystemMessage(content=self.prompt)
+        human_message  = HumanMessage(content=numbered)
+
+        start = time.perf_counter()
+        # output is a short list of (number, probability) pairs
+        result = await _governor(model).run(lambda: _client(model).ainvoke([system_message, human_message]),
+                                            estimate_tokens(self.prompt, numbered) + 2 * len(lines))
+        usage  = getattr(result, 'usage_metadata', None) or {}
+        stats['calls']         += 1
+        stats['seconds']       += time.perf_counter() - start
+        stats['input_tokens']  += usage.get('input_tokens', 0)
+        stats['output_tokens'] += usage.get('output_tokens', 0)
+        return _parse_scores(result.content, len(lines))
+
+    async def score(self, model: str, lines: list[str]) -> list[float | None]:
+        """Probability per line from one model (None where its batch failed)."""
+        in_flight = asyncio.Semaphore(TIER_CONCURRENCY)
+
+        async def _run(batch):
+            async with in_flight:
+                try:
+                    return batch, await self._score_batch(model, [lines[pos] for pos in batch])
+                except Exception as e:
+                    print(f'   Error in {model} filter call: {e}')
+                    return batch, None
+
+        scores = [None] * len(lines)
+        for batch, batch_scores in await asyncio.gather(*(_run(b) for b in pack_batches(lines))):
+            for pos, s in zip(batch, batch_scores or []):
+                scores[pos] = s
+        return scores
+
+    async def decide(self, lines: list[str]) -> list[bool | None]:
+        """Relevance verdict per line; None where every tier that saw it failed."""
+        verdicts = [None] * len(lines)
+        pending  = list(range(len(lines)))
+        for k, (model, band) in enumerate(self.tiers):
+            if not pending:
+                break
+            stats    = STATS.setdefault(model, Counter())
+            scores   = await self.score(model, [lines[i] for i in pending])
+            escalate = []
+            for i, p in zip(pending, scores):
+                if p is None:
+                    stats['failed'] += 1
+                    escalate.append(i)
+                elif band is None:
+                    verdicts[i] = p >= 0.5
+                elif p >= band[1]:
+                    verdicts[i] = True
+                elif p <= band[0]:
+                    verdicts[i] = False
+                else:
+                    escalate.append(i)
+            stats['jobs'] += len(pending)
+            if k < len(self.tiers) - 1:
+                stats['escalated'] += len(escalate)
+            pending = escalate
+        return verdicts
+
+
+def report() -> str:
+    """One line per model tier with this run's calls, latency, tokens and escalation rate."""
+    if not STATS:
+        return '   Model cascade: not used'
+    lines = []
+    for model, s in STATS.items():
+        rate = 100 * s['escalated'] / s['jobs'] if s['jobs'] else 0
+        latency = s['seconds'] / s['calls'] if s['calls'] else 0
+        lines.append(f"   Cascade [{model}]: {s['jobs']} jobs in {s['calls']} calls ({latency:.1f}s/call), "
+                     f"{s['escalated']} escalated ({rate:.0f}%), {s['failed']} failed, "
+                     f"{s['input_tokens']} in / {s['output_tokens']} out tokens")
+    return '\n'.join(lines)
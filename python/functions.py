@@ -1,54 +1,80 @@
 import os
 import pandas as pd
-import json
 from datetime import datetime
 import smtplib
 from email.message import EmailMessage
 
-def update_joblist(messages,company_name) -> None:
+from python.jobstore import get_job_store
+from python.neardup import NearDupIndex
+from python.records import JobRecord, records_from_json
+
+def store_jobs(company_name: str, jobs: list[JobRecord], buffer=None) -> int:
+    """
+    Store a company's relevant jobs with today's date
+    New jobs are inserted in one transaction, known jobs keep their first-seen date
+    :param buffer: optional RunBuffer collecting the whole run's jobs for a single commit
+    :return: number of new jobs (number of buffered jobs with a buffer)
+    """
+
+    todate = datetime.today().strftime('%Y-%m-%d')
+
+    if buffer is not None:
+        return buffer.add(company_name, jobs, todate)
+
+    new_jobs = get_job_store().upsert(company_name, jobs, todate)
+    print(f'done daily update! ({new_jobs} new jobs)')
+    return new_jobs
+
+def update_joblist(messages,company_name,buffer=None) -> int:
     """
-    Tries to update the joblist list csv based on AWF results
+    Tries to update the job store based on AWF results (the {"jobs": [...]} JSON of the last message)
     :param state messages:
-    :return: None
+    :param buffer: optional RunBuffer collecting the whole run's jobs for a single commit
+    :return: number of new jobs (number of buffered jobs with a buffer)
     """
 
-    todate     = datetime.today().strftime('%Y-%m-%d')
-    jobs_json  = None
-    df         = pd.read_csv('./output/updated_joblist.csv')
-    df['date'] = pd.to_datetime(df['date'],format='%Y-%m-%d')
-    
-    try:
-        jobs_json = json.loads(messages["messages"][-1].content)['jobs']
-    except:
+    jobs = records_from_json(messages["messages"][-1].content, company_name)
+    if jobs is None:
         print('>> could not find any relevant jobs or some issue with the query...')
-    
-    if jobs_json != None:
-        df_tmp = pd.DataFrame(jobs_json).assign(date = todate, company=company_name.lower())
-        df_tmp['date'] = pd.to_datetime(df_tmp['date'],format='%Y-%m-%d')
-        
-        if 11<3:
-            df_tmp.to_csv('./output/updated_joblist.csv',sep=',',index=False)
-        
-        # make sure the columns name match before adding
-        if all([x in list(df_tmp.columns) for x in ['name','url','date'] ]):
-            df = pd.concat([df,df_tmp],axis=0).drop_duplicates().reset_index(drop=True)
+        return 0
 
-        # keep oldest job if there is a duplicate:
-        df = df.sort_values('date',ascending=True).groupby(['name','url','company']).first().reset_index()
+    return store_jobs(company_name, jobs, buffer)
 
-        # update and save daily backup
-        df.to_csv('./output/updated_joblist.csv',sep=',',index=False)
-        df.to_csv(f'./output/bak/{todate}_joblist.csv',sep=',',index=False)
-        print('done daily update!')
-    
+def export_joblist() -> pd.DataFrame:
+    """
+    Export the job store as ./output/updated_joblist.csv, once per run
+    (backups are the append-only deltas under ./output/bak, see python/backup.py)
+    :return: DataFrame with all jobs (name, url, company, date)
+    """
+
+    df     = get_job_store().to_dataframe()
+    df['date'] = df['date'].dt.strftime('%Y-%m-%d')
+    df.to_csv('./output/updated_joblist.csv',sep=',',index=False)
     return df
 
+def group_near_duplicates(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Group near-duplicate postings (see python/neardup.py): every row is kept, each posting
+    follows the first posting of its cluster and is flagged in a 'duplicate' column
+    :param df: DataFrame with columns 'name', 'url', 'company', ...
+    :return: the rows ordered by cluster, clusters in the order of their first posting
+    """
+    index = NearDupIndex()
+    added = [index.add(name, company, url) for name, company, url in zip(df['name'], df['company'], df['url'])]
+    first = {}
+    order = [first.setdefault(rep, pos) for pos, (rep, _) in enumerate(added)]
+    df    = df.assign(duplicate=[not new for _, new in added], _cluster=order)
+    if df['duplicate'].any():
+        print(f'>> {int(df["duplicate"].sum())} near-duplicate postings grouped in the email')
+    return df.sort_values('_cluster', kind='stable').drop(columns='_cluster')
+
 def df_to_gmail_html(df):
     """
     Convert a job listings DataFrame to a nicely formatted HTML table for Gmail.
     
     Args:
-        df: DataFrame with columns 'name', 'url', 'company', 'date'
+        df: DataFrame with columns 'name', 'url', 'company', 'date' (rows flagged in an optional
+            'duplicate' column are shown indented under the posting above, see group_near_duplicates)
     
     Returns:
         str: HTML table string ready to paste into Gmail
@@ -64,10 +90,15 @@ def df_to_gmail_html(df):
   </thead>
   <tbody>
 """
-    for i, (_, row) in enumerate(df.iterrows()):
+    i = -1
+    for _, row in df.iterrows():
+        duplicate = bool(row.get('duplicate', False))
+        i += not duplicate  # a cluster shares the background of its first posting
         bg_color = '#f2f2f2' if i % 2 == 0 else 'white'
+        indent   = 'padding-left: 30px; ' if duplicate else ''
+        marker   = '<span style="color: #666; font-size: 12px;"> (near-duplicate of the posting above)</span>' if duplicate else ''
         html += f"""    <tr style="background-color: {bg_color};">
-      <td style="border: 1px solid #ddd; padding: 10px;"><a href="{row['url']}" style="color: #1a73e8; text-decoration: none;">{row['name']}</a></td>
+      <td style="border: 1px solid #ddd; padding: 10px; {indent}"><a href="{row['url']}" style="color: #1a73e8; text-decoration: none;">{row['name']}</a>{marker}</td>
       <td style="border: 1px solid #ddd; padding: 10px;">{row['company'].upper()}</td>
       <td style="border: 1px solid #ddd; padding: 10px;">{row['date']}</td>
     </tr>
@@ -0,0 +1,113 @@
+"""
+Relevance filtering of scraped job listings, shared by the simplified pipeline
+(python/run_simplified.py) and the agent graph (joblist_filtering in graph/nodes.py).
+
+Every layer only sees what the previous ones could not decide:
+
+    1. job store      postings seen in an earlier scrape (accepted or rejected) are skipped
+    2. prefilter      clear-cut titles are decided by keyword rules
+    3. LLM cache      titles already decided for this company, prompt and cascade
+    4. local model    titles the relevance model is confident about
+    5. cascade        the rest, once per near-duplicate cluster of the run
+
+Rejections are remembered in the job store. Jobs whose LLM call failed are neither kept
+nor rejected: they are counted as undecided (see report()) and come back next run.
+"""
+
+from python.records import JobRecord
+from python.llm_cache import get_llm_cache
+from python import prefilter
+from python.relevance_model import get_relevance_model
+from python.cascade import ModelCascade
+from python.neardup import get_neardup_index
+from python.jobstore import get_job_store
+
+FILTER_CRITERIA = """You are a strict job filter. Select ONLY jobs that are directly related to:
+- Machine Learning / AI
+- Cheminformatics
+- Computational Assisted Drug Discovery (CADD)
+- Computational Chemistry
+- Data Science
+
+EXCLUDE jobs like: DevOps, statistician, Software Engineering, Tech Lead, general Post-Doc positions, general scientific associate, or any role not directly involving the above fields."""
+
+# cheap model first, uncertain jobs escalated (configured with JSA_FILTER_CASCADE, see python/cascade.py)
+FILTER_CASCADE = ModelCascade(FILTER_CRITERIA)
+
+UNDECIDED = {}  # company -> jobs of this run whose LLM call failed
+
+
+def triage(jobs: list[JobRecord], company: str) -> tuple[list[JobRecord], list[JobRecord]]:
+    """
+    Decide what can be decided without the LLM (layers 1-4 above).
+    Returns (kept new jobs, jobs the LLM still has to decide).
+    """
+    store  = get_job_store()
+    # the scrape is the company's full current listing: update last_seen and close the jobs it dropped
+    listed, closed, reopened = store.track_listing(company, jobs)
+    unseen = store.unseen(company, jobs)
+    stored = len(jobs) - len(unseen)
+    accepted, rejected, ambiguous = prefilter.split_jobs(unseen)
+    verdicts = get_llm_cache().lookup('relevance', [job.name for job in ambiguous], company,
+                                      FILTER_CASCADE.prompt, FILTER_CASCADE.name)
+    kept     = accepted + [job for job in ambiguous if verdicts.get(job.name) == '1']
+    misses   = [job for job in ambiguous if job.name not in verdicts]
+    cached   = len(ambiguous) - len(misses)
+
+    # the local model decides unseen titles it is confident about
+    model_accepted, model_rejected, misses = get_relevance_model().split_jobs(misses)
+    kept    += model_accepted
+    store.mark_rejected(company, rejected + [job for job in ambiguous if verdicts.get(job.name) == '0'] + model_rejected)
+    print(f'   {company.upper()}: {listed} stored jobs still listed, {closed} closed, {reopened} reopened')
+    print(f'   {company.upper()}: {stored} seen in earlier scrapes, {len(accepted) + len(rejected)} decided by rules, {cached} cached verdicts, '
+          f'{len(model_accepted) + len(model_rejected)} decided by the local model, {len(misses)} jobs left for the LLM')
+    return kept, misses
+
+
+async def llm_filter(items: list[tuple[str, JobRecord]]) -> list[bool | None]:
+    """
+    Run (company, job) items through the model cascade. Jobs are sent as numbered lines and the
+    models answer with numbers and probabilities only, so titles and URLs are never re-generated.
+    Near-duplicate postings (see python/neardup.py) are decided once per run and share the verdict.
+    Verdicts are cached per company and rejections remembered; returns one verdict per item,
+    None where the LLM call failed (the job is recorded as undecided).
+    """
+    lines = [f"{job.name} [{company}]" for company, job in items]
+
+    async def _decide(positions: list[int]) -> list[bool | None]:
+        return await FILTER_CASCADE.decide([lines[pos] for pos in positions])
+
+    verdicts   = await get_neardup_index().decide_once([(job.name, company, job.url) for company, job in items], _decide)
+    by_company = {}
+    for (company, job), verdict in zip(items, verdicts):
+        if verdict is None:
+            UNDECIDED.setdefault(company, []).append(job)
+        else:
+            by_company.setdefault(company, {})[job.name] = '1' if verdict else '0'
+    for company, decisions in by_company.items():
+        get_llm_cache().store('relevance', decisions, company, FILTER_CASCADE.prompt, FILTER_CASCADE.name)
+        get_job_store().mark_rejected(company, [job for (c, job), verdict in zip(items, verdicts)
+                                                if c == company and verdict is False])
+    failed = verdicts.count(None)
+    if failed:
+        print(f'   {failed} jobs could not be filtered by the LLM: undecided, filtered again next run')
+    return verdicts
+
+
+async def filter_jobs(jobs: list[JobRecord], company: str = '') -> list[JobRecord]:
+    """Filter a company's job records to only relevant roles; only what triage cannot decide goes to the LLM."""
+    kept, misses = triage(jobs, company)
+    if misses:
+        # keep the scraped entries (no mangled URLs)
+        verdicts = await llm_filter([(company, job) for job in misses])
+        kept    += [job for job, verdict in zip(misses, verdicts) if verdict]
+    return kept
+
+
+def report() -> str:
+    """Jobs of this run left undecided because their LLM call failed, per company."""
+    total = sum(len(jobs) for jobs in UNDECIDED.values())
+    if not total:
+        return '   Undecided jobs: none'
+    per_company = ', '.join(f'{company} {len(jobs)}' for company, jobs in sorted(UNDECIDED.items()))
+    return f'   Undecided jobs: {total} (LLM call failed, not stored or rejected, filtered again next run): {per_company}'
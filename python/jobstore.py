@@ -0,0 +1,446 @@
+"""
+SQLite job store replacing the whole-CSV rewrite of update_joblist.
+
+Jobs are unique on their fingerprint, a hash of (company, canonical URL) (see
+python/canonical.py), so "seen before?" is a single index lookup; inserting a job that is already known
+keeps its first-seen date, so each write only touches the new rows. Every write is
+one transaction on a WAL-journaled database, so concurrent writers (threads or
+processes) are safe. New rows are also appended to the Parquet delta backups (see
+python/backup.py). ./output/updated_joblist.csv is imported on first use and can
+still be exported as a read-only view with export_csv(). Titles are full-text indexed
+(FTS5) and dates and companies are indexed for python/query.py. The `date` column is the
+first-seen date; track_listing() maintains last_seen and moves jobs missing from two
+consecutive listings to jobs_closed (with closed_on), so the hot table only holds open
+jobs. The `seen` table keeps the filter verdict of every posting ever decided, so each
+scrape only sends the postings never seen before to the filters (see unseen()).
+"""
+import os
+import json
+import sqlite3
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+from python.backup import read_as_of, write_delta
+from python.canonical import canonical_url, fingerprint
+from python.records import to_records
+
+STORE_PATH   = './output/jobs.sqlite'
+CSV_PATH     = './output/updated_joblist.csv'
+JOURNAL_PATH = './output/run_journal.jsonl'  # jobs of the current run not yet committed
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id            INTEGER PRIMARY KEY,
+    company       TEXT NOT NULL,
+    name          TEXT NOT NULL,
+    url           TEXT NOT NULL,
+    canonical_url TEXT NOT NULL,
+    fingerprint   TEXT,           -- hash of (company, canonical_url)
+    date          TEXT NOT NULL,  -- first seen, YYYY-MM-DD
+    last_seen     TEXT            -- last scrape listing the job
+);
+-- jobs no longer listed by their company, moved out of the hot table
+CREATE TABLE IF NOT EXISTS jobs_closed (
+    id            INTEGER PRIMARY KEY,
+    company       TEXT NOT NULL,
+    name          TEXT NOT NULL,
+    url           TEXT NOT NULL,
+    canonical_url TEXT NOT NULL,
+    fingerprint   TEXT NOT NULL,
+    date          TEXT NOT NULL,
+    last_seen     TEXT,
+    closed_on     TEXT NOT NULL   -- first scrape not listing the job
+);
+-- dates of the non-empty listings scraped per company (consecutive misses of track_listing)
+CREATE TABLE IF NOT EXISTS listings (
+    company       TEXT NOT NULL,
+    date          TEXT NOT NULL,
+    PRIMARY KEY (company, date)
+);
+"""
+# every posting the filters have decided on, accepted (also in jobs) or rejected
+_SEEN_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen (
+    fingerprint   TEXT PRIMARY KEY,
+    company       TEXT NOT NULL,
+    verdict       INTEGER NOT NULL,  -- 1 accepted, 0 rejected
+    first_seen    TEXT NOT NULL,
+    last_seen     TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+_INDEXES = """
+CREATE UNIQUE INDEX IF NOT EXISTS jobs_company_url ON jobs (company, canonical_url);
+CREATE UNIQUE INDEX IF NOT EXISTS jobs_fingerprint ON jobs (fingerprint);
+CREATE INDEX IF NOT EXISTS jobs_date ON jobs (date);
+CREATE INDEX IF NOT EXISTS jobs_company_date ON jobs (company, date);
+CREATE UNIQUE INDEX IF NOT EXISTS jobs_closed_fingerprint ON jobs_closed (fingerprint);
+CREATE INDEX IF NOT EXISTS jobs_closed_date ON jobs_closed (date);
+CREATE INDEX IF NOT EXISTS jobs_closed_company_date ON jobs_closed (company, date);
+"""
+# full-text index on the titles of a table ({t}), kept in sync by triggers
+_FTS = """
+CREATE VIRTUAL TABLE IF NOT EXISTS {t}_fts USING fts5(name, content='{t}', content_rowid='id', tokenize='unicode61 remove_diacritics 2');
+CREATE TRIGGER IF NOT EXISTS {t}_fts_insert AFTER INSERT ON {t} BEGIN
+    INSERT INTO {t}_fts (rowid, name) VALUES (new.id, new.name);
+END;
+CREATE TRIGGER IF NOT EXISTS {t}_fts_delete AFTER DELETE ON {t} BEGIN
+    INSERT INTO {t}_fts ({t}_fts, rowid, name) VALUES ('delete', old.id, old.name);
+END;
+CREATE TRIGGER IF NOT EXISTS {t}_fts_update AFTER UPDATE OF name ON {t} BEGIN
+    INSERT INTO {t}_fts ({t}_fts, rowid, name) VALUES ('delete', old.id, old.name);
+    INSERT INTO {t}_fts (rowid, name) VALUES (new.id, new.name);
+END;
+"""
+_COLUMNS = 'company, name, url, canonical_url, fingerprint, date, last_seen'
+
+CLOSE_AFTER = 2  # consecutive scrapes (days) a job must be missing from its company's listing to be closed
+
+
+def _job_rows(company: str, jobs: list, date: str) -> dict[str, dict]:
+    """Valid jobs (dicts or JobRecords) of a company as store rows keyed by fingerprint (earliest date wins)."""
+    rows = {}
+    for job in jobs:
+        if job.get('name') and job.get('url'):
+            row = {'name': job['name'], 'url': job['url'], 'company': company, 'canonical_url': canonical_url(job['url']),
+                   'fingerprint': fingerprint(company, job['url']), 'date': job.get('date') or date}
+            if row['fingerprint'] not in rows or row['date'] < rows[row['fingerprint']]['date']:
+                rows[row['fingerprint']] = row
+    return rows
+
+
+class JobStore:
+    """Transactional store of the jobs found so far."""
+
+    def __init__(self, path: str = STORE_PATH, csv_path: str = CSV_PATH):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path  = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+        self._add_last_seen()
+        self._conn.executescript(_INDEXES)
+        self._create_fts('jobs')
+        self._create_fts('jobs_closed')
+        self._create_seen()
+        self._conn.commit()
+        if self.count() == 0 and os.path.exists(csv_path):
+            self.import_csv(csv_path)
+
+    def _migrate(self) -> None:
+        """Re-key stores created before fingerprints, merging rows that now collapse (oldest date wins)."""
+        columns = [row[1] for row in self._conn.execute('PRAGMA table_info(jobs)')]
+        if 'fingerprint' in columns:
+            if self._conn.execute('SELECT COUNT(*) FROM jobs WHERE fingerprint IS NULL').fetchone()[0] == 0:
+                return
+        else:
+            self._conn.execute('ALTER TABLE jobs ADD COLUMN fingerprint TEXT')
+        with self._conn:
+            self._conn.execute('DROP INDEX IF EXISTS jobs_company_url')
+            self._conn.execute('DROP INDEX IF EXISTS jobs_fingerprint')
+            seen, duplicates, updates = set(), [], []
+            for id_, company, url in self._conn.execute('SELECT id, company, url FROM jobs ORDER BY date, id').fetchall():
+                fp = fingerprint(company, url)
+                if fp in seen:
+                    duplicates.append((id_,))
+                else:
+                    seen.add(fp)
+                    updates.append((canonical_url(url), fp, id_))
+            self._conn.executemany('DELETE FROM jobs WHERE id=?', duplicates)
+            self._conn.executemany('UPDATE jobs SET canonical_url=?, fingerprint=? WHERE id=?', updates)
+        print(f'>> Re-keyed {len(updates)} stored jobs by fingerprint ({len(duplicates)} duplicates merged)')
+
+    def _add_last_seen(self) -> None:
+        """Add last_seen to stores created before lifecycle tracking (last seen = first seen)."""
+        columns = [row[1] for row in self._conn.execute('PRAGMA table_info(jobs)')]
+        if 'last_seen' not in columns:
+            self._conn.execute('ALTER TABLE jobs ADD COLUMN last_seen TEXT')
+            self._conn.execute('UPDATE jobs SET last_seen=date')
+
+    def _create_fts(self, table: str) -> None:
+        """Create the title full-text index of a table, filling it from the existing rows the first time."""
+        exists = self._conn.execute(f"SELECT 1 FROM sqlite_master WHERE name='{table}_fts'").fetchone()
+        self._conn.executescript(_FTS.format(t=table))
+        if not exists:
+            self._conn.execute(f"INSERT INTO {table}_fts ({table}_fts) VALUES ('rebuild')")
+
+    def _create_seen(self) -> None:
+        """Create the verdict table, marking the jobs stored so far as accepted the first time."""
+        exists = self._conn.execute("SELECT 1 FROM sqlite_master WHERE name='seen'").fetchone()
+        self._conn.executescript(_SEEN_SCHEMA)
+        if not exists:
+            self._conn.execute('INSERT OR IGNORE INTO seen (fingerprint, company, verdict, first_seen, last_seen) '
+                               'SELECT fingerprint, company, 1, date, date FROM jobs')
+
+    def known(self, fingerprints: list[str]) -> set[str]:
+        """The given fingerprints that are already in the store."""
+        found = set()
+        with self._lock:
+            for i in range(0, len(fingerprints), 500):  # stay under SQLite's host-parameter limit
+                chunk = fingerprints[i:i + 500]
+                found.update(r[0] for r in self._conn.execute(
+                    f"SELECT fingerprint FROM jobs WHERE fingerprint IN ({','.join('?' * len(chunk))})", chunk))
+        return found
+
+    def verdicts(self, fingerprints: list[str]) -> dict[str, int]:
+        """Past filter verdict (1 accepted, 0 rejected) of the given fingerprints that were seen before."""
+        found = {}
+        with self._lock:
+            for i in range(0, len(fingerprints), 500):  # stay under SQLite's host-parameter limit
+                chunk = fingerprints[i:i + 500]
+                found.update(self._conn.execute(
+                    f"SELECT fingerprint, verdict FROM seen WHERE fingerprint IN ({','.join('?' * len(chunk))})", chunk))
+        return found
+
+    def unseen(self, company: str, jobs: list[dict], date: str | None = None) -> list[dict]:
+        """
+        Jobs of a company the filters never decided on (checked right after scraping, so only new
+        postings reach the filters). Previously accepted jobs get their last_seen date updated,
+        previously rejected ones are skipped.
+        """
+        date     = date or datetime.today().strftime('%Y-%m-%d')
+        fps      = [fingerprint(company, job.get('url', '')) for job in jobs]
+        verdicts = self.verdicts(fps)
+        accepted = list({fp for fp in fps if verdicts.get(fp) == 1})
+        if accepted:
+            with self._lock, self._conn:
+                self._conn.executemany('UPDATE seen SET last_seen=? WHERE fingerprint=? AND last_seen<?',
+                                       [(date, fp, date) for fp in accepted])
+        return [job for job, fp in zip(jobs, fps) if fp not in verdicts]
+
+    def track_listing(self, company: str, jobs: list[dict], date: str | None = None) -> tuple[int, int, int]:
+        """
+        Lifecycle update from a company's full current listing, as a set difference of fingerprints:
+        open jobs still listed get last_seen = `date`, open jobs no longer listed are moved to
+        jobs_closed once they were missing from CLOSE_AFTER consecutive listings (closed_on = the first
+        of them), and closed jobs listed again are moved back. An empty listing (a broken scrape, or a
+        site down) changes nothing, so a single bad scrape never closes jobs, whatever the company size.
+        :return: (still open, closed, reopened)
+        """
+        company = company.lower()
+        date    = date or datetime.today().strftime('%Y-%m-%d')
+        current = {fingerprint(company, job['url']) for job in jobs if isinstance(job.get('url'), str) and job['url']}
+        if not current:
+            print(f'   {company.upper()}: empty listing, no job closed')
+            return 0, 0, 0
+        with self._lock, self._conn:
+            self._conn.execute('BEGIN IMMEDIATE')
+            self._conn.execute('INSERT OR IGNORE INTO listings (company, date) VALUES (?, ?)', (company, date))
+            open_    = dict(self._conn.execute('SELECT fingerprint, COALESCE(last_seen, date) FROM jobs WHERE company=?',
+                                               (company,)).fetchall())
+            closed   = {r[0] for r in self._conn.execute('SELECT fingerprint FROM jobs_closed WHERE company=?', (company,))}
+            listed   = open_.keys() & current
+            reopened = closed & current
+            missing  = {fp: last_seen for fp, last_seen in open_.items() if fp not in current}
+            scrapes  = [r[0] for r in self._conn.execute('SELECT date FROM listings WHERE company=? AND date>? AND date<=? '
+                                                         'ORDER BY date', (company, min(missing.values(), default=date), date))]
+            gone     = {}  # fingerprint -> closed_on
+            for fp, last_seen in missing.items():
+                misses = [d for d in scrapes if d > last_seen]
+                if len(misses) >= CLOSE_AFTER:
+                    gone[fp] = misses[0]
+            self._conn.executemany('UPDATE jobs SET last_seen=? WHERE fingerprint=?', [(date, fp) for fp in listed])
+            self._conn.executemany(f'INSERT INTO jobs_closed ({_COLUMNS}, closed_on) '
+                                   f'SELECT {_COLUMNS}, ? FROM jobs WHERE fingerprint=?', [(d, fp) for fp, d in gone.items()])
+            self._conn.executemany('DELETE FROM jobs WHERE fingerprint=?', [(fp,) for fp in gone])
+            self._conn.executemany(f'INSERT INTO jobs ({_COLUMNS}) SELECT {_COLUMNS.replace("last_seen", "?")} '
+                                   f'FROM jobs_closed WHERE fingerprint=?', [(date, fp) for fp in reopened])
+            self._conn.executemany('DELETE FROM jobs_closed WHERE fingerprint=?', [(fp,) for fp in reopened])
+        return len(listed), len(gone), len(reopened)
+
+    def mark_rejected(self, company: str, jobs: list[dict], date: str | None = None) -> None:
+        """Remember jobs the filters rejected, so later scrapes skip them before filtering."""
+        date = date or datetime.today().strftime('%Y-%m-%d')
+        rows = [(fingerprint(company, job['url']), company.lower(), date, date)
+                for job in jobs if isinstance(job.get('url'), str) and job['url']]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                'INSERT INTO seen (fingerprint, company, verdict, first_seen, last_seen) VALUES (?, ?, 0, ?, ?) '
+                'ON CONFLICT (fingerprint) DO UPDATE SET last_seen=max(last_seen, excluded.last_seen)', rows)
+
+    def count(self) -> int:
+        """Number of jobs ever stored, open or closed."""
+        with self._lock:
+            return self._conn.execute('SELECT (SELECT COUNT(*) FROM jobs) + (SELECT COUNT(*) FROM jobs_closed)').fetchone()[0]
+
+    def upsert(self, company: str, jobs: list[dict], date: str | None = None) -> int:
+        """
+        Insert jobs of a company in one transaction; known jobs keep their first-seen date.
+        :return: number of new jobs
+        """
+        return self.upsert_many([(company, jobs, date)])[company.lower()]
+
+    def upsert_many(self, batches: list[tuple[str, list[dict], str | None]], backup: bool = True) -> dict[str, int]:
+        """
+        Insert several (company, jobs, date) batches in a single transaction; known jobs keep
+        their first-seen date. The inserted (or back-dated) rows are appended to the delta backups
+        (unless `backup` is False, e.g. when restoring from them).
+        :return: number of new jobs per company
+        """
+        new_jobs, changed = {}, []
+        with self._lock, self._conn:
+            # take the write lock up front so the lookups and the inserts see the same state
+            self._conn.execute('BEGIN IMMEDIATE')
+            for company, jobs, date in batches:
+                company = company.lower()
+                scraped = _job_rows(company, jobs, date or datetime.today().strftime('%Y-%m-%d'))
+                known   = {}
+                closed  = set()
+                keys    = list(scraped)
+                for i in range(0, len(keys), 500):  # stay under SQLite's host-parameter limit
+                    chunk = keys[i:i + 500]
+                    marks = ','.join('?' * len(chunk))
+                    known.update(self._conn.execute(
+                        f"SELECT fingerprint, date FROM jobs WHERE fingerprint IN ({marks})", chunk).fetchall())
+                    closed.update(r[0] for r in self._conn.execute(
+                        f"SELECT fingerprint FROM jobs_closed WHERE fingerprint IN ({marks})", chunk))
+                # an older sighting wins, e.g. when importing history out of order; closed jobs stay archived
+                rows = [row for key, row in scraped.items()
+                        if key not in closed and (key not in known or row['date'] < known[key])]
+                self._conn.executemany(
+                    'INSERT INTO jobs (company, name, url, canonical_url, fingerprint, date, last_seen) '
+                    'VALUES (:company, :name, :url, :canonical_url, :fingerprint, :date, :date) '
+                    'ON CONFLICT (fingerprint) DO UPDATE SET date=excluded.date, name=excluded.name, url=excluded.url',
+                    rows)
+                new_jobs[company] = new_jobs.get(company, 0) + sum(row['fingerprint'] not in known for row in rows)
+                # stored jobs count as accepted, whatever an earlier run decided
+                self._conn.executemany(
+                    'INSERT INTO seen (fingerprint, company, verdict, first_seen, last_seen) '
+                    'VALUES (:fingerprint, :company, 1, :date, :date) '
+                    'ON CONFLICT (fingerprint) DO UPDATE SET verdict=1, first_seen=min(first_seen, excluded.first_seen), '
+                    'last_seen=max(last_seen, excluded.last_seen)',
+                    list(scraped.values()))
+                changed += rows
+
+        if backup:
+            write_delta(changed)
+        return new_jobs
+
+    def import_csv(self, csv_path: str = CSV_PATH) -> int:
+        """Load an existing updated_joblist.csv (name, url, company, date) into the store."""
+        df = pd.read_csv(csv_path).dropna(subset=['name', 'url', 'company'])
+        df['date'] = pd.to_datetime(df['date']).dt.strftime('%Y-%m-%d')
+        added = 0
+        for company, group in df.groupby('company'):
+            added += self.upsert(company, group[['name', 'url', 'date']].to_dict('records'))
+        print(f'>> Imported {added} jobs from {csv_path} into {self.path}')
+        return added
+
+    def import_backups(self, as_of: str | None = None) -> int:
+        """Load the job history kept in the Parquet delta backups (up to `as_of`) into the store."""
+        df = read_as_of(as_of or datetime.today().strftime('%Y-%m-%d'))
+        batches = [(company, group[['name', 'url', 'date']].to_dict('records'), None)
+                   for company, group in df.groupby('company')]
+        added = sum(self.upsert_many(batches, backup=False).values()) if batches else 0
+        print(f'>> Imported {added} jobs from the delta backups into {self.path}')
+        return added
+
+    def query(self, sql: str, params: list | tuple = ()) -> pd.DataFrame:
+        """Run a read-only SQL query on the store."""
+        with self._lock:
+            return pd.read_sql_query(sql, self._conn, params=params)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """All jobs, open and closed, with the historical CSV columns (name, url, company, date) plus last_seen and closed_on."""
+        with self._lock:
+            df = pd.read_sql_query('SELECT name, url, company, date, last_seen, NULL AS closed_on FROM jobs UNION ALL '
+                                   'SELECT name, url, company, date, last_seen, closed_on FROM jobs_closed '
+                                   'ORDER BY date, company, name', self._conn)
+        df['date'] = pd.to_datetime(df['date'], format='%Y-%m-%d')
+        return df
+
+    def export_csv(self, csv_path: str = CSV_PATH) -> None:
+        """Write the store out as the historical updated_joblist.csv view."""
+        self.to_dataframe().to_csv(csv_path, sep=',', index=False, date_format='%Y-%m-%d')
+
+
+class RunBuffer:
+    """
+    Run-scoped write buffer for the job store.
+
+    Jobs of every company are appended (and fsync'ed) to a JSONL journal as they arrive
+    and committed to the store in one transaction when the run ends, or every
+    `checkpoint_every` companies. Leaving the `with` block commits even when the run
+    failed, and a journal left behind by a killed run is replayed on the next start,
+    so a crash in a later company never loses the companies already done.
+    """
+
+    def __init__(self, store: 'JobStore | None' = None, journal_path: str = JOURNAL_PATH,
+                 checkpoint_every: int | None = None):
+        self.store            = store or get_job_store()
+        self.journal_path     = journal_path
+        self.checkpoint_every = checkpoint_every
+        self.new_jobs         = {}  # company -> new jobs committed during the run
+        self._pending         = []  # (company, jobs, date) not committed yet
+        self._lock            = threading.Lock()
+        self._journal         = None
+
+    def __enter__(self) -> 'RunBuffer':
+        self.replay()
+        self._journal = open(self.journal_path, 'a', encoding='utf-8')
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.commit()
+        self._journal.close()
+        self._journal = None
+
+    def replay(self) -> None:
+        """Commit the records of a journal left behind by an interrupted run."""
+        if not os.path.exists(self.journal_path):
+            return
+        batches = []
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn last line of a killed run
+                batches.append((record['company'], record['jobs'], record['date']))
+        if batches:
+            new_jobs = self.store.upsert_many(batches)
+            print(f'>> Replayed {len(batches)} journaled company results ({sum(new_jobs.values())} new jobs)')
+        os.remove(self.journal_path)
+
+    def add(self, company: str, jobs: list, date: str | None = None) -> int:
+        """Journal a company's validated jobs (JobRecords or dicts); returns how many were accepted."""
+        date = date or datetime.today().strftime('%Y-%m-%d')
+        jobs = to_records(jobs, company)
+        with self._lock:
+            self._journal.write(json.dumps({'company': company, 'date': date, 'jobs': [job.as_dict() for job in jobs]}) + '\n')
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+            self._pending.append((company, jobs, date))
+            checkpoint = self.checkpoint_every and len(self._pending) >= self.checkpoint_every
+        if checkpoint:
+            self.commit()
+        return len(jobs)
+
+    def commit(self) -> None:
+        """Write the pending jobs to the store in one transaction and clear the journal."""
+        with self._lock:
+            if not self._pending:
+                return
+            new_jobs = self.store.upsert_many(self._pending)
+            for company, count in new_jobs.items():
+                self.new_jobs[company] = self.new_jobs.get(company, 0) + count
+            print(f'>> Committed {len(self._pending)} company results to the job store ({sum(new_jobs.values())} new jobs)')
+            self._pending = []
+            self._journal.truncate(0)
+            os.fsync(self._journal.fileno())
+
+
+_store = None
+
+
+def get_job_store() -> JobStore:
+    """Process-wide JobStore instance (opened on first use)."""
+    global _store
+    if _store is None:
+        _store = JobStore()
+    return _store
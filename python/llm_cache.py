@@ -0,0 +1,125 @@
+"""
+Persistent cache of LLM decisions (relevance verdicts and title translations).
+
+Entries are keyed by (kind, normalized title, company, prompt hash, model name),
+so changing a prompt or switching model naturally invalidates old answers.
+Only cache misses need to go to the model.
+"""
+import os
+import re
+import hashlib
+import sqlite3
+import threading
+import unicodedata
+from collections import Counter
+from datetime import datetime
+
+CACHE_PATH = './output/llm_cache.sqlite'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS decisions (
+    kind    TEXT NOT NULL,  -- 'relevance' ('1'/'0') or 'translation' (English title)
+    title   TEXT NOT NULL,  -- normalized title
+    company TEXT NOT NULL,
+    prompt  TEXT NOT NULL,  -- prompt hash
+    model   TEXT NOT NULL,
+    value   TEXT NOT NULL,
+    created TEXT NOT NULL,
+    PRIMARY KEY (kind, title, company, prompt, model)
+)
+"""
+
+
+def normalize_title(title: str) -> str:
+    """Normalize a job title for cache lookups (unicode, case, whitespace, edge punctuation)."""
+    title = unicodedata.normalize('NFKC', title or '').lower()
+    title = re.sub(r'\s+', ' ', title)
+    return title.strip(' -–—|,;:.()[]')
+
+
+def prompt_hash(prompt: str) -> str:
+    """Short stable hash identifying a prompt version."""
+    return hashlib.sha1(prompt.encode('utf-8')).hexdigest()[:16]
+
+
+class LLMCache:
+    """SQLite-backed store of LLM decisions with per-run hit/miss counters."""
+
+    def __init__(self, path: str = CACHE_PATH):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path   = path
+        self.hits   = Counter()
+        self.misses = Counter()
+        self._lock  = threading.Lock()
+        self._conn  = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def lookup(self, kind: str, titles: list[str], company: str, prompt: str, model: str) -> dict[str, str]:
+        """Return {title: cached value} for the titles already decided; counts hits and misses."""
+        p_hash = prompt_hash(prompt)
+        keys   = {t: normalize_title(t) for t in titles}
+        found  = {}
+        with self._lock:
+            unique = list(set(keys.values()))
+            for i in range(0, len(unique), 500):  # stay under SQLite's host-parameter limit
+                chunk = unique[i:i + 500]
+                rows = self._conn.execute(
+                    f"SELECT title, value FROM decisions WHERE kind=? AND company=? AND prompt=? AND model=? "
+                    f"AND title IN ({','.join('?' * len(chunk))})",
+                    [kind, company.lower(), p_hash, model, *chunk]).fetchall()
+                found.update(rows)
+        hits = {t: found[k] for t, k in keys.items() if k in found}
+        self.hits[kind]   += len(hits)
+        self.misses[kind] += len(titles) - len(hits)
+        return hits
+
+    def store(self, kind: str, decisions: dict[str, str], company: str, prompt: str, model: str) -> None:
+        """Save {title: value} decisions returned by the model."""
+        if not decisions:
+            return
+        p_hash = prompt_hash(prompt)
+        now    = datetime.now().isoformat(timespec='seconds')
+        with self._lock:
+            # explicit rowids above every existing one (replaced entries included), so rowid order is
+            # storage order and readers can resume from the last rowid they saw (see decisions())
+            self._conn.execute('BEGIN IMMEDIATE')
+            first = self._conn.execute('SELECT COALESCE(MAX(rowid), 0) + 1 FROM decisions').fetchone()[0]
+            rows  = [(first + i, kind, normalize_title(t), company.lower(), p_hash, model, str(v), now)
+                     for i, (t, v) in enumerate(decisions.items())]
+            self._conn.executemany('INSERT OR REPLACE INTO decisions (rowid, kind, title, company, prompt, model, value, created) '
+                                   'VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+            self._conn.commit()
+
+    def decisions(self, kind: str, prompt: str | None = None, after: int = 0) -> list[tuple[str, str, str, int]]:
+        """
+        Stored (title, company, value, rowid) of a kind, optionally only those of one prompt and
+        those stored after the row `after` (rowids grow with every store, replaced entries included).
+        """
+        sql, params = 'SELECT title, company, value, rowid FROM decisions WHERE kind=? AND rowid>?', [kind, after]
+        if prompt is not None:
+            sql += ' AND prompt=?'
+            params.append(prompt_hash(prompt))
+        with self._lock:
+            return self._conn.execute(sql + ' ORDER BY rowid', params).fetchall()
+
+    def report(self) -> str:
+        """One line per decision kind with this run's hit/miss counts."""
+        lines = []
+        for kind in sorted(set(self.hits) | set(self.misses)):
+            total = self.hits[kind] + self.misses[kind]
+            rate  = 100 * self.hits[kind] / total if total else 0
+            lines.append(f'   LLM cache [{kind}]: {self.hits[kind]} hits / {self.misses[kind]} misses ({rate:.0f}% hit rate)')
+        return '\n'.join(lines) or '   LLM cache: not used'
+
+
+_cache = None
+
+
+def get_llm_cache() -> LLMCache:
+    """Process-wide LLMCache instance (opened on first use)."""
+    global _cache
+    if _cache is None:
+        _cache = LLMCache()
+    return _cache
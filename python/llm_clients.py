@@ -0,0 +1,120 @@
+"""
+Process-wide LLM clients.
+
+Every chat model (per model, temperature, tools and retry setting) and the raw OpenAI
+client are created once and reused by the graph nodes, the filters and the scripts.
+The OpenAI clients share one keep-alive HTTP connection pool, so consecutive calls
+skip the TLS handshake and client setup; the Anthropic clients keep their own pool
+per model instance, which is reused the same way.
+
+Pooled async connections belong to the event loop that opened them, and a process
+runs several loops (asyncio.run in the scripts, in scrape_BNF, in notebook cells). So
+the async pool, the chat models created inside a loop and the other loop-bound
+objects (loop_state(), e.g. the cascade's rate governors) are kept per running loop,
+and aclose() releases them before the loop ends; run() is asyncio.run doing that.
+
+    from python.llm_clients import chat, openai_client
+    model = chat('gpt-4o-mini')                     # ChatOpenAI / ChatAnthropic by model name
+    model = chat('gpt-5', tools=job_tools)          # bound to the tools, also created once
+    llm_clients.run(main())                         # asyncio.run(main()), then close the loop's clients
+"""
+import asyncio
+import weakref
+
+import httpx
+
+CONNECT_TIMEOUT = 10.0   # seconds to open a connection
+READ_TIMEOUT    = 120.0  # seconds to wait for a (long) completion
+POOL_SIZE       = 20     # connections kept open per process (shared by all OpenAI models)
+KEEPALIVE       = 60.0   # seconds an idle connection stays in the pool
+
+TIMEOUT = httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT)
+LIMITS  = httpx.Limits(max_connections=POOL_SIZE, max_keepalive_connections=POOL_SIZE, keepalive_expiry=KEEPALIVE)
+
+_http       = None
+_openai     = None
+_CHATS      = {}  # (model, temperature, tool names, max_retries) -> chat model used outside event loops
+_LOOP_STATE = weakref.WeakKeyDictionary()  # event loop -> {'http': pool, 'chats': {key -> chat model}, ...}
+
+
+def _running_loop():
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def loop_state() -> dict:
+    """Objects bound to the running event loop (async pool, chat models, ...), released by aclose()."""
+    return _LOOP_STATE.setdefault(asyncio.get_running_loop(), {})
+
+
+def http_client() -> httpx.Client:
+    """Shared keep-alive pool of the synchronous OpenAI calls."""
+    global _http
+    if _http is None:
+        _http = httpx.Client(timeout=TIMEOUT, limits=LIMITS)
+    return _http
+
+
+def http_async_client() -> httpx.AsyncClient:
+    """Keep-alive pool of the asynchronous OpenAI calls of the running event loop."""
+    state = loop_state()
+    if 'http' not in state:
+        state['http'] = httpx.AsyncClient(timeout=TIMEOUT, limits=LIMITS)
+    return state['http']
+
+
+async def aclose() -> None:
+    """Close the running loop's async pool and forget its chat models (await before the loop ends)."""
+    state = _LOOP_STATE.pop(asyncio.get_running_loop(), {})
+    if 'http' in state:
+        await state['http'].aclose()
+
+
+def run(coro):
+    """asyncio.run(coro), closing the loop's LLM clients before the loop ends."""
+    async def _main():
+        try:
+            return await coro
+        finally:
+            await aclose()
+    return asyncio.run(_main())
+
+
+def openai_client():
+    """The raw OpenAI SDK client (for direct chat.completions calls) on the shared pool."""
+    global _openai
+    if _openai is None:
+        from openai import OpenAI
+        _openai = OpenAI(timeout=TIMEOUT, http_client=http_client())
+    return _openai
+
+
+def _create(model: str, temperature: float, max_retries: int, in_loop: bool):
+    if model.startswith('claude'):
+        from langchain_anthropic import ChatAnthropic
+        return ChatAnthropic(model=model, temperature=temperature, max_retries=max_retries,
+                             default_request_timeout=READ_TIMEOUT)
+    from langchain_openai import ChatOpenAI
+    # outside a loop the model is for sync calls: its own async client is only opened if it is awaited
+    pools = {'http_async_client': http_async_client()} if in_loop else {}
+    return ChatOpenAI(model=model, temperature=temperature, max_retries=max_retries, timeout=TIMEOUT,
+                      http_client=http_client(), **pools)
+
+
+def chat(model: str, temperature: float = 0, tools: list | None = None, max_retries: int = 2):
+    """
+    Chat model for `model` ('claude-*' models go to Anthropic, the others to OpenAI),
+    optionally bound to `tools`. Created on first use, then shared by every caller of the
+    same event loop (or by the callers outside any loop).
+    """
+    loop  = _running_loop()
+    chats = _CHATS if loop is None else loop_state().setdefault('chats', {})
+    key   = (model, temperature, tuple(t.name for t in tools or []), max_retries)
+    if key not in chats:
+        if tools:
+            chats[key] = chat(model, temperature, None, max_retries).bind_tools(tools)
+        else:
+            chats[key] = _create(model, temperature, max_retries, loop is not None)
+    return chats[key]
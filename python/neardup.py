@@ -0,0 +1,222 @@
+"""
+Near-duplicate job postings with MinHash / LSH.
+
+The same role often comes back several times in one run: on the company site and on
+its Workday board, on an aggregator (BIOTECHJOBS) and on the employer's site, or
+re-posted with a slightly edited title. Titles are reduced to word and word-bigram
+shingles (gender tags and workload percentages dropped), summarized by a MinHash
+signature and bucketed by LSH bands, so finding the cluster of a new job only looks
+at the few postings sharing a band instead of every job seen so far.
+
+Two postings are near-duplicates when they come from the same company (or one of them
+comes from an aggregator source, which lists other employers' jobs) and either carry
+the same requisition ID in their URL, or have near-identical titles: Jaccard
+similarity of at least THRESHOLD and the same seniority / level tokens, so
+"Senior Data Scientist", "Data Scientist II" and "Data Scientist Intern" stay apart.
+The first posting of a cluster is its representative: only it goes to the LLM filter
+(decide_once); the email lists every posting, grouped under its representative (see
+group_near_duplicates in python/functions.py).
+"""
+import re
+import asyncio
+import zlib
+from collections import Counter
+
+import numpy as np
+
+from python.llm_cache import normalize_title
+
+NUM_PERM  = 60      # MinHash permutations = BANDS * ROWS
+BANDS     = 10
+ROWS      = 6       # candidate probability ~0.99 at Jaccard 0.85, ~0.15 at 0.5
+THRESHOLD = 0.85    # Jaccard similarity of two near-duplicate titles
+SEED      = 1
+
+AGGREGATOR_SOURCES = {'biotechjobs'}  # sources listing jobs of other employers
+
+# seniority / level words that must agree between near-duplicate titles
+LEVEL_TOKENS = {'intern', 'internship', 'trainee', 'apprentice', 'student', 'graduate', 'junior', 'associate',
+                'senior', 'staff', 'principal', 'lead', 'head', 'chief', 'director', 'manager', 'expert',
+                'fellow', 'postdoc', 'postdoctoral', 'phd', 'vp', 'i', 'ii', 'iii', 'iv', '1', '2', '3', '4'}
+LEVEL_ALIASES = {'sr': 'senior', 'jr': 'junior', 'praktikum': 'internship', 'praktikant': 'intern'}
+
+_PRIME = (1 << 31) - 1
+_rng   = np.random.default_rng(SEED)
+_A     = _rng.integers(1, _PRIME, NUM_PERM, dtype=np.int64)
+_B     = _rng.integers(0, _PRIME, NUM_PERM, dtype=np.int64)
+
+# "(m/f/d)", "w/m/d", "80-100%", "100 %"
+_NOISE_RE = re.compile(r'\(?\b[mwfdx]\s*/\s*[mwfdx](?:\s*/\s*[mwfdx])?\b\)?|\d+\s*(?:-\s*\d+\s*)?%')
+
+# requisition IDs: Workday "..._R-12345" / "..._202409-1234", "?gh_jid=123", ".../job/123456"
+_ID_RES = [re.compile(r'_((?:[a-z]{1,4}-?)?\d[\d-]{3,})(?:[/?#]|$)', re.I),
+           re.compile(r'[?&](?:gh_jid|job_?id|req_?id|requisition_?id|id)=([\w-]{4,})', re.I),
+           re.compile(r'/(\d{5,})(?:[/?#]|$)')]
+
+STATS = Counter()  # per-run 'jobs' added and 'duplicates' found
+
+
+def _words(title: str) -> list[str]:
+    return [LEVEL_ALIASES.get(w, w) for w in re.findall(r'\w+', _NOISE_RE.sub(' ', normalize_title(title)))]
+
+
+def shingles(title: str) -> set[str]:
+    """Words and word bigrams of a normalized title, without gender tags or workload."""
+    words = _words(title)
+    return set(words) | {f'{a} {b}' for a, b in zip(words, words[1:])}
+
+
+def levels(title: str) -> frozenset[str]:
+    """Seniority / level tokens of a title ("Sr. Scientist II" -> {'senior', 'ii'})."""
+    return frozenset(w for w in _words(title) if w in LEVEL_TOKENS)
+
+
+def job_id(url: str | None) -> str | None:
+    """Canonical requisition ID of a posting URL, None when the URL carries none."""
+    for pattern in _ID_RES:
+        match = pattern.search(url or '')
+        if match:
+            return match.group(1).replace('-', '').upper()
+    return None
+
+
+def signature(shingle_set: set[str]) -> np.ndarray:
+    """MinHash signature (NUM_PERM values) of a shingle set."""
+    if not shingle_set:
+        return np.full(NUM_PERM, _PRIME, dtype=np.int64)
+    x = np.fromiter((zlib.crc32(s.encode('utf-8')) % _PRIME for s in shingle_set), dtype=np.int64, count=len(shingle_set))
+    return ((_A[:, None] * x[None, :] + _B[:, None]) % _PRIME).min(axis=1)
+
+
+def _jaccard(a: set[str], b: set[str]) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+class NearDupIndex:
+    """LSH index of cluster representatives; add() returns the cluster a posting belongs to."""
+
+    def __init__(self, threshold: float = THRESHOLD):
+        self.threshold = threshold
+        self._buckets  = [{} for _ in range(BANDS)]  # band -> band hash -> [representative keys]
+        self._shingles = {}  # representative key -> shingle set
+        self._company  = {}  # representative key -> company
+        self._levels   = {}  # representative key -> level tokens
+        self._ids      = {}  # (company, requisition ID) -> representative key
+        self._cluster  = {}  # posting key -> representative key
+        self._sizes    = Counter()  # representative key -> postings in the cluster
+        self._verdicts = {}  # representative key -> filter verdict
+        self._pending  = {}  # representative key -> future of a verdict being decided
+
+    @staticmethod
+    def key(title: str, company: str) -> str:
+        return f'{(company or "").lower()}|{normalize_title(title)}'
+
+    def _matches(self, company: str, rep: str) -> bool:
+        other = self._company[rep]
+        return company == other or company in AGGREGATOR_SOURCES or other in AGGREGATOR_SOURCES
+
+    def add(self, title: str, company: str, url: str | None = None) -> tuple[str, bool]:
+        """Add a posting; returns (cluster representative key, True if it starts a new cluster)."""
+        company = (company or '').lower()
+        key     = self.key(title, company)
+        req     = job_id(url)
+        STATS['jobs'] += 1
+        if key in self._cluster:
+            return self._join(key, self._cluster[key], company, req)
+        if req is not None and (company, req) in self._ids:
+            return self._join(key, self._ids[company, req], company, req)
+
+        items = shingles(title)
+        level = levels(title)
+        sig   = signature(items)
+        bands = [hash(sig[i * ROWS:(i + 1) * ROWS].tobytes()) for i in range(BANDS)]
+        candidates = {rep for band, h in zip(self._buckets, bands) for rep in band.get(h, ())}
+        best, best_sim = None, self.threshold
+        for rep in candidates:
+            if self._matches(company, rep) and self._levels[rep] == level:
+                sim = _jaccard(items, self._shingles[rep])
+                if sim >= best_sim:
+                    best, best_sim = rep, sim
+
+        if best is not None:
+            return self._join(key, best, company, req)
+
+        # new cluster: only representatives are bucketed, so lookups stay proportional to the matches
+        for band, h in zip(self._buckets, bands):
+            band.setdefault(h, []).append(key)
+        self._shingles[key] = items
+        self._company[key]  = company
+        self._levels[key]   = level
+        self._cluster[key]  = key
+        self._sizes[key]    = 1
+        if req is not None:
+            self._ids.setdefault((company, req), key)
+        return key, True
+
+    def _join(self, key: str, rep: str, company: str, req: str | None) -> tuple[str, bool]:
+        """Record a posting as a member of the cluster of `rep`."""
+        STATS['duplicates'] += 1
+        self._cluster.setdefault(key, rep)
+        self._sizes[rep] += 1
+        if req is not None:
+            self._ids.setdefault((company, req), rep)
+        return rep, False
+
+    def clusters(self) -> int:
+        return len(self._shingles)
+
+    async def decide_once(self, items: list[tuple], decide) -> list:
+        """
+        Verdict for each (title, company[, url]) item, deciding each cluster only once per run.
+        `decide(positions)` is awaited with the positions of the items that represent a cluster
+        not decided yet and returns their verdicts; the other items reuse their representative's
+        verdict, waiting for it when another task is still deciding it. None verdicts (failed
+        calls) are not remembered, so a later duplicate gets another chance.
+        """
+        loop    = asyncio.get_running_loop()
+        reps    = [self.add(*item)[0] for item in items]
+        leaders = []
+        for pos, rep in enumerate(reps):
+            if rep not in self._verdicts and rep not in self._pending:
+                self._pending[rep] = loop.create_future()
+                leaders.append(pos)
+        try:
+            for pos, verdict in zip(leaders, await decide(leaders) if leaders else []):
+                if verdict is not None:
+                    self._verdicts[reps[pos]] = verdict
+                self._pending.pop(reps[pos]).set_result(verdict)
+        finally:
+            # never leave followers waiting on a failed batch
+            for pos in leaders:
+                future = self._pending.pop(reps[pos], None)
+                if future is not None:
+                    future.set_result(None)
+
+        results = []
+        for pos, rep in enumerate(reps):
+            if rep in self._verdicts:
+                results.append(self._verdicts[rep])
+            elif rep in self._pending:
+                results.append(await asyncio.shield(self._pending[rep]))
+            else:
+                results.append(None)
+        return results
+
+
+def report() -> str:
+    """One line with this run's near-duplicate postings (filtered and emailed once)."""
+    if not STATS['jobs']:
+        return '   Near-duplicates: none checked'
+    return (f"   Near-duplicates: {STATS['duplicates']}/{STATS['jobs']} postings matched an earlier posting "
+            f"({100 * STATS['duplicates'] / STATS['jobs']:.0f}%)")
+
+
+_index = None
+
+
+def get_neardup_index() -> NearDupIndex:
+    """Run-wide index shared by every filter of the process."""
+    global _index
+    if _index is None:
+        _index = NearDupIndex()
+    return _index
@@ -0,0 +1,71 @@
+"""
+Deterministic keyword pre-classifier run ahead of the LLM relevance filter.
+
+The include/exclude term sets mirror the categories of the filter prompts
+(ML/AI, cheminformatics, CADD, computational chemistry, data science vs DevOps,
+statisticians, software engineering, tech leads, ...). Only clear-cut titles are
+decided locally; anything matching both sets, or neither, is left to the model.
+"""
+import re
+from collections import Counter
+
+# relevant fields (case-insensitive)
+INCLUDE_TERMS = [
+    r'machine[\s-]*learning', r'deep[\s-]*learning', r'artificial[\s-]*intelligence', r'k[üu]nstliche[\s-]*intelligenz',
+    r'intelligence[\s-]*artificielle', r'data[\s-]*scien(?:ce|tist)', r'chem(?:o)?[\s-]*informatic', r'computational[\s-]*chemist',
+    r'computer[\s-]*aided[\s-]*drug', r'computational(?:ly)?[\s-]*(?:aided|assisted)[\s-]*drug', r'molecular[\s-]*model(?:l)?ing',
+    r'computer[\s-]*vision', r'natural[\s-]*language[\s-]*processing', r'generative[\s-]*(?:ai|model)', r'neural[\s-]*network',
+]
+# acronyms are matched case-sensitively so that e.g. "Maintenance" or "Email" never hit "AI"/"ML"
+INCLUDE_ACRONYMS = [r'AI', r'ML', r'CADD', r'NLP', r'LLMs?', r'GenAI']
+
+# roles the prompts explicitly exclude, plus obvious non-computational functions
+EXCLUDE_TERMS = [
+    r'dev[\s-]*ops', r'statistici', r'biostatistic', r'software[\s-]*(?:engineer|developer|architect)', r'tech(?:nical)?[\s-]*lead',
+    r'post[\s-]*doc', r'scientific[\s-]*associate', r'research[\s-]*associate', r'operator', r'op[ée]rat(?:eur|rice)',
+    r'technician', r'techni(?:cien|kerin|ker)', r'controller', r'accountant', r'accounting', r'finance', r'financial', r'payroll',
+    r'auditor', r'sales', r'marketing', r'brand[\s-]*manager', r'key[\s-]*account', r'customer[\s-]*service', r'procurement',
+    r'purchas(?:er|ing)', r'buyer', r'supply[\s-]*chain', r'logistic', r'warehouse', r'driver', r'facility', r'maintenance',
+    r'electrician', r'mechanic', r'cleaning', r'production', r'manufacturing', r'packaging', r'quality[\s-]*(?:assurance|control)',
+    r'qa[\s-]*specialist', r'validation', r'regulatory', r'pharmacovigilance', r'legal', r'counsel', r'paralegal', r'lawyer',
+    r'human[\s-]*resources', r'talent[\s-]*acquisition', r'recruit', r'assistant', r'secretary', r'receptionist', r'nurse',
+    r'clinical[\s-]*trial', r'medical[\s-]*(?:science[\s-]*liaison|advisor|affairs)', r'apprentice', r'lehrling', r'lernende',
+    r'laborant', r'mitarbeiter', r'sachbearbeiter', r'help[\s-]*desk', r'it[\s-]*support', r'network[\s-]*engineer', r'sap[\s-]',
+]
+
+_INCLUDE_RE = re.compile(r'|'.join(INCLUDE_TERMS), re.IGNORECASE)
+_ACRONYM_RE = re.compile(r'(?<![A-Za-z])(?:' + r'|'.join(INCLUDE_ACRONYMS) + r')(?![A-Za-z])')
+_EXCLUDE_RE = re.compile(r'|'.join(EXCLUDE_TERMS), re.IGNORECASE)
+
+STATS = Counter()  # per-run decisions: 'accepted', 'rejected', 'ambiguous'
+
+
+def classify(title: str) -> int | None:
+    """1 = clearly relevant, 0 = clearly not, None = ambiguous (ask the LLM)."""
+    include = bool(_INCLUDE_RE.search(title or '') or _ACRONYM_RE.search(title or ''))
+    exclude = bool(_EXCLUDE_RE.search(title or ''))
+    if include == exclude:
+        return None
+    return 1 if include else 0
+
+
+def split_jobs(jobs: list[dict], key: str = 'name') -> tuple[list[dict], list[dict], list[dict]]:
+    """Split jobs into (accepted, rejected, ambiguous) on their `key` title (else 'name') and count the decisions."""
+    accepted, rejected, ambiguous = [], [], []
+    for job in jobs:
+        verdict = classify(job.get(key) or job.get('name', ''))
+        (ambiguous if verdict is None else accepted if verdict else rejected).append(job)
+    STATS['accepted']  += len(accepted)
+    STATS['rejected']  += len(rejected)
+    STATS['ambiguous'] += len(ambiguous)
+    return accepted, rejected, ambiguous
+
+
+def report() -> str:
+    """One line with this run's rule decisions (i.e. LLM decisions saved)."""
+    total = sum(STATS.values())
+    if not total:
+        return '   Pre-filter: not used'
+    decided = STATS['accepted'] + STATS['rejected']
+    return (f"   Pre-filter: {decided}/{total} titles decided by rules ({100 * decided / total:.0f}% LLM decisions saved): "
+            f"{STATS['accepted']} accepted, {STATS['rejected']} rejected, {STATS['ambiguous']} sent on")
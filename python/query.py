@@ -0,0 +1,119 @@
+"""
+Queries over the job history kept in the job store (see python/jobstore.py).
+
+Dates and companies are indexed and titles are full-text indexed (FTS5), so the usual
+questions are answered from the indexes instead of loading the whole history:
+
+    python -m python.query --since 2026-10-01                    # new since a day
+    python -m python.query --company roche --days 30             # what Roche posted in the last 30 days
+    python -m python.query --search cheminformatics              # all cheminformatics roles
+    python -m python.query --search "machine learning" --since 2026-01-01 --csv ./output/ml.csv
+    python -m python.query --company roche --closed              # Roche jobs no longer listed
+    python -m python.query --import-backups                      # load the ./output/bak history first
+
+--search takes FTS5 syntax: words (all must match), "exact phrases", prefix* and OR.
+"""
+import sqlite3
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from python.jobstore import JobStore, get_job_store
+
+
+def _fts_query(text: str) -> str:
+    """Quote each word so plain text never trips the FTS5 syntax (prefix* is kept)."""
+    terms = []
+    for word in text.split():
+        prefix = word.endswith('*')
+        word   = word.rstrip('*').replace('"', '')
+        if word:
+            terms.append(f'"{word}"' + ('*' if prefix else ''))
+    return ' '.join(terms)
+
+
+def _select(table: str, since: str | None, until: str | None, company: str | None, search: str | None) -> tuple[str, list]:
+    """SELECT over one job table (jobs or jobs_closed) with its filters and parameters."""
+    where, params = [], []
+    if search:
+        where.append(f'id IN (SELECT rowid FROM {table}_fts WHERE {table}_fts MATCH ?)')
+        params.append(search)
+    if since:
+        where.append('date >= ?')
+        params.append(since)
+    if until:
+        where.append('date <= ?')
+        params.append(until)
+    if company:
+        where.append('company = ?')
+        params.append(company.lower())
+    closed_on = 'closed_on' if table == 'jobs_closed' else 'NULL AS closed_on'
+    return (f'SELECT name, url, company, date, last_seen, {closed_on} FROM {table}'
+            + (' WHERE ' + ' AND '.join(where) if where else '')), params
+
+
+def find_jobs(since: str | None = None, until: str | None = None, company: str | None = None,
+              search: str | None = None, closed: bool | None = False, limit: int | None = None,
+              store: JobStore | None = None) -> pd.DataFrame:
+    """
+    Jobs first seen between `since` and `until` (inclusive, YYYY-MM-DD), optionally of one
+    company and matching a full-text `search` on the title. Newest first.
+    :param closed: False for open jobs, True for closed jobs, None for both
+    :return: DataFrame with columns name, url, company, date, last_seen, closed_on
+    """
+    tables = {False: ['jobs'], True: ['jobs_closed'], None: ['jobs', 'jobs_closed']}[closed]
+
+    def _run(text):
+        parts  = [_select(table, since, until, company, text) for table in tables]
+        sql    = (' UNION ALL '.join(part for part, _ in parts)
+                  + ' ORDER BY date DESC, company, name'
+                  + (f' LIMIT {int(limit)}' if limit else ''))
+        return store.query(sql, [p for _, params in parts for p in params])
+
+    store = store or get_job_store()
+    try:
+        return _run(search)
+    except (sqlite3.OperationalError, pd.errors.DatabaseError):
+        if not search:
+            raise
+        # not valid FTS5 syntax: search for the words instead
+        return _run(_fts_query(search))
+
+
+def jobs_on(date: str, store: JobStore | None = None) -> pd.DataFrame:
+    """Jobs first seen on `date` (YYYY-MM-DD), e.g. today's jobs for the email."""
+    return find_jobs(since=date, until=date, store=store)
+
+
+if __name__ == "__main__":
+    import time
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Query the job history')
+    parser.add_argument('--since', help='First seen on or after this day (YYYY-MM-DD)')
+    parser.add_argument('--until', help='First seen on or before this day (YYYY-MM-DD)')
+    parser.add_argument('--days', type=int, help='First seen in the last N days')
+    parser.add_argument('--company', help='Only this company')
+    parser.add_argument('--search', help='Full-text search on the job titles')
+    parser.add_argument('--closed', action='store_true', help='Jobs no longer listed by their company')
+    parser.add_argument('--all', action='store_true', help='Open and closed jobs')
+    parser.add_argument('--limit', type=int, help='At most N jobs')
+    parser.add_argument('--csv', help='Write the result to this CSV')
+    parser.add_argument('--import-backups', action='store_true', help='Load the ./output/bak history into the store first')
+    args = parser.parse_args()
+
+    if args.import_backups:
+        get_job_store().import_backups()
+    since = args.since
+    if args.days:
+        since = max(since or '', (datetime.today() - timedelta(days=args.days)).strftime('%Y-%m-%d'))
+
+    start = time.perf_counter()
+    df    = find_jobs(since=since, until=args.until, company=args.company, search=args.search,
+                      closed=None if args.all else args.closed, limit=args.limit)
+    print(f'>> {len(df)} jobs in {1000 * (time.perf_counter() - start):.1f} ms')
+    if args.csv:
+        df.to_csv(args.csv, sep=',', index=False)
+    else:
+        with pd.option_context('display.max_rows', None, 'display.max_colwidth', 80, 'display.width', 200):
+            print(df)
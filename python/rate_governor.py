@@ -0,0 +1,112 @@
+"""
+Shared requests-per-minute / tokens-per-minute governor for LLM calls.
+
+All concurrent calls of a run go through one RateGovernor, which keeps a sliding
+60s window of requests and (estimated, then actual) tokens, delays callers that
+would exceed the provider limits, and pauses everybody when the provider answers
+429 with a retry-after hint.
+"""
+import time
+import asyncio
+from collections import deque
+
+WINDOW_SECONDS = 60.0
+
+
+def estimate_tokens(*texts: str) -> int:
+    """Cheap token estimate (~4 characters per token) used before the real usage is known."""
+    return sum(len(t or '') for t in texts) // 4 + 1
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """True for provider 429 errors (openai / anthropic RateLimitError or any error with status 429)."""
+    return getattr(error, 'status_code', None) == 429 or type(error).__name__ == 'RateLimitError'
+
+
+def retry_after_seconds(error: Exception) -> float | None:
+    """Read the retry-after(-ms) hint from a provider error response, if there is one."""
+    response = getattr(error, 'response', None)
+    headers  = getattr(response, 'headers', None) or {}
+    for key, scale in (('retry-after-ms', 1000.0), ('retry-after', 1.0)):
+        value = headers.get(key)
+        if value:
+            try:
+                return float(value) / scale
+            except ValueError:
+                continue
+    return None
+
+
+class RateGovernor:
+    """
+    Sliding-window limiter for requests/min and tokens/min that honours retry-after.
+    Use `await governor.run(lambda: model.ainvoke(messages), estimated_tokens)`.
+    """
+
+    def __init__(self, rpm: int, tpm: int, max_retries: int = 5, base_delay: float = 2.0):
+        self.rpm          = rpm
+        self.tpm          = tpm
+        self.max_retries  = max_retries
+        self.base_delay   = base_delay
+        self._window      = deque()  # [timestamp, tokens] per request in the last minute
+        self._tokens      = 0
+        self._paused_until = 0.0
+        self._lock        = asyncio.Lock()
+        self.stats        = {'requests': 0, 'tokens': 0, 'output_tokens': 0, 'rate_limited': 0, 'waited_s': 0.0}
+
+    def _purge(self, now: float) -> None:
+        while self._window and now - self._window[0][0] >= WINDOW_SECONDS:
+            self._tokens -= self._window.popleft()[1]
+
+    async def _reserve(self, tokens: int) -> list:
+        """Wait until the request fits in the window, then book it."""
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                self._purge(now)
+                wait = self._paused_until - now
+                if wait <= 0:
+                    fits_rpm = len(self._window) < self.rpm
+                    fits_tpm = self._tokens + tokens <= self.tpm or not self._window
+                    if fits_rpm and fits_tpm:
+                        entry = [now, tokens]
+                        self._window.append(entry)
+                        self._tokens += tokens
+                        return entry
+                    # wait for the oldest booking to leave the window
+                    wait = WINDOW_SECONDS - (now - self._window[0][0])
+            wait = max(wait, 0.05)
+            self.stats['waited_s'] += wait
+            await asyncio.sleep(wait)
+
+    def _settle(self, entry: list, usage: dict) -> None:
+        """Replace the estimate of a booked request by its actual token usage."""
+        actual_tokens = usage.get('total_tokens')
+        if actual_tokens is not None:
+            self._tokens += actual_tokens - entry[1]
+            entry[1] = actual_tokens
+        self.stats['requests'] += 1
+        self.stats['tokens'] += entry[1]
+        self.stats['output_tokens'] += usage.get('output_tokens', 0)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller for `seconds` (e.g. after a 429 with retry-after)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def run(self, call, estimated_tokens: int):
+        """Run the coroutine factory `call` under the limits, retrying on rate-limit errors."""
+        for attempt in range(self.max_retries + 1):
+            entry = await self._reserve(estimated_tokens)
+            try:
+                result = await call()
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt == self.max_retries:
+                    raise
+                self.stats['rate_limited'] += 1
+                delay = retry_after_seconds(e) or self.base_delay * (2 ** attempt)
+                print(f'   Rate limited, retrying in {delay:.1f}s (attempt {attempt + 1}/{self.max_retries})')
+                self.pause(delay)
+                continue
+            usage = getattr(result, 'usage_metadata', None) or {}
+            self._settle(entry, usage)
+            return result
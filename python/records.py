@@ -0,0 +1,88 @@
+"""
+In-memory job record shared by the scrapers, the filters and the job store.
+
+A scraped job stays a JobRecord from the scraper to the store; it is only serialized
+at the boundaries: the {"jobs": [...]} JSON of the LangChain tools and LLM prompts
+(records_to_json / records_from_json) and the run journal / database rows.
+Records are slotted and their company and location strings are interned, so large
+listings and histories hold one copy of each company and location.
+"""
+import sys
+import json
+from dataclasses import dataclass, fields
+
+
+@dataclass(slots=True, eq=False)
+class JobRecord:
+    """One job posting; company and location are interned."""
+    name:     str
+    url:      str
+    company:  str = ''
+    location: str | None = None
+    posted:   str | None = None  # posting date shown by the career page, if any
+
+    def __post_init__(self):
+        self.company = sys.intern((self.company or '').lower())
+        if self.location:
+            self.location = sys.intern(self.location)
+
+    def __reduce__(self):
+        # rebuilt through __init__ so records coming back from worker processes are interned again
+        return JobRecord, (self.name, self.url, self.company, self.location, self.posted)
+
+    # read-only mapping access for the helpers shared with plain dict rows (e.g. BNF projects)
+    def get(self, key: str, default=None):
+        return getattr(self, key, default) if key in _FIELDS else default
+
+    def __getitem__(self, key: str):
+        if key not in _FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def as_dict(self) -> dict:
+        """The {"name", "url"} dict of the JSON job lists (plus location when known)."""
+        row = {'name': self.name, 'url': self.url}
+        if self.location:
+            row['location'] = self.location
+        return row
+
+
+_FIELDS = frozenset(f.name for f in fields(JobRecord))
+
+
+def to_records(jobs: list, company: str = '') -> list[JobRecord]:
+    """
+    Build records from scraper output, dropping entries without a name or URL. Accepts
+    (name, url[, posted]) tuples, dicts with 'name'/'title' and 'url' keys, or records.
+    """
+    records = []
+    for job in jobs or []:
+        if isinstance(job, JobRecord):
+            record = job if job.company or not company else JobRecord(job.name, job.url, company, job.location, job.posted)
+        elif isinstance(job, tuple):
+            record = JobRecord(job[0], job[1], company, posted=job[2] if len(job) > 2 else None)
+        elif isinstance(job, dict):
+            record = JobRecord(job.get('name') or job.get('title', ''), job.get('url', ''), company,
+                               job.get('location') or None, job.get('posted_date') or None)
+        else:
+            continue
+        if isinstance(record.name, str) and isinstance(record.url, str) and record.name and record.url:
+            records.append(record)
+    return records
+
+
+def records_to_json(records: list[JobRecord]) -> str:
+    """Serialize records as the {"jobs": [{"name": ..., "url": ...}, ...]} JSON of the tools and prompts."""
+    return json.dumps({"jobs": [{'name': r.name, 'url': r.url} for r in records]})
+
+
+def records_from_json(text: str, company: str = '') -> list[JobRecord] | None:
+    """Parse a {"jobs": [...]} JSON string (optionally in ``` markers) into records; None if it is not a job list."""
+    text = (text or '').strip()
+    if text.startswith('```'):
+        text = text.strip('`').removeprefix('json').strip()
+    try:
+        jobs = json.loads(text)['jobs']
+    except (json.JSONDecodeError, KeyError, TypeError):
+        return None
+    return to_records(jobs, company) if isinstance(jobs, list) else None
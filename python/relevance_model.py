@@ -0,0 +1,211 @@
+"""
+Local relevance classifier trained from past LLM verdicts.
+
+Titles are turned into hashed word/bigram/character n-gram features and scored by
+a logistic regression trained with SGD, so a title is scored in microseconds on CPU.
+Only titles whose probability falls inside UNCERTAINTY_BAND still go to the LLM.
+
+Labels are the job-filter verdicts of the LLM cache, i.e. the relevance verdicts
+returned for the job filter prompt (python/job_filter.py); verdicts for other criteria,
+such as the BNF project flags, are left out, and the model only decides job titles
+(BNF projects always go to the LLM). The historical CSVs are not used as labels either:
+updated_joblist.csv only holds accepted jobs and bnf_projects.csv follows the BNF
+criteria. Training is incremental: each run only learns the verdicts stored since the
+last one learned (by cache rowid).
+
+Before learning a new verdict the model predicts it first, so the saved agreement
+table is an honest (prequential) estimate of how often it would agree with the LLM.
+
+    python -m python.relevance_model --train     # rebuild from all labels
+    python -m python.relevance_model --report    # agreement with the LLM per confidence level
+    python -m python.relevance_model --score "Senior Data Scientist"
+"""
+import os
+import re
+import zlib
+from collections import Counter
+
+import numpy as np
+
+from python.llm_cache import get_llm_cache, normalize_title
+
+MODEL_PATH       = './output/relevance_model.npz'
+N_FEATURES       = 2 ** 18
+LEARNING_RATE    = 0.5
+L2               = 1e-6
+EPOCHS           = 5     # passes over the data when retraining from scratch
+MIN_EXAMPLES     = 300   # below this the model never decides on its own
+UNCERTAINTY_BAND = (0.15, 0.85)  # probabilities inside the band are sent to the LLM
+N_BINS           = 10    # confidence bins of the agreement table (0.5 -> 1.0)
+
+STATS = Counter()  # per-run decisions: 'accepted', 'rejected', 'uncertain'
+
+
+def features(title: str) -> np.ndarray:
+    """Hashed feature indices of a title: words, word bigrams and in-word character 3-5 grams."""
+    words  = re.findall(r'\w+', normalize_title(title))
+    grams  = [f'w:{w}' for w in words] + [f'b:{a} {b}' for a, b in zip(words, words[1:])]
+    for w in words:
+        padded = f'<{w}>'
+        grams += [f'c:{padded[i:i + n]}' for n in (3, 4, 5) for i in range(len(padded) - n + 1)]
+    return np.unique(np.fromiter((zlib.crc32(g.encode('utf-8')) % N_FEATURES for g in grams), dtype=np.int64, count=len(grams)))
+
+
+class RelevanceModel:
+    """Hashed n-gram logistic regression with incremental SGD updates."""
+
+    def __init__(self):
+        self.w             = np.zeros(N_FEATURES, dtype=np.float32)
+        self.b             = 0.0
+        self.n_seen        = 0
+        self.trained_rowid = 0   # cache rowid of the last verdict learned
+        self.agreement     = np.zeros((N_BINS, 2), dtype=np.int64)  # [verdicts, agreed] per confidence bin
+
+    @property
+    def ready(self) -> bool:
+        return self.n_seen >= MIN_EXAMPLES
+
+    def _proba(self, idx: np.ndarray) -> float:
+        z = self.b + self.w[idx].sum() / np.sqrt(max(len(idx), 1))
+        return float(1.0 / (1.0 + np.exp(-np.clip(z, -30, 30))))
+
+    def predict_proba(self, titles: list[str]) -> np.ndarray:
+        """Probability that each title is relevant."""
+        return np.array([self._proba(features(t)) for t in titles])
+
+    def partial_fit(self, titles: list[str], labels: list[int], evaluate: bool = True) -> None:
+        """One SGD pass over (title, label) pairs; with `evaluate`, score each one first for the agreement table."""
+        for title, label in zip(titles, labels):
+            idx  = features(title)
+            p    = self._proba(idx)
+            if evaluate and self.ready:
+                conf = max(p, 1 - p)
+                bin_ = min(int((conf - 0.5) * 2 * N_BINS), N_BINS - 1)
+                self.agreement[bin_] += (1, int((p >= 0.5) == bool(label)))
+            grad  = p - label
+            scale = 1 / np.sqrt(max(len(idx), 1))
+            self.w[idx] -= LEARNING_RATE * (grad * scale + L2 * self.w[idx])
+            self.b      -= LEARNING_RATE * grad
+            self.n_seen += 1
+
+    def split_jobs(self, jobs: list[dict], key: str = 'name', band: tuple[float, float] = UNCERTAINTY_BAND) -> tuple[list[dict], list[dict], list[dict]]:
+        """Split jobs into (accepted, rejected, uncertain); everything is uncertain until the model is ready."""
+        if not self.ready or not jobs:
+            STATS['uncertain'] += len(jobs)
+            return [], [], list(jobs)
+        low, high = band
+        accepted, rejected, uncertain = [], [], []
+        for job, p in zip(jobs, self.predict_proba([job.get(key) or job.get('name', '') for job in jobs])):
+            (accepted if p >= high else rejected if p <= low else uncertain).append(job)
+        STATS['accepted']  += len(accepted)
+        STATS['rejected']  += len(rejected)
+        STATS['uncertain'] += len(uncertain)
+        return accepted, rejected, uncertain
+
+    def catch_up(self, save: bool = True) -> int:
+        """Learn the job-filter verdicts cached since the last update; returns how many were learned."""
+        rows = _filter_decisions(after=self.trained_rowid)
+        if not rows:
+            return 0
+        self.partial_fit([r[0] for r in rows], [int(r[2]) for r in rows])
+        self.trained_rowid = rows[-1][3]
+        if save:
+            self.save()
+        return len(rows)
+
+    def save(self, path: str = MODEL_PATH) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        np.savez_compressed(path, w=self.w, b=self.b, n_seen=self.n_seen,
+                            trained_rowid=self.trained_rowid, agreement=self.agreement)
+
+    @classmethod
+    def load(cls, path: str = MODEL_PATH) -> 'RelevanceModel':
+        """Load the saved model, or an untrained one if there is none yet (or it predates the rowid cursor)."""
+        model = cls()
+        if os.path.exists(path):
+            with np.load(path) as data:
+                if 'trained_rowid' not in data:
+                    # older models were also trained on BNF flags and stored jobs: relearn the filter verdicts
+                    print('>> Relevance model predates job-filter-only training, relearning from the cached verdicts')
+                    return model
+                model.w             = data['w']
+                model.b             = float(data['b'])
+                model.n_seen        = int(data['n_seen'])
+                model.trained_rowid = int(data['trained_rowid'])
+                model.agreement     = data['agreement']
+        return model
+
+    def agreement_report(self) -> str:
+        """For each confidence threshold: share of verdicts the model would take over and its agreement with the LLM."""
+        total, agreed = self.agreement[:, 0], self.agreement[:, 1]
+        if not total.sum():
+            return '   Relevance model: no agreement data yet'
+        lines = [f'   Relevance model agreement with the LLM ({total.sum()} verdicts, {self.n_seen} examples learned)',
+                 '   confidence >=   traffic   agreement']
+        for i in range(N_BINS):
+            covered = total[i:].sum()
+            if covered:
+                lines.append(f'   {0.5 + i / (2 * N_BINS):>12.2f}   {100 * covered / total.sum():>6.1f}%   '
+                             f'{100 * agreed[i:].sum() / covered:>8.1f}%')
+        return '\n'.join(lines)
+
+
+def report() -> str:
+    """One line with this run's model decisions (i.e. LLM decisions saved)."""
+    total = sum(STATS.values())
+    if not total:
+        return '   Relevance model: not used'
+    decided = STATS['accepted'] + STATS['rejected']
+    return (f"   Relevance model: {decided}/{total} titles decided ({100 * decided / total:.0f}% LLM decisions saved): "
+            f"{STATS['accepted']} accepted, {STATS['rejected']} rejected, {STATS['uncertain']} sent on")
+
+
+def _filter_decisions(after: int = 0) -> list[tuple[str, str, str, int]]:
+    """Cached (title, company, value, rowid) verdicts of the job filter prompt stored after rowid `after`."""
+    from python.job_filter import FILTER_CASCADE  # job_filter uses this model, import on use
+    return get_llm_cache().decisions('relevance', prompt=FILTER_CASCADE.prompt, after=after)
+
+
+def train_from_scratch() -> RelevanceModel:
+    """Retrain on every cached job-filter verdict (shuffled, EPOCHS passes) and save."""
+    rows   = _filter_decisions()
+    titles = [r[0] for r in rows]
+    labels = [int(r[2]) for r in rows]
+    model = RelevanceModel()
+    rng   = np.random.default_rng(0)
+    for epoch in range(EPOCHS):
+        order = rng.permutation(len(titles))
+        # only the first pass is scored, later passes would be scoring seen data
+        model.partial_fit([titles[i] for i in order], [labels[i] for i in order], evaluate=epoch == 0)
+    model.trained_rowid = rows[-1][3] if rows else 0
+    model.save()
+    print(f'>> Trained relevance model on {len(titles)} labels ({sum(labels)} relevant)')
+    return model
+
+
+_model = None
+
+
+def get_relevance_model() -> RelevanceModel:
+    """Process-wide model, loaded on first use and caught up with the cached LLM verdicts."""
+    global _model
+    if _model is None:
+        _model = RelevanceModel.load()
+        _model.catch_up()
+    return _model
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Local relevance classifier trained from LLM verdicts')
+    parser.add_argument('--train', action='store_true', help='Retrain from scratch on the cached job-filter verdicts')
+    parser.add_argument('--report', action='store_true', help='Show agreement with the LLM per confidence level')
+    parser.add_argument('--score', nargs='+', metavar='TITLE', help='Score job titles')
+    args = parser.parse_args()
+
+    model = train_from_scratch() if args.train else get_relevance_model()
+    if args.report or args.train:
+        print(model.agreement_report())
+    for title, p in zip(args.score or [], model.predict_proba(args.score or [])):
+        print(f'   {p:.3f}  {title}')
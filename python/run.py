@@ -49,6 +49,18 @@ from graph.edges import *
 from graph.state import *
 from python.tools import *
 from python.functions import *
+from python.llm_cache import get_llm_cache
+from python import prefilter
+from python import relevance_model
+from python.relevance_model import get_relevance_model
+from python import cascade
+from python import neardup
+from python import job_filter
+from python.jobstore import RunBuffer
+from python.query import jobs_on
+from python import analytics
+from python import warm_eval
+from python import llm_clients
 
 os.environ['OPENAI_API_KEY'] = C.OPENAI_API_KEY
 os.environ['SERPAPI_API_KEY'] = C.SERPAPI_API_KEY # make sure it spelled as: SERPAPI_API_KEY
@@ -61,49 +73,83 @@ os.environ['GMAIL_APP_PASS'] = C.GMAIL_APP_PASS
 with open(os.path.join(PROJECT_ROOT, 'data', 'company2careerpage.json'), 'r') as f:
     company2careerpage = json.load(f)
 
-async def main():
-    for select in company2careerpage.keys():
-
-        ## 1. Building the graph
-        ## --------------------------
-        # Defining tool nodes (from graph.nodes)
-        job_tool_node = ToolNode(job_tools)
-        web_tool_node = ToolNode(web_tools)
-
-        workflow  = StateGraph(ChatMessages) # from graph.state
-
-        ## adding nodes
-        workflow.add_node('agent',call_agent)
-        workflow.add_node('jobTools',job_tool_node)
-        workflow.add_node('filterer',joblist_filtering)
-        workflow.add_node('formatter',joblist_formatting)
-        workflow.add_node('codeWriter',code_writing)
-        workflow.add_node('codePlanner',code_planning)
-        workflow.add_node('webTools',web_tool_node)
-        workflow.add_node('codeEval',code_eval)
-
-        ## adding edges and routing
-        workflow.add_edge(START,'agent')
-        workflow.add_conditional_edges('agent',Router1) # setting router function for the agent
-        workflow.add_edge('jobTools','agent') # you want to link tools to agent because agent is responsible for giving an answer to human
-        workflow.add_edge('filterer','formatter')
-        workflow.add_conditional_edges('codePlanner',Router2)
-        workflow.add_edge('webTools','codePlanner')
-        workflow.add_edge('codeWriter','codeEval')
-        workflow.add_conditional_edges('codeEval',Is_code_ok_YN) # setting router function for the agent
-
-        checkpointer = MemorySaver() # set memory
-        graph = workflow.compile(checkpointer=checkpointer) #
-
-        ## 2. running the graph
-        ## --------------------------
-        print('\n>> looking for jobs for',select)
-        print('>> ------------------------------------')
-        question   = f'can you simply get the current jobs associated with this company {select}?'
-        input_data = {"messages": HumanMessage(content=question),'company':select,'company2careerpage':company2careerpage,'codeiter': 0}
-        messages   = await graph.ainvoke(input=input_data, config={"configurable": {"thread_id": 1}})
-        print('>> done, if new code was written, please add to tools.py and add to tool list')
-        update_joblist(messages,select)
+# companies committed to the job store at once (the journal protects the rest)
+CHECKPOINT_COMPANIES = 10
+# also write the store out as ./output/updated_joblist.csv (the email reads the store)
+EXPORT_CSV = True
+
+# companies run through the graph at the same time
+GRAPH_CONCURRENCY = 4
+
+def build_graph():
+    """
+    Build and compile the job-search graph once; every company runs through the same
+    compiled graph on its own checkpointer thread
+    """
+    # Defining tool nodes (from graph.nodes)
+    job_tool_node = ToolNode(job_tools)
+    web_tool_node = ToolNode(web_tools)
+
+    workflow  = StateGraph(ChatMessages) # from graph.state
+
+    ## adding nodes
+    workflow.add_node('dispatcher',dispatch_scraper)
+    workflow.add_node('agent',call_agent)
+    workflow.add_node('jobTools',job_tool_node)
+    workflow.add_node('filterer',joblist_filtering)
+    workflow.add_node('formatter',joblist_formatting)
+    workflow.add_node('codeWriter',code_writing)
+    workflow.add_node('codePlanner',code_planning)
+    workflow.add_node('webTools',web_tool_node)
+    workflow.add_node('codeEval',code_eval)
+
+    ## adding edges and routing
+    workflow.add_conditional_edges(START,Router0) # registered scrapers are called directly, the agent only handles the rest
+    workflow.add_edge('dispatcher','filterer')
+    workflow.add_conditional_edges('agent',Router1) # setting router function for the agent
+    workflow.add_edge('jobTools','agent') # you want to link tools to agent because agent is responsible for giving an answer to human
+    workflow.add_edge('filterer','formatter')
+    workflow.add_conditional_edges('codePlanner',Router2)
+    workflow.add_edge('webTools','codePlanner')
+    workflow.add_edge('codeWriter','codeEval')
+    workflow.add_conditional_edges('codeEval',Is_code_ok_YN) # setting router function for the agent
+
+    checkpointer = MemorySaver() # set memory, one thread per company
+    return workflow.compile(checkpointer=checkpointer)
+
+async def run_company(graph, select, buffer=None):
+    """
+    Run one company through the compiled graph on its own thread and store its jobs
+    """
+    print('\n>> looking for jobs for',select)
+    print('>> ------------------------------------')
+    question   = f'can you simply get the current jobs associated with this company {select}?'
+    # each company gets its own copy of the inputs and its own checkpointer thread
+    input_data = {"messages": HumanMessage(content=question),'company':select,'company2careerpage':deepcopy(company2careerpage),'codeiter': 0}
+    messages   = await graph.ainvoke(input=input_data, config={"configurable": {"thread_id": f'company-{select}'}})
+    print(f'>> done with {select}, if new code was written, please add to tools.py and add to tool list')
+    update_joblist(messages,select,buffer)
+
+async def main(buffer=None, concurrency=GRAPH_CONCURRENCY):
+    ## 1. Building the graph (once)
+    ## --------------------------
+    graph     = build_graph()
+    in_flight = asyncio.Semaphore(concurrency)
+
+    ## 2. running the graph, at most `concurrency` companies at a time
+    ## --------------------------
+    async def _run(select):
+        async with in_flight:
+            try:
+                await run_company(graph, select, buffer)
+            except Exception as e:
+                print(f'>> error processing {select}: {e}')
+
+    try:
+        await asyncio.gather(*(_run(select) for select in company2careerpage.keys()))
+    finally:
+        await warm_eval.shutdown() # stop the code evaluation worker and its browser, if code was evaluated
+        await llm_clients.aclose() # the async LLM connections belong to this event loop
 
 ## --------------------------------
 ## Main
@@ -111,14 +157,30 @@ async def main():
 
 if __name__ == "__main__":
     ## get the company career pages
-    asyncio.run(main())
+    # jobs of all companies are journaled and committed in one transaction (or per checkpoint)
+    with RunBuffer(checkpoint_every=CHECKPOINT_COMPANIES) as buffer:
+        asyncio.run(main(buffer))
+    print(cascade.report())
+    print(prefilter.report())
+    print(relevance_model.report())
+    print(neardup.report())
+    print(job_filter.report())
+    print(get_llm_cache().report())
+    # learn this run's new LLM verdicts
+    get_relevance_model().catch_up()
+    # refresh the posting analytics with this run's jobs
+    try:
+        analytics.update()
+    except Exception as e:
+        print(f'   Error updating analytics: {e}')
 
     ## send email with todays jobs:
     # find jobs matching todays date
     todate = datetime.today().strftime('%Y-%m-%d')
-    df = pd.read_csv('./output/updated_joblist.csv')
-    df_td = df.sort_values('date',ascending=False)
-    df_td = df_td[df_td['date']==todate]
+    df_td = jobs_on(todate)
+    if EXPORT_CSV:
+        export_joblist()
+    df_td = group_near_duplicates(df_td)
 
     html_table = df_to_gmail_html(df_td)
 
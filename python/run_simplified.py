@@ -14,18 +14,29 @@ sys.path.append('../keys')
 os.chdir(PROJECT_ROOT)
 
 import asyncio
-import json
-import pandas as pd
+import time
+import argparse
 from datetime import datetime
 
-## langchain:
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
-
 ## Custom scripts:
 import Constants as C
 from python.tools import *
-from python.functions import update_joblist, df_to_gmail_html, send_gmail_smtp
+from python.functions import store_jobs, export_joblist, group_near_duplicates, df_to_gmail_html, send_gmail_smtp
+from python.records import JobRecord
+from python.llm_cache import get_llm_cache
+from python import prefilter
+from python import relevance_model
+from python.relevance_model import get_relevance_model
+from python import cascade
+from python import neardup
+from python import job_filter
+from python import llm_clients
+from python.job_filter import triage, llm_filter, filter_jobs
+from python.jobstore import RunBuffer
+from python.query import jobs_on
+from python import analytics
+from python.scrape_pool import (iter_sharded_jobs, scrape_company, scrape_executor, plan_order,
+                                load_durations, save_durations, update_duration, SCRAPE_WORKERS)
 
 os.environ['OPENAI_API_KEY'] = C.OPENAI_API_KEY
 os.environ['ANTHROPIC_API_KEY'] = C.ANTHROPIC_API_KEY
@@ -89,120 +100,310 @@ COMPANY_JOB_FUNCTIONS = {
 }
 
 
-async def filter_jobs(joblist_json: str) -> str:
-    """Filter job listings to only relevant roles. Input and output are JSON format."""
-    print('>> Filtering relevant jobs...')
+# LLM filtering settings
+FILTER_CONCURRENCY = 4    # companies filtered by the LLM at the same time
+BATCH_LINGER       = 5.0  # seconds the batched pipeline waits for more companies before filtering
+
 
-    system_message = SystemMessage(content="""You are a strict job filter. You receive job listings in JSON format.
-ONLY return jobs that are directly related to:
-- Machine Learning / AI
-- Cheminformatics
-- Computational Assisted Drug Discovery (CADD)
-- Computational Chemistry
-- Data Science
+async def filter_companies_batched(company_jobs: dict[str, list[JobRecord]]) -> dict[str, list[JobRecord]]:
+    """
+    Filter several companies at once: the jobs triage cannot decide are numbered across
+    companies into token-budgeted batches instead of one LLM call per company.
+    Returns company -> kept job records (jobs whose call failed are reported as undecided).
+    """
+    print(f'>> Filtering {len(company_jobs)} companies in batched mode...')
 
-EXCLUDE jobs like: DevOps, statistician, Software Engineering, Tech Lead, general Post-Doc positions, general scientific associate, or any role not directly involving the above fields.
+    kept, misses = {}, []
+    for company, jobs in company_jobs.items():
+        kept[company], company_misses = triage(jobs, company)
+        misses += [(company, job) for job in company_misses]
 
-Return ONLY the filtered jobs in the SAME JSON format: {"jobs": [{"name": "...", "url": "..."}, ...]}
-Do NOT include any markdown code blocks or explanations, just the raw JSON.""")
+    print(f'   {len(misses)} jobs left for the LLM')
+    for (company, job), verdict in zip(misses, await llm_filter(misses)):
+        if verdict:
+            kept[company].append(job)
 
-    human_message = HumanMessage(content=f"Filter and return ONLY relevant jobs from:\n{joblist_json}")
+    return kept
 
-    model = ChatOpenAI(model='gpt-4o-mini', temperature=0)
-    result = await model.ainvoke([system_message, human_message])
 
-    return result.content
+def _record_jobs(company: str, jobs: list[JobRecord] | None, results: dict[str, list[JobRecord]], empty_companies: list[str]) -> None:
+    """Count the jobs returned by a scraper and file them under results or empty_companies."""
+    if jobs:
+        print(f'   Found {len(jobs)} job listings')
+        results[company] = jobs
+    else:
+        print(f'   No jobs found')
+        empty_companies.append(company)
 
 
-def collect_all_jobs() -> tuple[dict[str, str], list[str]]:
+def collect_all_jobs(sharded: bool = False, workers: int = SCRAPE_WORKERS) -> tuple[dict[str, list[JobRecord]], list[str]]:
     """
     Call each job scraping function and collect results.
+    With sharded=True the scrapers run on a process pool of `workers` processes
+    (see python/scrape_pool.py) and results are recorded as each company finishes.
     Returns a tuple of:
-        - dict mapping company name -> job listings JSON string
+        - dict mapping company name -> scraped job records
         - list of company names that returned 0 jobs
     """
     results = {}
     empty_companies = []
 
+    if sharded:
+        for company, jobs, seconds, error in iter_sharded_jobs(COMPANY_JOB_FUNCTIONS, workers):
+            print(f'\n>> Fetched jobs for {company.upper()} in {seconds:.1f}s')
+            if error:
+                print(f'   Error fetching jobs: {error}')
+                empty_companies.append(company)
+            else:
+                _record_jobs(company, jobs, results, empty_companies)
+        return results, empty_companies
+
+    durations = load_durations()
     for company, func in COMPANY_JOB_FUNCTIONS.items():
         print(f'\n>> Fetching jobs for {company.upper()}...')
         try:
-            # Call the tool function directly (invoke returns JSON)
-            job_list_json = func.invoke({})
-            if job_list_json and job_list_json.strip():
-                # Parse JSON to count jobs
-                try:
-                    data = json.loads(job_list_json)
-                    job_count = len(data.get('jobs', []))
-                    print(f'   Found {job_count} job listings')
-                    if job_count > 0:
-                        results[company] = job_list_json
-                    else:
-                        empty_companies.append(company)
-                except json.JSONDecodeError:
-                    print(f'   Invalid JSON response')
-                    empty_companies.append(company)
-            else:
-                print(f'   No jobs found')
-                empty_companies.append(company)
+            # Call the registered scraper directly (job records, no JSON round trip)
+            start = time.perf_counter()
+            jobs  = JOB_SCRAPERS[func.name]()
+            update_duration(durations, company, time.perf_counter() - start)
+            _record_jobs(company, jobs, results, empty_companies)
         except Exception as e:
             print(f'   Error fetching jobs: {e}')
             empty_companies.append(company)
+    save_durations(durations)
 
     return results, empty_companies
 
 
-async def process_company_jobs(company: str, joblist_json: str) -> dict | None:
-    """Process a single company's job list through filtering. Jobs are already in JSON format."""
+async def process_company_jobs(company: str, jobs: list[JobRecord]) -> list[JobRecord]:
+    """Process a single company's job records through filtering; returns the relevant ones."""
     print(f'\n>> Processing {company.upper()}...')
 
-    # Filter jobs (input and output are JSON)
-    filtered_json = await filter_jobs(joblist_json)
-
-    if not filtered_json or not filtered_json.strip():
+    kept = await filter_jobs(jobs, company)
+    if not kept:
         print(f'   No relevant jobs after filtering')
-        return None
+    return kept
 
-    # Return as messages dict for update_joblist compatibility
-    return {"messages": [type('Message', (), {'content': filtered_json})()]}
 
-
-async def process_all_jobs(all_jobs: dict[str, str]):
-    """Process all collected jobs (filter) asynchronously."""
+async def process_all_jobs(all_jobs: dict[str, list[JobRecord]], concurrency: int = FILTER_CONCURRENCY, batched: bool = False,
+                           buffer: RunBuffer | None = None):
+    """
+    Process all collected jobs (filter) concurrently, at most `concurrency` companies in flight.
+    With batched=True all companies go through filter_companies_batched instead.
+    Results go to `buffer` when given, otherwise straight to the job store.
+    """
     print('\n' + '=' * 50)
     print('STEP 2: Filtering jobs')
     print('=' * 50)
 
-    for company, joblist in all_jobs.items():
-        try:
-            messages = await process_company_jobs(company, joblist)
-            if messages:
-                update_joblist(messages, company)
-        except Exception as e:
-            print(f'   Error processing {company}: {e}')
-
-    print('\n>> Done processing all companies!')
+    if batched:
+        for company, kept in (await filter_companies_batched(all_jobs)).items():
+            if kept:
+                try:
+                    store_jobs(company, kept, buffer)
+                except Exception as e:
+                    print(f'   Error storing {company}: {e}')
+        _report_run()
+        return
+
+    in_flight = asyncio.Semaphore(concurrency)
+
+    async def _filter(company: str, jobs: list[JobRecord]):
+        async with in_flight:
+            try:
+                return company, await process_company_jobs(company, jobs)
+            except Exception as e:
+                print(f'   Error processing {company}: {e}')
+                return company, None
+
+    # results are written one at a time as they arrive (one store transaction each)
+    for finished in asyncio.as_completed([_filter(c, j) for c, j in all_jobs.items()]):
+        company, kept = await finished
+        if kept:
+            try:
+                store_jobs(company, kept, buffer)
+            except Exception as e:
+                print(f'   Error storing {company}: {e}')
+
+    _report_run()
+
+
+def _report_run() -> None:
+    """Print the run's LLM usage and how many decisions were saved, then learn the new verdicts."""
+    print(f'\n>> Done processing all companies!')
+    print(cascade.report())
+    print(prefilter.report())
+    print(relevance_model.report())
+    print(neardup.report())
+    print(job_filter.report())
+    print(get_llm_cache().report())
+    # learn this run's new LLM verdicts
+    get_relevance_model().catch_up()
+
+
+# Streaming pipeline settings
+QUEUE_SIZE = 8  # max companies waiting between two stages (backpressure)
+
+# Store settings
+CHECKPOINT_COMPANIES = 10  # buffered company results committed to the job store at once
+
+
+async def run_pipeline(sharded: bool = False, workers: int = SCRAPE_WORKERS,
+                       filter_concurrency: int = FILTER_CONCURRENCY, queue_size: int = QUEUE_SIZE,
+                       batched: bool = False, buffer: RunBuffer | None = None) -> list[str]:
+    """
+    Scrape -> filter -> store as a streaming producer/consumer pipeline.
+    Each company is filtered and written to the job store as soon as its scrape
+    finishes; bounded queues make a stage wait when the next one falls behind.
+    With batched=True a single batcher groups the companies that arrive within
+    BATCH_LINGER seconds (at most `queue_size`) and filters them together.
+    Results go to `buffer` when given, otherwise straight to the job store.
+    Returns the list of company names that returned 0 jobs.
+    """
+    loop            = asyncio.get_running_loop()
+    scraped         = asyncio.Queue(maxsize=queue_size)  # (company, job records)
+    filtered        = asyncio.Queue(maxsize=queue_size)  # (company, kept job records)
+    empty_companies = []
+    durations       = load_durations()
+    scrape_slots    = asyncio.Semaphore(workers)
+
+    async def scrape_one(company: str, executor) -> None:
+        # the slot is held until the result is queued, so a full queue pauses scraping
+        async with scrape_slots:
+            company, jobs, seconds, error = await loop.run_in_executor(
+                executor, scrape_company, company, COMPANY_JOB_FUNCTIONS[company].name)
+            print(f'\n>> Fetched jobs for {company.upper()} in {seconds:.1f}s')
+            if error:
+                print(f'   Error fetching jobs: {error}')
+                empty_companies.append(company)
+                return
+            update_duration(durations, company, seconds)
+            results = {}
+            _record_jobs(company, jobs, results, empty_companies)
+            if company in results:
+                await scraped.put((company, results[company]))
+
+    async def filter_worker() -> None:
+        while (item := await scraped.get()) is not None:
+            company, jobs = item
+            try:
+                kept = await process_company_jobs(company, jobs)
+                if kept:
+                    await filtered.put((company, kept))
+            except Exception as e:
+                print(f'   Error processing {company}: {e}')
+
+    async def batch_filter_worker() -> None:
+        done = False
+        while not done:
+            group = {}
+            # block for the first company, then linger briefly for more
+            while len(group) < queue_size:
+                try:
+                    item = await asyncio.wait_for(scraped.get(), timeout=BATCH_LINGER if group else None)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    done = True
+                    break
+                group[item[0]] = item[1]
+            if not group:
+                continue
+            try:
+                for company, kept in (await filter_companies_batched(group)).items():
+                    if kept:
+                        await filtered.put((company, kept))
+            except Exception as e:
+                print(f'   Error processing {", ".join(group)}: {e}')
+
+    async def store_worker() -> None:
+        # single writer thread for the job store
+        while (item := await filtered.get()) is not None:
+            company, kept = item
+            try:
+                await asyncio.to_thread(store_jobs, company, kept, buffer)
+            except Exception as e:
+                print(f'   Error storing {company}: {e}')
+
+    if batched:
+        filterers = [asyncio.create_task(batch_filter_worker())]
+    else:
+        filterers = [asyncio.create_task(filter_worker()) for _ in range(filter_concurrency)]
+    storer    = asyncio.create_task(store_worker())
 
+    try:
+        with scrape_executor(sharded, workers) as executor:
+            order = plan_order(list(COMPANY_JOB_FUNCTIONS), durations)
+            await asyncio.gather(*(scrape_one(company, executor) for company in order))
+    finally:
+        save_durations(durations)
+        for _ in filterers:
+            await scraped.put(None)
+        await asyncio.gather(*filterers)
+        await filtered.put(None)
+        await storer
 
-if __name__ == "__main__":
-    # Step 1: Collect all jobs SYNCHRONOUSLY (tool functions use asyncio.run internally)
-    print('=' * 50)
-    print('STEP 1: Collecting jobs from all companies')
-    print('=' * 50)
+    _report_run()
+    return empty_companies
 
-    all_jobs, empty_companies = collect_all_jobs()
 
-    if not all_jobs:
-        print('No jobs collected from any company!')
-    else:
-        # Step 2: Process jobs asynchronously
-        asyncio.run(process_all_jobs(all_jobs))
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="JobSeekerAgency simplified run")
+    parser.add_argument('--sharded', action='store_true',
+                        help='Spread the company scrapers across a process pool')
+    parser.add_argument('--workers', type=int, default=SCRAPE_WORKERS,
+                        help='Number of concurrent scrapers (processes when --sharded, default: CPU count)')
+    parser.add_argument('--filter-concurrency', type=int, default=FILTER_CONCURRENCY,
+                        help='Number of companies filtered by the LLM concurrently')
+    parser.add_argument('--batched', action='store_true',
+                        help='Filter many companies per LLM call, answering with job indices only')
+    parser.add_argument('--checkpoint-every', type=int, default=CHECKPOINT_COMPANIES,
+                        help='Commit buffered jobs to the store every N companies (0: once at the end)')
+    parser.add_argument('--barrier', action='store_true',
+                        help='Scrape every company first, then filter (no streaming pipeline)')
+    parser.add_argument('--no-csv', action='store_true',
+                        help='Do not export the job store to ./output/updated_joblist.csv')
+    args = parser.parse_args()
+
+    # jobs of all companies are journaled and committed in one transaction (or per checkpoint)
+    with RunBuffer(checkpoint_every=args.checkpoint_every or None) as buffer:
+        if args.barrier:
+            # Step 1: Collect all jobs SYNCHRONOUSLY (tool functions use asyncio.run internally)
+            print('=' * 50)
+            print('STEP 1: Collecting jobs from all companies')
+            print('=' * 50)
+
+            all_jobs, empty_companies = collect_all_jobs(sharded=args.sharded, workers=args.workers)
+
+            if not all_jobs:
+                print('No jobs collected from any company!')
+            else:
+                # Step 2: Process jobs asynchronously
+                llm_clients.run(process_all_jobs(all_jobs, concurrency=args.filter_concurrency, batched=args.batched,
+                                                 buffer=buffer))
+        else:
+            print('=' * 50)
+            print('Scraping, filtering and storing jobs (streaming)')
+            print('=' * 50)
+
+            empty_companies = llm_clients.run(run_pipeline(sharded=args.sharded, workers=args.workers,
+                                                           filter_concurrency=args.filter_concurrency, batched=args.batched,
+                                                           buffer=buffer))
+
+    # refresh the posting analytics with this run's jobs (see python/analytics.py)
+    try:
+        analytics.update()
+    except Exception as e:
+        print(f'   Error updating analytics: {e}')
 
     # Send email with today's jobs
     todate = datetime.today().strftime('%Y-%m-%d')
-    df = pd.read_csv('./output/updated_joblist.csv')
-    df_td = df.sort_values('date', ascending=False)
-    df_td = df_td[df_td['date'] == todate]
+    # indexed lookup of the jobs first seen today (see python/query.py)
+    df_td = jobs_on(todate)
+    if not args.no_csv:
+        export_joblist()
+    # near-duplicate postings listed together
+    df_td = group_near_duplicates(df_td)
 
     print(df_td)
 
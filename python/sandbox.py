@@ -0,0 +1,153 @@
+"""
+Sandboxed runs of generated scripts (code_eval in graph/nodes.py).
+
+Every evaluation gets its own temporary directory, so concurrent evaluations never
+share a file, and runs in its own process group under resource limits:
+
+    wall clock   WALL_TIMEOUT seconds, then the whole process group (browser included) is killed
+    CPU          CPU_SECONDS per process (RLIMIT_CPU)
+    memory       MEMORY_MB of data segment per process (RLIMIT_DATA; RLIMIT_AS would break
+                 Chromium, which reserves far more address space than it uses)
+    output       MAX_OUTPUT bytes kept per stream, the rest is drained and dropped (the warm
+                 worker of python/warm_eval.py, whose scripts write to files, also caps
+                 their size with RLIMIT_FSIZE)
+
+    python -m python.sandbox ./tmp/script.py --timeout 60
+"""
+import os
+import sys
+import time
+import signal
+import shutil
+import asyncio
+import tempfile
+from dataclasses import dataclass
+from functools import partial
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits, only the wall-clock timeout applies
+    resource = None
+
+WALL_TIMEOUT = 120        # seconds
+CPU_SECONDS  = 60         # CPU seconds per process
+MEMORY_MB    = 2048       # data segment per process
+MAX_OUTPUT   = 1_000_000  # bytes kept of stdout and of stderr
+CHUNK        = 65536
+
+
+@dataclass(slots=True)
+class SandboxResult:
+    """Outcome of one sandboxed run."""
+    returncode: int
+    stdout:     str
+    stderr:     str
+    seconds:    float
+    timed_out:  bool = False
+    truncated:  bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not self.timed_out
+
+
+def apply_limits(cpu_seconds: int = CPU_SECONDS, memory_mb: int = MEMORY_MB, file_bytes: int = 0) -> None:
+    """Set the CPU, memory and (if given) file size rlimits of the current process (no-op without rlimits)."""
+    if resource is None:
+        return
+    if cpu_seconds:
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 5))
+    if memory_mb:
+        resource.setrlimit(resource.RLIMIT_DATA, (memory_mb << 20, memory_mb << 20))
+    if file_bytes:
+        resource.setrlimit(resource.RLIMIT_FSIZE, (file_bytes, file_bytes))
+
+
+def _limits(cpu_seconds: int, memory_mb: int):
+    """preexec_fn applying the rlimits in the child."""
+    return partial(apply_limits, cpu_seconds, memory_mb) if resource is not None else None
+
+
+def limit_note(returncode: int, timed_out: bool, timeout: float, cpu_seconds: int, max_output: int = MAX_OUTPUT) -> str:
+    """Line appended to stderr when a run was stopped by the sandbox (shown to the code evaluator)."""
+    if timed_out:
+        return f'\n[sandbox] killed after {timeout:.0f}s wall clock'
+    if returncode == -getattr(signal, 'SIGXCPU', 0):
+        return f'\n[sandbox] CPU limit of {cpu_seconds}s exceeded'
+    if returncode == -getattr(signal, 'SIGXFSZ', 0):
+        return f'\n[sandbox] output limit of {max_output} bytes exceeded'
+    return ''
+
+
+async def _drain(stream: asyncio.StreamReader, limit: int, out: bytearray) -> bool:
+    """Read a stream to its end, keeping the first `limit` bytes; True if some output was dropped."""
+    dropped = False
+    while chunk := await stream.read(CHUNK):
+        room = limit - len(out)
+        if room > 0:
+            out += chunk[:room]
+        dropped |= len(chunk) > room
+    return dropped
+
+
+def _kill(proc) -> None:
+    """Kill the process group of the script (or the script alone where there are no groups)."""
+    try:
+        if hasattr(os, 'killpg'):
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+async def run_code(code: str, timeout: float = WALL_TIMEOUT, cpu_seconds: int = CPU_SECONDS,
+                   memory_mb: int = MEMORY_MB, max_output: int = MAX_OUTPUT) -> SandboxResult:
+    """Run a Python script in a fresh temporary directory under the sandbox limits."""
+    workdir = tempfile.mkdtemp(prefix='jsa_eval_')
+    start   = time.perf_counter()
+    try:
+        with open(os.path.join(workdir, 'script.py'), 'w') as f:
+            f.write(code)
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, 'script.py', cwd=workdir,
+            stdin=asyncio.subprocess.DEVNULL, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+            start_new_session=True, preexec_fn=_limits(cpu_seconds, memory_mb))
+        stdout, stderr = bytearray(), bytearray()
+        readers = asyncio.gather(_drain(proc.stdout, max_output, stdout), _drain(proc.stderr, max_output, stderr))
+        timed_out = False
+        try:
+            await asyncio.wait_for(proc.wait(), timeout)
+        except asyncio.TimeoutError:
+            timed_out = True
+            _kill(proc)
+            await proc.wait()
+        try:
+            truncated = any(await asyncio.wait_for(readers, 5))
+        except asyncio.TimeoutError:
+            # a detached grandchild still holds the pipes: keep what was read
+            readers.cancel()
+            truncated = True
+        _kill(proc)  # leftovers of the group (e.g. a browser the script did not close)
+
+        err = stderr.decode(errors='replace') + limit_note(proc.returncode, timed_out, timeout, cpu_seconds)
+        return SandboxResult(proc.returncode, stdout.decode(errors='replace'), err,
+                             time.perf_counter() - start, timed_out, truncated)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Run a script in the code_eval sandbox')
+    parser.add_argument('script', help='Python script to run')
+    parser.add_argument('--timeout', type=float, default=WALL_TIMEOUT, help='Wall-clock limit in seconds')
+    args = parser.parse_args()
+
+    with open(args.script) as f:
+        result = asyncio.run(run_code(f.read(), timeout=args.timeout))
+    print(result.stdout)
+    print(result.stderr, file=sys.stderr)
+    print(f'>> exit {result.returncode} in {result.seconds:.1f}s' + (' (timed out)' if result.timed_out else '')
+          + (' (output truncated)' if result.truncated else ''))
@@ -15,12 +15,18 @@ sys.path.append('../keys')
 os.chdir(PROJECT_ROOT)
 
 import json
-import re
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from playwright.sync_api import sync_playwright
 
 ## Custom scripts:
 import Constants as C
+from python.llm_cache import get_llm_cache
+from python import cascade
+from python.cascade import ModelCascade
+from python import llm_clients
+from python.llm_clients import openai_client
 
 os.environ['OPENAI_API_KEY'] = C.OPENAI_API_KEY
 
@@ -29,28 +35,37 @@ BNF_LOGIN_URL = "https://bnf.tocco.ch/en/Project-Database"
 BNF_BASE_URL = "https://bnf.tocco.ch"
 
 BATCH_SIZE_TRANSLATE = 50  # Larger batches for translation (shorter messages)
-BATCH_SIZE_FLAG = 20  # Smaller batches for flagging (longer messages)
 MAX_RETRIES = 3
 RETRY_DELAY = 5  # seconds
 BATCH_DELAY = 1  # seconds between batches to avoid rate limiting
+BNF_MODEL = 'gpt-5.2-2025-12-11'  # use latest available model
 
+TRANSLATE_PROMPT = """You are a translator. Translate job/project titles to English.
+Return ONLY a JSON array of translated strings, in the same order as the input.
+Keep technical terms and proper nouns as-is. If already in English, return as-is.
+Example input: ["Analyse du microbiote humain", "AI Consulting Engineer"]
+Example output: ["Human microbiome analysis", "AI Consulting Engineer"]"""
 
-def call_openai_direct(messages: list[dict], max_retries: int = MAX_RETRIES) -> str | None:
-    """Call OpenAI API directly with explicit timeout."""
-    from openai import OpenAI
-    import httpx
+FLAG_CRITERIA = """You are a job classifier. A job title is relevant if it is related to:
+- Machine Learning / AI / Deep Learning
+- Data Science / Data Analysis
+- Cheminformatics
+- Computational Assisted Drug Discovery (CADD)
+- Computational Chemistry / Molecular Modeling"""
+
+# Relevance flags go through the model cascade (see python/cascade.py)
+FLAG_CASCADE = ModelCascade(FLAG_CRITERIA)
 
-    # Create client with explicit timeout
-    client = OpenAI(
-        api_key=os.environ['OPENAI_API_KEY'],
-        timeout=httpx.Timeout(60.0, connect=10.0)
-    )
+
+def call_openai_direct(messages: list[dict], max_retries: int = MAX_RETRIES) -> str | None:
+    """Call OpenAI API directly (shared pooled client, see python/llm_clients.py)."""
+    client = openai_client()
 
     for attempt in range(max_retries):
         try:
             # print(f"      Calling OpenAI API (attempt {attempt + 1}/{max_retries})...")
             response = client.chat.completions.create(
-                model='gpt-5.2-2025-12-11', # use latest available model
+                model=BNF_MODEL,
                 messages=messages,
                 temperature=0)
             # print(f"      Got response!")
@@ -67,25 +82,30 @@ def call_openai_direct(messages: list[dict], max_retries: int = MAX_RETRIES) ->
 
 
 def translate_job_names(jobs: list[dict]) -> list[dict]:
-    """Translate job names to English using LLM."""
+    """Translate job names to English using LLM (cached translations are reused)."""
     print("\n>> Translating job names to English...")
 
+    # Reuse cached translations, only send the rest to the LLM
+    cache = get_llm_cache()
+    cached = cache.lookup('translation', [job['name'] for job in jobs], 'bnf', TRANSLATE_PROMPT, BNF_MODEL)
+    for job in jobs:
+        if job['name'] in cached:
+            job['name_en'] = cached[job['name']]
+    pending = [job for job in jobs if job['name'] not in cached]
+    print(f"   {len(jobs) - len(pending)} cached translations, {len(pending)} to translate")
+
     # Process in batches
-    for i in range(0, len(jobs), BATCH_SIZE_TRANSLATE):
-        batch = jobs[i:i + BATCH_SIZE_TRANSLATE]
+    for i in range(0, len(pending), BATCH_SIZE_TRANSLATE):
+        batch = pending[i:i + BATCH_SIZE_TRANSLATE]
         batch_num = i // BATCH_SIZE_TRANSLATE + 1
-        total_batches = (len(jobs) + BATCH_SIZE_TRANSLATE - 1) // BATCH_SIZE_TRANSLATE
+        total_batches = (len(pending) + BATCH_SIZE_TRANSLATE - 1) // BATCH_SIZE_TRANSLATE
         print(f"   Processing batch {batch_num}/{total_batches}...")
 
         # Create list of names to translate
         names_to_translate = [job['name'] for job in batch]
 
         messages = [
-            {"role": "system", "content": """You are a translator. Translate job/project titles to English.
-Return ONLY a JSON array of translated strings, in the same order as the input.
-Keep technical terms and proper nouns as-is. If already in English, return as-is.
-Example input: ["Analyse du microbiote humain", "AI Consulting Engineer"]
-Example output: ["Human microbiome analysis", "AI Consulting Engineer"]"""},
+            {"role": "system", "content": TRANSLATE_PROMPT},
             {"role": "user", "content": json.dumps(names_to_translate, ensure_ascii=False)}
         ]
 
@@ -98,6 +118,9 @@ Example output: ["Human microbiome analysis", "AI Consulting Engineer"]"""},
                 for j, translation in enumerate(translations):
                     if j < len(batch):
                         batch[j]['name_en'] = translation
+                # Only cache complete, well-aligned batches
+                if len(translations) == len(batch):
+                    cache.store('translation', {job['name']: job['name_en'] for job in batch}, 'bnf', TRANSLATE_PROMPT, BNF_MODEL)
             except json.JSONDecodeError as e:
                 print(f"   JSON parse error in batch {batch_num}: {e}")
                 for job in batch:
@@ -108,72 +131,49 @@ Example output: ["Human microbiome analysis", "AI Consulting Engineer"]"""},
                 job['name_en'] = job['name']
 
         # Delay between batches to avoid rate limiting
-        if i + BATCH_SIZE_TRANSLATE < len(jobs):
+        if i + BATCH_SIZE_TRANSLATE < len(pending):
             time.sleep(BATCH_DELAY)
 
     return jobs
 
 
-def flag_relevant_jobs(jobs: list[dict]) -> list[dict]:
+async def flag_relevant_jobs_async(jobs: list[dict]) -> list[dict]:
     """Flag jobs as relevant (1) or not (0) based on ML/AI/Data Science/Cheminformatics/CADD/Comp Chem."""
     print("\n>> Flagging relevant jobs...")
 
-    # Process in smaller batches (flagging sends more data per job)
-    for i in range(0, len(jobs), BATCH_SIZE_FLAG):
-        batch = jobs[i:i + BATCH_SIZE_FLAG]
-        batch_num = i // BATCH_SIZE_FLAG + 1
-        total_batches = (len(jobs) + BATCH_SIZE_FLAG - 1) // BATCH_SIZE_FLAG
-        print(f"   Processing batch {batch_num}/{total_batches}...")
-
-        # Create list of job info for relevance check (just name for smaller payload)
-        job_names = [job.get('name_en', job['name']) for job in batch]
-
-        messages = [
-            {"role": "system", "content": """You are a job classifier. For each job title, return 1 if relevant to:
-- Machine Learning / AI / Deep Learning
-- Data Science / Data Analysis
-- Cheminformatics
-- Computational Assisted Drug Discovery (CADD)
-- Computational Chemistry / Molecular Modeling
-
-Return ONLY a JSON array of 1s and 0s. Example: [1, 0, 1, 0, 1]"""},
-            {"role": "user", "content": json.dumps(job_names, ensure_ascii=False)}
-        ]
-
-        content = call_openai_direct(messages)
+    # Reuse cached verdicts, only send the rest to the LLM (no keyword rules nor local model: python/prefilter.py
+    # and python/relevance_model.py encode the job filter's criteria, not FLAG_CRITERIA)
+    cache = get_llm_cache()
+    cached = cache.lookup('relevance', [job.get('name_en', job['name']) for job in jobs], 'bnf', FLAG_CASCADE.prompt, FLAG_CASCADE.name)
+    for job in jobs:
+        if job.get('name_en', job['name']) in cached:
+            job['relevant'] = int(cached[job.get('name_en', job['name'])])
+    pending = [job for job in jobs if job.get('name_en', job['name']) not in cached]
+    print(f"   {len(jobs) - len(pending)} cached verdicts, {len(pending)} to flag")
+
+    # Cheap model first, uncertain titles escalated to the large one
+    job_names = [job.get('name_en', job['name']) for job in pending]
+    verdicts  = await FLAG_CASCADE.decide(job_names)
+    for job, verdict in zip(pending, verdicts):
+        # failed calls are marked as not relevant (and not cached)
+        job['relevant'] = int(bool(verdict))
+    cache.store('relevance', {name: int(v) for name, v in zip(job_names, verdicts) if v is not None},
+                'bnf', FLAG_CASCADE.prompt, FLAG_CASCADE.name)
 
-        if content:
-            try:
-                # Parse the response - handle potential formatting issues
-                content = content.strip()
-                if content.startswith('['):
-                    flags = json.loads(content)
-                else:
-                    # Try to extract array from response
-                    match = re.search(r'\[[\d,\s]+\]', content)
-                    if match:
-                        flags = json.loads(match.group())
-                    else:
-                        flags = [0] * len(batch)
-
-                # Update jobs with relevance flags
-                for j, flag in enumerate(flags):
-                    if j < len(batch):
-                        batch[j]['relevant'] = int(flag)
-            except json.JSONDecodeError as e:
-                print(f"   JSON parse error in batch {batch_num}: {e}")
-                for job in batch:
-                    job['relevant'] = 0
-        else:
-            print(f"   Failed to get flags for batch {batch_num}, marking as not relevant")
-            for job in batch:
-                job['relevant'] = 0
+    return jobs
 
-        # Delay between batches to avoid rate limiting
-        if i + BATCH_SIZE_FLAG < len(jobs):
-            time.sleep(BATCH_DELAY)
 
-    return jobs
+def flag_relevant_jobs(jobs: list[dict]) -> list[dict]:
+    """
+    Blocking flag_relevant_jobs_async (await that one from async code). Inside a running event
+    loop (e.g. a notebook) the cascade runs on its own loop in a worker thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return llm_clients.run(flag_relevant_jobs_async(jobs))
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(llm_clients.run, flag_relevant_jobs_async(jobs)).result()
 
 
 def scrape_bnf_jobs() -> list[dict]:
@@ -415,6 +415,8 @@ if __name__ == "__main__":
     jobs = process_bnf_jobs(skip_scrape=skip_scrape, skip_translate=skip_translate)
 
     print(f"\nTotal projects found: {len(jobs)}")
+    print(cascade.report())
+    print(get_llm_cache().report())
 
     # Count relevant jobs
     relevant_count = sum(1 for job in jobs if job.get('relevant', 0) == 1)
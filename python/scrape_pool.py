@@ -0,0 +1,103 @@
+"""
+Sharded execution of the company scrapers across a process pool.
+
+Each worker process runs one scraper at a time, so every worker drives a single
+Chromium instance and does its own BeautifulSoup parsing on its own core.
+Companies are submitted longest-first using their historical scrape duration,
+which makes the pool's first-free-worker dispatch a greedy LPT schedule.
+"""
+import os
+import json
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Iterator
+
+DURATIONS_FILE   = './output/scrape_durations.json'
+DEFAULT_DURATION = 30.0  # seconds, assumed for companies never timed before
+DURATION_ALPHA   = 0.3   # weight of the newest run in the moving average
+SCRAPE_WORKERS   = os.cpu_count() or 4
+
+
+def load_durations(path: str = DURATIONS_FILE) -> dict[str, float]:
+    """Load the per-company scrape durations (seconds) recorded by previous runs."""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_durations(durations: dict[str, float], path: str = DURATIONS_FILE) -> None:
+    """Persist the per-company scrape durations."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(durations, f, indent=2, sort_keys=True)
+
+
+def update_duration(durations: dict[str, float], company: str, seconds: float) -> None:
+    """Fold a new measurement into the company's exponential moving average."""
+    previous = durations.get(company)
+    if previous is None:
+        durations[company] = round(seconds, 2)
+    else:
+        durations[company] = round(DURATION_ALPHA * seconds + (1 - DURATION_ALPHA) * previous, 2)
+
+
+def plan_order(companies: list[str], durations: dict[str, float]) -> list[str]:
+    """Order companies longest expected scrape first (LPT scheduling)."""
+    return sorted(companies, key=lambda c: durations.get(c, DEFAULT_DURATION), reverse=True)
+
+
+def _init_worker() -> None:
+    """Worker initializer: each worker already owns a core, so parse HTML on threads, not a nested pool."""
+    import python.tools as tools
+    tools.set_parse_executor('thread')
+
+
+def scrape_company(company: str, tool_name: str) -> tuple[str, list | None, float, str | None]:
+    """Worker entry point: run one registered scraper and return (company, JobRecords, seconds, error)."""
+    import python.tools as tools
+
+    start = time.perf_counter()
+    try:
+        jobs  = tools.JOB_SCRAPERS[tool_name]()
+        error = None
+    except Exception as e:
+        jobs  = None
+        error = f'{type(e).__name__}: {e}'
+    return company, jobs, time.perf_counter() - start, error
+
+
+def scrape_executor(sharded: bool, workers: int = SCRAPE_WORKERS):
+    """Executor for scrape_company: a process pool when sharded, otherwise a thread pool."""
+    if sharded:
+        # spawn: run_pipeline creates the pool from a running event loop with parse, governor and
+        # HTTP threads, and forking a multithreaded process can deadlock on inherited locks
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                   mp_context=multiprocessing.get_context('spawn'))
+    # tools call asyncio.run() internally, so each one needs its own thread (and event loop)
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scrape')
+
+
+def iter_sharded_jobs(company_funcs: dict, workers: int = SCRAPE_WORKERS) -> Iterator[tuple[str, list | None, float, str | None]]:
+    """
+    Run the scrapers in `company_funcs` (company -> tool) on a process pool.
+    Yields (company, jobs, seconds, error) as soon as each company finishes,
+    and updates the duration history used to balance the next run.
+    """
+    durations = load_durations()
+    order     = plan_order(list(company_funcs), durations)
+    workers   = max(1, min(workers, len(order)))
+    print(f'>> Sharding {len(order)} companies across {workers} worker processes')
+
+    try:
+        with scrape_executor(sharded=True, workers=workers) as pool:
+            futures = [pool.submit(scrape_company, company, company_funcs[company].name) for company in order]
+            for future in as_completed(futures):
+                company, jobs, seconds, error = future.result()
+                if error is None:
+                    update_duration(durations, company, seconds)
+                yield company, jobs, seconds, error
+    finally:
+        save_durations(durations)
@@ -2,6 +2,10 @@ import asyncio
 import re
 import json
 import os
+import functools
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 from playwright.async_api import async_playwright
@@ -9,6 +13,8 @@ from langchain.tools import tool
 import requests
 from collections import Counter
 
+from python.records import JobRecord, to_records, records_to_json
+
 # Load company career page URLs from JSON file
 def _load_career_urls() -> dict:
     """Load company to career page URL mapping from JSON file."""
@@ -26,27 +32,82 @@ def _load_career_urls() -> dict:
 
 COMPANY_URLS = _load_career_urls()
 
+# The BeautifulSoup parse/extract step of every tool runs on this executor so the
+# event loop keeps driving page navigations while HTML is parsed.
+# 'thread' (default) parses in a thread pool; 'process' (JSA_PARSE_EXECUTOR=process)
+# parses on spare cores in spawned worker processes, each of which re-imports the
+# entry script, so it is opt-in and does not work from a notebook.
+PARSE_EXECUTOR_KIND = os.environ.get('JSA_PARSE_EXECUTOR', 'thread')
+PARSE_WORKERS = os.cpu_count() or 4
+_parse_executor = None
+_parse_executor_lock = threading.Lock()  # scrape threads ask for the executor concurrently
+
+
+def set_parse_executor(kind: str) -> None:
+    """Switch the parse executor between 'process' and 'thread' (takes effect on the next parse)."""
+    global PARSE_EXECUTOR_KIND, _parse_executor
+    if kind not in ('process', 'thread'):
+        raise ValueError(f"unknown parse executor kind: {kind}")
+    with _parse_executor_lock:
+        if kind != PARSE_EXECUTOR_KIND and _parse_executor is not None:
+            _parse_executor.shutdown(wait=False)
+            _parse_executor = None
+        PARSE_EXECUTOR_KIND = kind
+
+
+def _get_parse_executor():
+    """Lazily create the shared parse executor (once, whichever thread asks first)."""
+    global _parse_executor
+    with _parse_executor_lock:
+        if _parse_executor is None:
+            if PARSE_EXECUTOR_KIND == 'process':
+                # spawn: forking a process that already runs Playwright/event-loop threads is unsafe
+                _parse_executor = ProcessPoolExecutor(max_workers=PARSE_WORKERS, mp_context=multiprocessing.get_context('spawn'))
+            else:
+                _parse_executor = ThreadPoolExecutor(max_workers=PARSE_WORKERS, thread_name_prefix='parse')
+        return _parse_executor
+
+
+def _run_parser(parser, raw_html: bytes, base_url: str) -> list[tuple]:
+    """Executor entry point: parse raw HTML bytes and return compact (title, url, date) tuples."""
+    jobs = parser(raw_html.decode('utf-8', errors='replace'), base_url)
+    return [(job[0], job[1], job[2] if len(job) > 2 else None) for job in jobs]
+
+
+async def _parse_off_loop(parser, html: str, base_url: str) -> list[tuple]:
+    """Run a module-level `parser(html, base_url)` on the parse executor without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_parse_executor(), _run_parser, parser, html.encode('utf-8'), base_url)
+
+
+JOB_SCRAPERS = {}  # tool name -> scraper returning a list of JobRecord
 
-def _jobs_to_json(jobs: list) -> str:
+
+def job_tool(func):
     """
-    Convert a list of job tuples/dicts to JSON format.
-    Accepts either:
-    - List of (name, url) tuples
-    - List of dicts with 'name'/'title' and 'url' keys
-    Returns JSON string: {"jobs": [{"name": "...", "url": "..."}, ...]}
+    Register a company scraper returning (name, url[, date]) tuples or job dicts.
+    The plain scraper, returning JobRecords, goes into JOB_SCRAPERS for the pipelines;
+    the returned LangChain tool serializes the same records to the {"jobs": [...]} JSON
+    the LLM agents expect, so JSON is only produced at the tool boundary.
     """
-    job_list = []
-    for job in jobs:
-        if isinstance(job, tuple):
-            name, url = job[0], job[1]
-        elif isinstance(job, dict):
-            name = job.get('name') or job.get('title', '')
-            url = job.get('url', '')
-        else:
-            continue
-        if name and url:
-            job_list.append({"name": name, "url": url})
-    return json.dumps({"jobs": job_list})
+    company = func.__name__.removeprefix('get_').removesuffix('_jobs').lower()
+
+    @functools.wraps(func)
+    def scrape() -> list[JobRecord]:
+        return to_records(func(), company)
+
+    @functools.wraps(func)
+    def as_json() -> str:
+        return records_to_json(scrape())
+
+    JOB_SCRAPERS[func.__name__] = scrape
+    return tool(as_json)
+
+
+def scraper_for(company: str) -> str | None:
+    """Name of the scraper registered for a company (e.g. 'Roche' -> 'get_ROCHE_jobs'), or None."""
+    name = f"get_{re.sub(r'[^A-Za-z0-9]', '', company or '').upper()}_jobs"
+    return name if name in JOB_SCRAPERS else None
 
 @tool
 def get_summary_html(url: str) -> str:
@@ -131,119 +192,119 @@ def get_summary_html(url: str) -> str:
     
     return html_summary
 
-@tool
-def get_NOVARTIS_jobs() -> str:
-    """
-    This tool function helps you get NOVARTIS current job list
-    """
-    URL = COMPANY_URLS.get("NOVARTIS", "https://www.novartis.com/careers/career-search?search_api_fulltext=data&country%5B0%5D=LOC_CH&field_job_posted_date=All&op=Submit&page=0")
+# NOVARTIS parsing helpers (module level so they can run on the parse executor)
+def _norm(text: str) -> str:
+    return " ".join((text or "").split())
 
 
-    def _norm(text: str) -> str:
-        return " ".join((text or "").split())
-    
-    
-    def _has_digit(s: str) -> bool:
-        return any(ch.isdigit() for ch in s)
-    
-    
-    def _is_bad_label(s: str) -> bool:
-        t = s.strip().lower()
-        return t in {"date posted", "hide lower priority columns"} or t.startswith("hide lower priority")
-    
-    
-    def _extract_date(container) -> str or None:
-        # 1) Prefer a <time> tag with digits
-        for t in container.find_all("time"):
-            val = t.get("datetime") or _norm(t.get_text())
+def _has_digit(s: str) -> bool:
+    return any(ch.isdigit() for ch in s)
+
+
+def _is_bad_label(s: str) -> bool:
+    t = s.strip().lower()
+    return t in {"date posted", "hide lower priority columns"} or t.startswith("hide lower priority")
+
+
+def _extract_date(container) -> str or None:
+    # 1) Prefer a <time> tag with digits
+    for t in container.find_all("time"):
+        val = t.get("datetime") or _norm(t.get_text())
+        if val and _has_digit(val) and not _is_bad_label(val):
+            return val
+
+    # 2) Cells marked as Date Posted via attributes/classes
+    selectors = [
+        '[data-label*="Date"]',
+        '[data-title*="Date"]',
+        '[aria-label*="Date"]',
+        '[class*="date"]',
+        '[class*="posted"]',
+        '.views-field-field-job-posted-date',
+    ]
+    for sel in selectors:
+        for el in container.select(sel):
+            val = _norm(el.get_text())
             if val and _has_digit(val) and not _is_bad_label(val):
                 return val
-    
-        # 2) Cells marked as Date Posted via attributes/classes
-        selectors = [
-            '[data-label*="Date"]',
-            '[data-title*="Date"]',
-            '[aria-label*="Date"]',
-            '[class*="date"]',
-            '[class*="posted"]',
-            '.views-field-field-job-posted-date',
-        ]
-        for sel in selectors:
-            for el in container.select(sel):
-                val = _norm(el.get_text())
-                if val and _has_digit(val) and not _is_bad_label(val):
-                    return val
-    
-        # 3) If it's a table row, try the last cell(s)
-        if container.name == "tr":
-            tds = container.find_all("td")
-            for td in reversed(tds[-3:]):  # check last few cells
-                val = _norm(td.get_text())
-                if val and _has_digit(val) and not _is_bad_label(val):
-                    return val
-    
-        # 4) Lookup label "Date Posted" then grab the next meaningful text with digits
-        for el in container.find_all(True):
-            txt = _norm(el.get_text())
-            if txt.lower() == "date posted":
-                # check siblings and next elements
-                sibs = [el.find_next_sibling(), el.find_next()]
-                for s in sibs:
-                    if not s:
-                        continue
-                    val = _norm(getattr(s, "get_text", lambda: "")())
-                    if val and _has_digit(val) and not _is_bad_label(val):
-                        return val
-    
-        # 5) Fallback: regex for date-like patterns within the container
-        txt = " ".join(container.stripped_strings)
-        m = re.search(
-            r"(\b\d{4}-\d{2}-\d{2}\b|"
-            r"\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|"
-            r"Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2},?\s+\d{4}\b|"
-            r"\b\d{1,2}\s+(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|"
-            r"Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{4}\b|"
-            r"\b\d{1,2}/\d{1,2}/\d{2,4}\b)",
-            txt,
-            flags=re.I,
-        )
-        if m:
-            val = _norm(m.group(1))
+
+    # 3) If it's a table row, try the last cell(s)
+    if container.name == "tr":
+        tds = container.find_all("td")
+        for td in reversed(tds[-3:]):  # check last few cells
+            val = _norm(td.get_text())
             if val and _has_digit(val) and not _is_bad_label(val):
                 return val
-    
-        return None
-    
-    
-    def extract_jobs(html: str, base_url: str):
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = {}
-    
-        for a in soup.select('a[href*="/careers/career-search/job/details/"]'):
-            href = a.get("href")
-            if not href:
-                continue
-            url = urljoin(base_url, href)
-            title = _norm(a.get_text())
-            if not title or title.lower() in {"apply", "learn more"}:
-                # Try a heading in the same container
-                container = a.find_parent(["tr", "article", "li", "div"])
-                if container:
-                    h = container.find(re.compile(r"^h[1-6]$"))
-                    if h:
-                        title = _norm(h.get_text())
-            if not title or title.lower() in {"apply", "learn more"}:
-                continue
-    
-            # Prefer table row as container; fallback to nearest block
-            container = a.find_parent("tr") or a.find_parent(["article", "li", "div"])
-            date_text = _extract_date(container) if container else None
-    
-            jobs[url] = {"title": title, "url": url, "date": date_text if date_text else None}
-    
-        return list(jobs.values())
-    
-    
+
+    # 4) Lookup label "Date Posted" then grab the next meaningful text with digits
+    for el in container.find_all(True):
+        txt = _norm(el.get_text())
+        if txt.lower() == "date posted":
+            # check siblings and next elements
+            sibs = [el.find_next_sibling(), el.find_next()]
+            for s in sibs:
+                if not s:
+                    continue
+                val = _norm(getattr(s, "get_text", lambda: "")())
+                if val and _has_digit(val) and not _is_bad_label(val):
+                    return val
+
+    # 5) Fallback: regex for date-like patterns within the container
+    txt = " ".join(container.stripped_strings)
+    m = re.search(
+        r"(\b\d{4}-\d{2}-\d{2}\b|"
+        r"\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|"
+        r"Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2},?\s+\d{4}\b|"
+        r"\b\d{1,2}\s+(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|"
+        r"Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{4}\b|"
+        r"\b\d{1,2}/\d{1,2}/\d{2,4}\b)",
+        txt,
+        flags=re.I,
+    )
+    if m:
+        val = _norm(m.group(1))
+        if val and _has_digit(val) and not _is_bad_label(val):
+            return val
+
+    return None
+
+
+def _parse_NOVARTIS(html: str, base_url: str) -> list[tuple]:
+    """Parse the NOVARTIS career page HTML into (title, url, date) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = {}
+
+    for a in soup.select('a[href*="/careers/career-search/job/details/"]'):
+        href = a.get("href")
+        if not href:
+            continue
+        url = urljoin(base_url, href)
+        title = _norm(a.get_text())
+        if not title or title.lower() in {"apply", "learn more"}:
+            # Try a heading in the same container
+            container = a.find_parent(["tr", "article", "li", "div"])
+            if container:
+                h = container.find(re.compile(r"^h[1-6]$"))
+                if h:
+                    title = _norm(h.get_text())
+        if not title or title.lower() in {"apply", "learn more"}:
+            continue
+
+        # Prefer table row as container; fallback to nearest block
+        container = a.find_parent("tr") or a.find_parent(["article", "li", "div"])
+        date_text = _extract_date(container) if container else None
+
+        jobs[url] = (title, url, date_text if date_text else None)
+
+    return list(jobs.values())
+
+@job_tool
+def get_NOVARTIS_jobs() -> list:
+    """
+    This tool function helps you get NOVARTIS current job list
+    """
+    URL = COMPANY_URLS.get("NOVARTIS", "https://www.novartis.com/careers/career-search?search_api_fulltext=data&country%5B0%5D=LOC_CH&field_job_posted_date=All&op=Submit&page=0")
+
     async def main():
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
@@ -260,16 +321,37 @@ def get_NOVARTIS_jobs() -> str:
                     pass
     
             html = await page.content()
-            jobs = extract_jobs(html, URL)
             await browser.close()
-            return jobs
+            return await _parse_off_loop(_parse_NOVARTIS, html, URL)
 
     ## MAIN ##
     jobs = asyncio.run(main())
-    return _jobs_to_json(jobs)
+    return jobs
+
+def _parse_AWS(html: str, base_url: str) -> list[tuple]:
+    """Parse the AWS career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    links = soup.select("a[href*='/jobs/'], a[href*='/job/']")
+    seen = set()
+    jobs = []
+    for a in links:
+        href = a.get("href") or ""
+        if not href:
+            continue
+        full = urljoin(base_url, href)
+        if full in seen:
+            continue
+        title = a.get_text(strip=True)
+        if not title:
+            continue
+        if "job" not in full and "jobs" not in full:
+            continue
+        seen.add(full)
+        jobs.append((title, full))
+    return jobs
 
-@tool
-def get_AWS_jobs() -> str:
+@job_tool
+def get_AWS_jobs() -> list:
     """
     This tool function helps you get AWS current job list
     """
@@ -298,31 +380,26 @@ def get_AWS_jobs() -> str:
                 pass
             html = await page.content()
             await browser.close()
-        soup = BeautifulSoup(html, "html.parser")
-        links = soup.select("a[href*='/jobs/'], a[href*='/job/']")
-        seen = set()
-        jobs = []
-        for a in links:
-            href = a.get("href") or ""
-            if not href:
-                continue
-            full = urljoin(url, href)
-            if full in seen:
-                continue
-            title = a.get_text(strip=True)
-            if not title:
-                continue
-            if "job" not in full and "jobs" not in full:
-                continue
-            seen.add(full)
-            jobs.append((title, full))
-        return jobs
+        return await _parse_off_loop(_parse_AWS, html, url)
 
     jobs = asyncio.run(list_jobs(URL))
-    return _jobs_to_json(jobs)
+    return jobs
+
+def _parse_YPSOMED(html: str, base_url: str) -> list[tuple]:
+    """Fallback parse of the YPSOMED career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, 'html.parser')
+    all_links = soup.find_all('a', href=True)
+    jobs = []
+    for link in all_links:
+        href = link.get('href', '')
+        if 'job' in href.lower() and len(link.get_text(strip=True)) > 5:
+            title = link.get_text(strip=True)
+            full_link = href if href.startswith('http') else 'https://careers.ypsomed.com' + href
+            jobs.append((title, full_link))
+    return jobs
 
-@tool
-def get_YPSOMED_jobs():
+@job_tool
+def get_YPSOMED_jobs() -> list:
     """This tool function helps you get YPSOMED current job list"""
     URL = COMPANY_URLS.get("YPSOMED", "https://careers.ypsomed.com/ypsomed/en/professional/")
 
@@ -361,18 +438,7 @@ def get_YPSOMED_jobs():
             await browser.close()
             
             if not jobs_data:
-                soup = BeautifulSoup(content, 'html.parser')
-                all_links = soup.find_all('a', href=True)
-                jobs_data = []
-                for link in all_links:
-                    href = link.get('href', '')
-                    if 'job' in href.lower() and len(link.get_text(strip=True)) > 5:
-                        title = link.get_text(strip=True)
-                        full_link = href if href.startswith('http') else 'https://careers.ypsomed.com' + href
-                        jobs_data.append({'title': title, 'link': full_link, 'location': ''})
-            
-            if not jobs_data:
-                return _jobs_to_json([])
+                return await _parse_off_loop(_parse_YPSOMED, content, URL)
 
             # Convert to standard format
             jobs = [(job.get('title', ''), job.get('link', '')) for job in jobs_data]
@@ -381,10 +447,63 @@ def get_YPSOMED_jobs():
     jobs = asyncio.run(get_ypsomed_jobs())
     if isinstance(jobs, str):  # Error message
         return jobs
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_VISIUM_jobs():
+def _parse_VISIUM(html: str, base_url: str) -> list[tuple]:
+    """Parse the VISIUM career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, 'html.parser')
+
+    jobs = []
+    seen = set()
+
+    open_positions_section = soup.find(id=lambda x: x and 'open-position' in x.lower()) or soup.find(class_=lambda x: x and any(term in str(x).lower() for term in ['open-position', 'job-list', 'career-list', 'position-list']))
+
+    if open_positions_section:
+        job_elements = open_positions_section.find_all(['a', 'div', 'li'], recursive=True)
+
+        for elem in job_elements:
+            text = elem.get_text(strip=True)
+
+            if 15 < len(text) < 150 and not any(skip in text.lower() for skip in ['view open position', 'explore benefit', 'apply now', 'learn more', 'read more', 'click here']):
+                link = ''
+                if elem.name == 'a':
+                    link = elem.get('href', '')
+                else:
+                    link_elem = elem.find('a', recursive=False)
+                    if link_elem:
+                        link = link_elem.get('href', '')
+
+                if link and not link.startswith('http'):
+                    if link.startswith('/'):
+                        link = 'https://www.visium.com' + link
+                    else:
+                        link = 'https://www.visium.com/' + link
+
+                if link and ('job' in link.lower() or 'career' in link.lower() or 'position' in link.lower()):
+                    if link not in seen:
+                        seen.add(link)
+                        jobs.append((text, link))
+
+    if not jobs:
+        all_links = soup.find_all('a', href=True)
+        for link_elem in all_links:
+            href = link_elem.get('href', '')
+            if any(term in href.lower() for term in ['greenhouse', 'lever', 'workday', 'bamboohr', 'job', 'career', 'position', 'apply']):
+                text = link_elem.get_text(strip=True)
+                if 10 < len(text) < 150:
+                    if not href.startswith('http'):
+                        if href.startswith('/'):
+                            href = 'https://www.visium.com' + href
+                        else:
+                            href = 'https://www.visium.com/' + href
+                    if href not in seen:
+                        seen.add(href)
+                        jobs.append((text, href))
+
+    return jobs[:30]
+
+@job_tool
+def get_VISIUM_jobs() -> list:
     """This tool function helps you get VISIUM current job list"""
     URL = COMPANY_URLS.get("VISIUM", "https://www.visium.com/join-us#open-positions")
 
@@ -406,62 +525,80 @@ def get_VISIUM_jobs():
             content = await page.content()
             await browser.close()
             
-            soup = BeautifulSoup(content, 'html.parser')
+            return await _parse_off_loop(_parse_VISIUM, content, URL)
 
-            jobs = []
-            seen = set()
-
-            open_positions_section = soup.find(id=lambda x: x and 'open-position' in x.lower()) or soup.find(class_=lambda x: x and any(term in str(x).lower() for term in ['open-position', 'job-list', 'career-list', 'position-list']))
-
-            if open_positions_section:
-                job_elements = open_positions_section.find_all(['a', 'div', 'li'], recursive=True)
-
-                for elem in job_elements:
-                    text = elem.get_text(strip=True)
+    jobs = asyncio.run(get_visium_jobs())
+    return jobs
 
-                    if 15 < len(text) < 150 and not any(skip in text.lower() for skip in ['view open position', 'explore benefit', 'apply now', 'learn more', 'read more', 'click here']):
-                        link = ''
-                        if elem.name == 'a':
-                            link = elem.get('href', '')
-                        else:
-                            link_elem = elem.find('a', recursive=False)
-                            if link_elem:
-                                link = link_elem.get('href', '')
-
-                        if link and not link.startswith('http'):
-                            if link.startswith('/'):
-                                link = 'https://www.visium.com' + link
-                            else:
-                                link = 'https://www.visium.com/' + link
-
-                        if link and ('job' in link.lower() or 'career' in link.lower() or 'position' in link.lower()):
-                            if link not in seen:
-                                seen.add(link)
-                                jobs.append((text, link))
-
-            if not jobs:
-                all_links = soup.find_all('a', href=True)
-                for link_elem in all_links:
-                    href = link_elem.get('href', '')
-                    if any(term in href.lower() for term in ['greenhouse', 'lever', 'workday', 'bamboohr', 'job', 'career', 'position', 'apply']):
-                        text = link_elem.get_text(strip=True)
-                        if 10 < len(text) < 150:
-                            if not href.startswith('http'):
-                                if href.startswith('/'):
-                                    href = 'https://www.visium.com' + href
-                                else:
-                                    href = 'https://www.visium.com/' + href
-                            if href not in seen:
-                                seen.add(href)
-                                jobs.append((text, href))
-
-            return jobs[:30]
+def _parse_ROCHE(html: str, base_url: str) -> list[tuple]:
+    """Parse the ROCHE career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    job_items = soup.find_all('li', {'data-automation-id': 'listItem'})
+    
+    if not job_items:
+        job_items = soup.find_all('li', class_=lambda x: x and 'job' in x.lower())
+    
+    if not job_items:
+        all_links = soup.find_all('a', href=True)
+        job_links = [link for link in all_links if '/job/' in link.get('href', '')]
+        
+        jobs_list = []
+        for idx, link in enumerate(job_links, 1):
+            job_title = link.get_text(strip=True)
+            job_url = link.get('href', '')
+            if not job_url.startswith('http'):
+                job_url = 'https://roche.wd3.myworkdayjobs.com' + job_url
+            
+            jobs_list.append({
+                'number': idx,
+                'title': job_title,
+                'url': job_url,
+                'location': 'N/A',
+                'posted_date': 'N/A',
+                'job_id': 'N/A'
+            })
+    else:
+        jobs_list = []
+        for idx, job in enumerate(job_items, 1):
+            title_elem = job.find('a', {'data-automation-id': 'jobTitle'})
+            
+            if not title_elem:
+                title_elem = job.find('a', href=True)
+            
+            if title_elem:
+                job_title = title_elem.get_text(strip=True)
+                job_url = title_elem.get('href', '')
+                if not job_url.startswith('http'):
+                    job_url = 'https://roche.wd3.myworkdayjobs.com' + job_url
+                
+                location_elem = job.find('dd', {'data-automation-id': 'location'})
+                location = location_elem.get_text(strip=True) if location_elem else "N/A"
+                
+                posted_elem = job.find('dd', {'data-automation-id': 'postedOn'})
+                posted_date = posted_elem.get_text(strip=True) if posted_elem else "N/A"
+                
+                job_id_elem = job.find('dd', {'data-automation-id': 'requisitionId'})
+                job_id = job_id_elem.get_text(strip=True) if job_id_elem else "N/A"
+                
+                jobs_list.append({
+                    'number': idx,
+                    'title': job_title,
+                    'url': job_url,
+                    'location': location,
+                    'posted_date': posted_date,
+                    'job_id': job_id
+                })
+    
+    if not jobs_list:
+        return []
 
-    jobs = asyncio.run(get_visium_jobs())
-    return _jobs_to_json(jobs)
+    # Convert to (name, url) tuples for job_tool
+    jobs = [(job['title'], job['url']) for job in jobs_list]
+    return jobs
 
-@tool
-def get_ROCHE_jobs() -> str:
+@job_tool
+def get_ROCHE_jobs() -> list:
     """This tool function helps you get ROCHE current job list"""
     URL = COMPANY_URLS.get("ROCHE", "https://roche.wd3.myworkdayjobs.com/en-US/roche-ext?q=machine%20learning&locations=3543744a0e67010b8e1b9bd75b7637a4")
     
@@ -479,84 +616,40 @@ def get_ROCHE_jobs() -> str:
             content = await page.content()
             await browser.close()
             
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            job_items = soup.find_all('li', {'data-automation-id': 'listItem'})
-            
-            if not job_items:
-                job_items = soup.find_all('li', class_=lambda x: x and 'job' in x.lower())
-            
-            if not job_items:
-                all_links = soup.find_all('a', href=True)
-                job_links = [link for link in all_links if '/job/' in link.get('href', '')]
-                
-                jobs_list = []
-                for idx, link in enumerate(job_links, 1):
-                    job_title = link.get_text(strip=True)
-                    job_url = link.get('href', '')
-                    if not job_url.startswith('http'):
-                        job_url = 'https://roche.wd3.myworkdayjobs.com' + job_url
-                    
-                    jobs_list.append({
-                        'number': idx,
-                        'title': job_title,
-                        'url': job_url,
-                        'location': 'N/A',
-                        'posted_date': 'N/A',
-                        'job_id': 'N/A'
-                    })
-            else:
-                jobs_list = []
-                for idx, job in enumerate(job_items, 1):
-                    title_elem = job.find('a', {'data-automation-id': 'jobTitle'})
-                    
-                    if not title_elem:
-                        title_elem = job.find('a', href=True)
-                    
-                    if title_elem:
-                        job_title = title_elem.get_text(strip=True)
-                        job_url = title_elem.get('href', '')
-                        if not job_url.startswith('http'):
-                            job_url = 'https://roche.wd3.myworkdayjobs.com' + job_url
-                        
-                        location_elem = job.find('dd', {'data-automation-id': 'location'})
-                        location = location_elem.get_text(strip=True) if location_elem else "N/A"
-                        
-                        posted_elem = job.find('dd', {'data-automation-id': 'postedOn'})
-                        posted_date = posted_elem.get_text(strip=True) if posted_elem else "N/A"
-                        
-                        job_id_elem = job.find('dd', {'data-automation-id': 'requisitionId'})
-                        job_id = job_id_elem.get_text(strip=True) if job_id_elem else "N/A"
-                        
-                        jobs_list.append({
-                            'number': idx,
-                            'title': job_title,
-                            'url': job_url,
-                            'location': location,
-                            'posted_date': posted_date,
-                            'job_id': job_id
-                        })
-            
-            if not jobs_list:
-                return _jobs_to_json([])
-
-            # Convert to standard format for _jobs_to_json
-            jobs = [(job['title'], job['url']) for job in jobs_list]
-            return jobs
+            return await _parse_off_loop(_parse_ROCHE, content, url)
 
     jobs = asyncio.run(get_roche_jobs(URL))
-    if isinstance(jobs, str):  # Error or empty JSON
-        return jobs
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_CSL_jobs() -> str:
+def _parse_CSL(html: str, base_url: str) -> list[tuple]:
+    """Parse the CSL (Workday) career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, 'html.parser')
+    jobs = []
+
+    job_links = soup.find_all('a', attrs={'data-automation-id': 'jobTitle'})
+    if not job_links:
+        job_links = soup.find_all('a', href=lambda x: x and '/job/' in x)
+
+    for link in job_links:
+        job_title = link.get_text(strip=True)
+        job_url = link.get('href', '')
+
+        if job_url and not job_url.startswith('http'):
+            job_url = f"https://csl.wd1.myworkdayjobs.com{job_url}"
+
+        if job_title and job_url:
+            jobs.append((job_title, job_url))
+
+    return jobs
+
+@job_tool
+def get_CSL_jobs() -> list:
     """This tool function helps you get CSL current job list"""
     URL = COMPANY_URLS.get("CSL", "https://csl.wd1.myworkdayjobs.com/en-EN/CSL_External?locationCountry=187134fccb084a0ea9b4b95f23890dbe")
 
     async def get_csl_jobs():
         url = URL
-        jobs_list = []
+        jobs = []
         
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
@@ -567,67 +660,49 @@ def get_CSL_jobs() -> str:
                 await asyncio.sleep(5)
                 
                 content = await page.content()
-                soup = BeautifulSoup(content, 'html.parser')
-                
-                job_links = soup.find_all('a', attrs={'data-automation-id': 'jobTitle'})
+                jobs = await _parse_off_loop(_parse_CSL, content, url)
                 
-                if not job_links:
+                if not jobs:
                     await asyncio.sleep(5)
                     content = await page.content()
-                    soup = BeautifulSoup(content, 'html.parser')
-                    job_links = soup.find_all('a', href=lambda x: x and '/job/' in x)
-                
-                for link in job_links:
-                    try:
-                        job_title = link.get_text(strip=True)
-                        job_url = link.get('href', '')
-                        
-                        if job_url and not job_url.startswith('http'):
-                            job_url = f"https://csl.wd1.myworkdayjobs.com{job_url}"
-                        
-                        parent = link.find_parent('li')
-                        if parent:
-                            location_elem = parent.find('dd', attrs={'data-automation-id': 'location'})
-                            location = location_elem.get_text(strip=True) if location_elem else "N/A"
-                            
-                            job_id_elem = parent.find('dd', attrs={'data-automation-id': 'requisitionId'})
-                            job_id = job_id_elem.get_text(strip=True) if job_id_elem else "N/A"
-                            
-                            posted_elem = parent.find('dd', attrs={'data-automation-id': 'postedOn'})
-                            posted_date = posted_elem.get_text(strip=True) if posted_elem else "N/A"
-                        else:
-                            location = "N/A"
-                            job_id = "N/A"
-                            posted_date = "N/A"
-                        
-                        if job_title and job_url:
-                            jobs_list.append({
-                                'job_title': job_title,
-                                'job_url': job_url,
-                                'location': location,
-                                'job_id': job_id,
-                                'posted_date': posted_date
-                            })
-                    except Exception as e:
-                        continue
+                    jobs = await _parse_off_loop(_parse_CSL, content, url)
                 
             finally:
                 await browser.close()
 
-        if not jobs_list:
-            return _jobs_to_json([])
-
-        # Convert to standard format for _jobs_to_json
-        jobs = [(job['job_title'], job['job_url']) for job in jobs_list]
         return jobs
 
     jobs = asyncio.run(get_csl_jobs())
-    if isinstance(jobs, str):  # Error or empty JSON
-        return jobs
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_JJ_jobs() -> str:
+def _parse_JJ(html: str, base_url: str) -> list[tuple]:
+    """Parse the J&J career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    jobs = []
+    
+    job_links = soup.find_all('a', href=lambda x: x and '/job/' in x)
+    
+    if not job_links:
+        job_links = soup.find_all('a', class_=lambda x: x and 'job' in str(x).lower())
+    
+    seen_urls = set()
+    
+    for link in job_links:
+        job_url = link.get('href', '')
+        job_title = link.get_text(strip=True)
+        
+        if job_url and job_title and job_url not in seen_urls:
+            if not job_url.startswith('http'):
+                job_url = f"https://www.careers.jnj.com{job_url}"
+            
+            seen_urls.add(job_url)
+            jobs.append((job_title, job_url))
+
+    return jobs
+
+@job_tool
+def get_JJ_jobs() -> list:
     """This tool function helps you get J&J current job list"""
     URL = COMPANY_URLS.get("J&J", "https://www.careers.jnj.com/en/jobs/?search=&team=Data+Analytics+%26+Computational+Sciences&country=Switzerland&pagesize=20#results")
 
@@ -641,71 +716,63 @@ def get_JJ_jobs() -> str:
             )
             page = await context.new_page()
             
+            # a failed load raises (reported as a scrape error), so it is never taken for an empty listing
             try:
                 await page.goto(url, wait_until='networkidle', timeout=30000)
                 await page.wait_for_timeout(5000)
                 
                 content = await page.content()
-                soup = BeautifulSoup(content, 'html.parser')
-                
-                jobs_list = []
-                
-                job_links = soup.find_all('a', href=lambda x: x and '/job/' in x)
-                
-                if not job_links:
-                    job_links = soup.find_all('a', class_=lambda x: x and 'job' in str(x).lower())
-                
-                seen_urls = set()
-                
-                for idx, link in enumerate(job_links, 1):
-                    job_url = link.get('href', '')
-                    job_title = link.get_text(strip=True)
-                    
-                    if job_url and job_title and job_url not in seen_urls:
-                        if not job_url.startswith('http'):
-                            job_url = f"https://www.careers.jnj.com{job_url}"
-                        
-                        seen_urls.add(job_url)
-                        
-                        parent = link.find_parent()
-                        location = 'N/A'
-                        if parent:
-                            location_elem = parent.find(class_=lambda x: x and 'location' in str(x).lower())
-                            if location_elem:
-                                location = location_elem.get_text(strip=True)
-                        
-                        jobs_list.append({
-                            'job_number': len(jobs_list) + 1,
-                            'job_title': job_title,
-                            'location': location,
-                            'job_url': job_url
-                        })
-                
+            finally:
                 await browser.close()
 
-                if jobs_list:
-                    # Convert to standard format for _jobs_to_json
-                    jobs = [(job['job_title'], job['job_url']) for job in jobs_list]
-                    return jobs
-                else:
-                    return []
-
-            except Exception as e:
-                await browser.close()
-                return []
+        return await _parse_off_loop(_parse_JJ, content, url)
 
     jobs = asyncio.run(get_jnj_jobs())
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_ISO_jobs() -> str:
+_ISO_JOB_URL_RE = re.compile(r"^https://job-boards\.greenhouse\.io/isomorphiclabs/jobs/\d+")
+
+def _parse_ISO(html: str, base_url: str) -> list[tuple]:
+    """Parse the ISO career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+
+    jobs = []
+    for a in soup.select('a[href*="/isomorphiclabs/jobs/"]'):
+        href = (a.get("href") or "").strip()
+        if not href:
+            continue
+        if href.startswith("/"):
+            href = "https://job-boards.greenhouse.io" + href
+
+        if not _ISO_JOB_URL_RE.match(href):
+            continue
+
+        title = a.get_text(" ", strip=True)
+        if not title or title.lower() == "apply":
+            continue
+
+        jobs.append((title, href))
+
+    # de-dupe while preserving order
+    seen = set()
+    unique_jobs = []
+    for title, url in jobs:
+        key = (title, url)
+        if key in seen:
+            continue
+        seen.add(key)
+        unique_jobs.append((title, url))
+
+    return unique_jobs
+
+@job_tool
+def get_ISO_jobs() -> list:
     """This tool function helps you get ISO current job list"""
     URL = COMPANY_URLS.get("ISO", "https://job-boards.greenhouse.io/isomorphiclabs")
 
     def list_iso_jobs() -> str:
         async def _run() -> str:
             board_url = URL
-            job_url_re = re.compile(r"^https://job-boards\.greenhouse\.io/isomorphiclabs/jobs/\d+")
     
             async with async_playwright() as p:
                 browser = await p.chromium.launch(headless=True)
@@ -716,44 +783,49 @@ def get_ISO_jobs() -> str:
                 html = await page.content()
                 await browser.close()
     
-            soup = BeautifulSoup(html, "html.parser")
-    
-            jobs = []
-            for a in soup.select('a[href*="/isomorphiclabs/jobs/"]'):
-                href = (a.get("href") or "").strip()
-                if not href:
-                    continue
-                if href.startswith("/"):
-                    href = "https://job-boards.greenhouse.io" + href
-    
-                if not job_url_re.match(href):
-                    continue
-    
-                title = a.get_text(" ", strip=True)
-                if not title or title.lower() == "apply":
-                    continue
-    
-                jobs.append((title, href))
-    
-            # de-dupe while preserving order
-            seen = set()
-            unique_jobs = []
-            for title, url in jobs:
-                key = (title, url)
-                if key in seen:
-                    continue
-                seen.add(key)
-                unique_jobs.append((title, url))
-
-            return unique_jobs
+            return await _parse_off_loop(_parse_ISO, html, board_url)
 
         return asyncio.run(_run())
 
     jobs = list_iso_jobs()
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_MONTEROSA_jobs() -> str:
+def _parse_MONTEROSA(html: str, base_url: str) -> list[tuple]:
+    """Parse the MONTEROSA career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+
+    jobs = []
+    seen = set()
+
+    for a in soup.select('a[href*="careers-monterosatx.icims.com/jobs/"]'):
+        href = (a.get("href") or "").strip()
+        if not href:
+            continue
+
+        job_url = urljoin(base_url, href)
+        if job_url in seen:
+            continue
+        seen.add(job_url)
+
+        title = " ".join(a.get_text(" ", strip=True).split())
+
+        if not title or title.lower() in {"more info", "apply", "careers"}:
+            container = a.find_parent(["div", "li", "article", "section"])
+            if container:
+                h = container.find(["h1", "h2", "h3", "h4"])
+                if h:
+                    title = " ".join(h.get_text(" ", strip=True).split())
+
+        if not title:
+            slug = job_url.rstrip("/").split("/")[-2]
+            title = slug.replace("-", " ").replace("%e2%80%93", "–").strip()
+
+        jobs.append((title, job_url))
+
+    return jobs
+
+@job_tool
+def get_MONTEROSA_jobs() -> list:
     """This tool function helps you get MONTEROSA current job list"""
     URL = COMPANY_URLS.get("MONTEROSA", "https://www.monterosatx.com/careers/")
 
@@ -768,45 +840,46 @@ def get_MONTEROSA_jobs() -> str:
                 html = await page.content()
                 await browser.close()
     
-            soup = BeautifulSoup(html, "html.parser")
-    
-            jobs = []
-            seen = set()
-    
-            for a in soup.select('a[href*="careers-monterosatx.icims.com/jobs/"]'):
-                href = (a.get("href") or "").strip()
-                if not href:
-                    continue
-    
-                job_url = urljoin(careers_url, href)
-                if job_url in seen:
-                    continue
-                seen.add(job_url)
-    
-                title = " ".join(a.get_text(" ", strip=True).split())
-    
-                if not title or title.lower() in {"more info", "apply", "careers"}:
-                    container = a.find_parent(["div", "li", "article", "section"])
-                    if container:
-                        h = container.find(["h1", "h2", "h3", "h4"])
-                        if h:
-                            title = " ".join(h.get_text(" ", strip=True).split())
-    
-                if not title:
-                    slug = job_url.rstrip("/").split("/")[-2]
-                    title = slug.replace("-", " ").replace("%e2%80%93", "–").strip()
-    
-                jobs.append((title, job_url))
-
-            return jobs
+            return await _parse_off_loop(_parse_MONTEROSA, html, careers_url)
 
         return asyncio.run(_run())
 
     jobs = list_monterosa_jobs()
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_IDORSIA_jobs() -> str:
+def _parse_IDORSIA(html: str, base_url: str) -> list[tuple]:
+    """Parse the IDORSIA career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Prefer the expected selector, but fall back to any "/job/" anchors
+    anchors = soup.select("a.jobTitle-link[href]") or soup.select('a[href*="/job/"]')
+
+    # de-dup by URL, preserve order
+    seen = set()
+    unique_jobs = []
+    for a in anchors:
+        href = (a.get("href") or "").strip()
+        if "/job/" not in href:
+            continue
+
+        title = a.get_text(" ", strip=True)
+        if not title:
+            m = re.search(r"/job/([^/]+)/\d+/?", href)
+            if m:
+                title = m.group(1).replace("-", " ").strip()
+            else:
+                continue
+
+        full_url = urljoin(base_url, href)
+        if full_url in seen:
+            continue
+        seen.add(full_url)
+        unique_jobs.append((title, full_url))
+
+    return unique_jobs
+
+@job_tool
+def get_IDORSIA_jobs() -> list:
     """This tool function helps you get IDORSIA current job list"""
     URL = COMPANY_URLS.get("IDORSIA", "https://careers.idorsia.com/search/?createNewAlert=false&q=&locationsearch=switzerland")
 
@@ -828,54 +901,74 @@ def get_IDORSIA_jobs() -> str:
                 html = await page.content()
                 await browser.close()
     
-            soup = BeautifulSoup(html, "html.parser")
-    
-            # Prefer the expected selector, but fall back to any "/job/" anchors
-            anchors = soup.select("a.jobTitle-link[href]") or soup.select('a[href*="/job/"]')
-    
-            jobs = []
-            for a in anchors:
-                href = (a.get("href") or "").strip()
-                if "/job/" not in href:
-                    continue
-    
-                title = a.get_text(" ", strip=True)
-                if not title:
-                    m = re.search(r"/job/([^/]+)/\d+/?", href)
-                    if m:
-                        title = m.group(1).replace("-", " ").strip()
-                    else:
-                        continue
-    
-                full_url = urljoin(url, href)
-    
-                date_posted = ""
-                container = a.find_parent("tr") or a.find_parent("li") or a.find_parent("div")
-                if container:
-                    date_el = container.select_one(".jobDate")
-                    if date_el:
-                        date_posted = date_el.get_text(" ", strip=True)
-    
-                jobs.append((full_url, title, date_posted))
-    
-            # de-dup by URL, preserve order
-            seen = set()
-            unique_jobs = []
-            for full_url, title, date_posted in jobs:
-                if full_url in seen:
-                    continue
-                seen.add(full_url)
-                unique_jobs.append((title, full_url))
-
-            return unique_jobs
+            return await _parse_off_loop(_parse_IDORSIA, html, url)
 
         return asyncio.run(_run())
 
     jobs = list_idorsia_jobs()
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_MERCK_jobs() -> str:
+def _parse_MERCK(html: str, base_url: str) -> list[tuple]:
+    """Parse the MERCK career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    anchors = soup.select('a[data-ph-at-id="job-link"]')
+
+    jobs = []
+    for a in anchors:
+        href = (a.get("href") or "").strip()
+        if not href or href == "#":
+            continue
+
+        title = a.get_text(" ", strip=True)
+        if not title:
+            m = re.search(r"/job/\d+/([^?]+)", href)
+            if m:
+                title = m.group(1).replace("-", " ").strip()
+            else:
+                continue
+
+        # Get location from job-info element
+        location = ""
+        parent = a.find_parent("li") or a.find_parent("div", class_=lambda x: x and "job" in str(x).lower())
+        if parent:
+            # Try job-info first (contains location)
+            info_elem = parent.select_one('[data-ph-at-id="job-info"]')
+            if info_elem:
+                location = info_elem.get_text(" ", strip=True)
+            else:
+                # Fallback to job-location
+                loc_elem = parent.select_one('[data-ph-at-id="job-location"]')
+                if loc_elem:
+                    location = loc_elem.get_text(" ", strip=True)
+
+        # Filter for Switzerland only - include all Swiss cantons/cities
+        swiss_locations = ['switzerland', 'zürich', 'zurich', 'basel', 'geneva', 'genève', 'bern', 'swiss', 'buchs', 'schaffhausen', 'zug', 'lausanne', 'lugano', 'winterthur', 'st. gallen', 'lucerne', 'luzern', 'visp', 'stein', 'vaud', 'aubonne', 'corsier', 'vevey', 'eysins', 'nyon']
+        if not any(loc in location.lower() for loc in swiss_locations):
+            # Skip non-Swiss jobs
+            continue
+
+        if href.startswith("/"):
+            full_url = urljoin("https://careers.merckgroup.com", href)
+        elif href.startswith("http"):
+            full_url = href
+        else:
+            full_url = urljoin(base_url, href)
+
+        jobs.append((full_url, title))
+
+    # De-duplicate by URL, preserve order
+    seen = set()
+    unique_jobs = []
+    for full_url, title in jobs:
+        if full_url in seen:
+            continue
+        seen.add(full_url)
+        unique_jobs.append((title, full_url))
+
+    return unique_jobs
+
+@job_tool
+def get_MERCK_jobs() -> list:
     """This tool function helps you get MERCK current job list filtered for Switzerland positions"""
     # Use keywords=Switzerland to search for Swiss jobs (l= parameter doesn't work properly)
     URL = COMPANY_URLS.get("MERCK", "https://careers.merckgroup.com/global/en/search-results?keywords=Switzerland&s=1")
@@ -905,70 +998,56 @@ def get_MERCK_jobs() -> str:
                 html = await page.content()
                 await browser.close()
 
-            soup = BeautifulSoup(html, "html.parser")
-            anchors = soup.select('a[data-ph-at-id="job-link"]')
+            return await _parse_off_loop(_parse_MERCK, html, url)
 
-            jobs = []
-            for a in anchors:
-                href = (a.get("href") or "").strip()
-                if not href or href == "#":
-                    continue
+        return asyncio.run(_run())
 
-                title = a.get_text(" ", strip=True)
-                if not title:
-                    m = re.search(r"/job/\d+/([^?]+)", href)
-                    if m:
-                        title = m.group(1).replace("-", " ").strip()
-                    else:
-                        continue
+    jobs = list_merck_jobs()
+    return jobs
 
-                # Get location from job-info element
-                location = ""
-                parent = a.find_parent("li") or a.find_parent("div", class_=lambda x: x and "job" in str(x).lower())
-                if parent:
-                    # Try job-info first (contains location)
-                    info_elem = parent.select_one('[data-ph-at-id="job-info"]')
-                    if info_elem:
-                        location = info_elem.get_text(" ", strip=True)
-                    else:
-                        # Fallback to job-location
-                        loc_elem = parent.select_one('[data-ph-at-id="job-location"]')
-                        if loc_elem:
-                            location = loc_elem.get_text(" ", strip=True)
-
-                # Filter for Switzerland only - include all Swiss cantons/cities
-                swiss_locations = ['switzerland', 'zürich', 'zurich', 'basel', 'geneva', 'genève', 'bern', 'swiss', 'buchs', 'schaffhausen', 'zug', 'lausanne', 'lugano', 'winterthur', 'st. gallen', 'lucerne', 'luzern', 'visp', 'stein', 'vaud', 'aubonne', 'corsier', 'vevey', 'eysins', 'nyon']
-                if not any(loc in location.lower() for loc in swiss_locations):
-                    # Skip non-Swiss jobs
-                    continue
+def _parse_HAYA(html: str, base_url: str) -> list[tuple]:
+    """Parse the HAYA career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
 
-                if href.startswith("/"):
-                    full_url = urljoin("https://careers.merckgroup.com", href)
-                elif href.startswith("http"):
-                    full_url = href
-                else:
-                    full_url = urljoin(url, href)
+    jobs = []
+    seen = set()
 
-                jobs.append((full_url, title))
+    # Find job links - BambooHR and LinkedIn job postings
+    for a in soup.select('a[href*="bamboohr.com/careers"], a[href*="linkedin.com/jobs"]'):
+        href = (a.get("href") or "").strip()
+        if not href or href in seen:
+            continue
+        seen.add(href)
 
-            # De-duplicate by URL, preserve order
-            seen = set()
-            unique_jobs = []
-            for full_url, title in jobs:
-                if full_url in seen:
-                    continue
-                seen.add(full_url)
-                unique_jobs.append((title, full_url))
+        # Get title from link text directly
+        link_text = a.get_text(" ", strip=True)
 
-            return unique_jobs
+        # Filter for Switzerland (Lausanne/CH) positions only
+        if "Lausanne" not in link_text and "(CH)" not in link_text:
+            continue
 
-        return asyncio.run(_run())
+        # Extract title from pattern: "[New] Location (XX) Title Location (XX) Details"
+        # Pattern matches: location, then captures everything until next location
+        match = re.search(
+            r'(?:New\s+)?Lausanne\s*\(CH\)\s+(.+?)\s+Lausanne\s*\(CH\)',
+            link_text
+        )
+        if match:
+            title = match.group(1).strip()
+        else:
+            # Fallback: clean up the link text
+            title = link_text
+            title = re.sub(r'^New\s+', '', title)
+            title = re.sub(r'^Lausanne\s*\(CH\)\s*', '', title)
+            title = re.sub(r'\s+Lausanne\s*\(CH\).*$', '', title)
 
-    jobs = list_merck_jobs()
-    return _jobs_to_json(jobs)
+        if title and len(title) > 5:
+            jobs.append((title, href))
 
-@tool
-def get_HAYA_jobs() -> str:
+    return jobs
+
+@job_tool
+def get_HAYA_jobs() -> list:
     """This tool function helps you get HAYA Therapeutics current job list"""
     URL = COMPANY_URLS.get("HAYA", "https://www.hayatx.com/careers/")
 
@@ -986,52 +1065,36 @@ def get_HAYA_jobs() -> str:
                 html = await page.content()
                 await browser.close()
 
-            soup = BeautifulSoup(html, "html.parser")
-
-            jobs = []
-            seen = set()
-
-            # Find job links - BambooHR and LinkedIn job postings
-            for a in soup.select('a[href*="bamboohr.com/careers"], a[href*="linkedin.com/jobs"]'):
-                href = (a.get("href") or "").strip()
-                if not href or href in seen:
-                    continue
-                seen.add(href)
+            return await _parse_off_loop(_parse_HAYA, html, URL)
 
-                # Get title from link text directly
-                link_text = a.get_text(" ", strip=True)
-
-                # Filter for Switzerland (Lausanne/CH) positions only
-                if "Lausanne" not in link_text and "(CH)" not in link_text:
-                    continue
+        return asyncio.run(_run())
 
-                # Extract title from pattern: "[New] Location (XX) Title Location (XX) Details"
-                # Pattern matches: location, then captures everything until next location
-                match = re.search(
-                    r'(?:New\s+)?Lausanne\s*\(CH\)\s+(.+?)\s+Lausanne\s*\(CH\)',
-                    link_text
-                )
-                if match:
-                    title = match.group(1).strip()
-                else:
-                    # Fallback: clean up the link text
-                    title = link_text
-                    title = re.sub(r'^New\s+', '', title)
-                    title = re.sub(r'^Lausanne\s*\(CH\)\s*', '', title)
-                    title = re.sub(r'\s+Lausanne\s*\(CH\).*$', '', title)
+    jobs = list_haya_jobs()
+    return jobs
 
-                if title and len(title) > 5:
-                    jobs.append((title, href))
+def _parse_TAKEDA(html: str, base_url: str) -> list[tuple]:
+    """Parse the TAKEDA career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-            return jobs
+    for a in soup.find_all('a', href=True):
+        href = a.get('href', '')
+        if '/job/' in href or '/jobs/' in href:
+            if href.startswith('/'):
+                href = 'https://www.takeda.com' + href
+            if href in seen:
+                continue
+            seen.add(href)
 
-        return asyncio.run(_run())
+            title = a.get_text(strip=True)
+            if title and len(title) > 5 and title.lower() not in ['apply', 'learn more', 'view']:
+                jobs.append((title, href))
 
-    jobs = list_haya_jobs()
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_TAKEDA_jobs() -> str:
+@job_tool
+def get_TAKEDA_jobs() -> list:
     """This tool function helps you get TAKEDA current job list for Switzerland"""
     URL = COMPANY_URLS.get("TAKEDA", "https://www.takeda.com/careers/search-jobs/?country=Switzerland")
 
@@ -1050,30 +1113,40 @@ def get_TAKEDA_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
-
-        for a in soup.find_all('a', href=True):
-            href = a.get('href', '')
-            if '/job/' in href or '/jobs/' in href:
-                if href.startswith('/'):
-                    href = 'https://www.takeda.com' + href
-                if href in seen:
-                    continue
-                seen.add(href)
+        return await _parse_off_loop(_parse_TAKEDA, html, URL)
 
-                title = a.get_text(strip=True)
-                if title and len(title) > 5 and title.lower() not in ['apply', 'learn more', 'view']:
-                    jobs.append((title, href))
+    jobs = asyncio.run(_run())
+    return jobs
+
+def _parse_SYNGENTA(html: str, base_url: str) -> list[tuple]:
+    """Parse the SYNGENTA career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
+
+    # Try PhenomPeople selector first
+    anchors = soup.select('a[data-ph-at-id="job-link"]')
+    if not anchors:
+        anchors = soup.find_all('a', href=lambda x: x and '/job/' in x)
+
+    for a in anchors:
+        href = a.get('href', '').strip()
+        if not href:
+            continue
+        if href.startswith('/'):
+            href = 'https://jobs.syngenta.com' + href
+        if href in seen:
+            continue
+        seen.add(href)
 
-        return jobs
+        title = a.get_text(strip=True)
+        if title and len(title) > 5:
+            jobs.append((title, href))
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_SYNGENTA_jobs() -> str:
+@job_tool
+def get_SYNGENTA_jobs() -> list:
     """This tool function helps you get SYNGENTA current job list for Switzerland"""
     URL = COMPANY_URLS.get("SYNGENTA", "https://jobs.syngenta.com/?country=CH")
 
@@ -1092,36 +1165,40 @@ def get_SYNGENTA_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_SYNGENTA, html, URL)
 
-        # Try PhenomPeople selector first
-        anchors = soup.select('a[data-ph-at-id="job-link"]')
-        if not anchors:
-            anchors = soup.find_all('a', href=lambda x: x and '/job/' in x)
+    jobs = asyncio.run(_run())
+    return jobs
 
-        for a in anchors:
-            href = a.get('href', '').strip()
-            if not href:
-                continue
-            if href.startswith('/'):
-                href = 'https://jobs.syngenta.com' + href
-            if href in seen:
-                continue
-            seen.add(href)
+def _parse_LONZA(html: str, base_url: str) -> list[tuple]:
+    """Parse the LONZA career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-            title = a.get_text(strip=True)
-            if title and len(title) > 5:
-                jobs.append((title, href))
+    # Workday job links have data-automation-id="jobTitle" or /job/ in href
+    job_links = soup.find_all('a', attrs={'data-automation-id': 'jobTitle'})
+    if not job_links:
+        job_links = soup.find_all('a', href=lambda x: x and '/job/' in x)
 
-        return jobs
+    for link in job_links:
+        title = link.get_text(strip=True)
+        href = link.get('href', '')
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+        if href and not href.startswith('http'):
+            href = f"https://lonza.wd3.myworkdayjobs.com{href}"
 
-@tool
-def get_LONZA_jobs() -> str:
+        if href in seen:
+            continue
+        seen.add(href)
+
+        if title and len(title) > 5:
+            jobs.append((title, href))
+
+    return jobs
+
+@job_tool
+def get_LONZA_jobs() -> list:
     """This tool function helps you get LONZA current job list for Switzerland (via Workday)"""
     # Use Workday URL directly - Lonza's main site blocks headless browsers
     URL = "https://lonza.wd3.myworkdayjobs.com/Lonza_Careers?locationCountry=187134fccb084a0ea9b4b95f23890dbe"
@@ -1141,36 +1218,47 @@ def get_LONZA_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_LONZA, html, URL)
 
-        # Workday job links have data-automation-id="jobTitle" or /job/ in href
-        job_links = soup.find_all('a', attrs={'data-automation-id': 'jobTitle'})
-        if not job_links:
-            job_links = soup.find_all('a', href=lambda x: x and '/job/' in x)
-
-        for link in job_links:
-            title = link.get_text(strip=True)
-            href = link.get('href', '')
+    jobs = asyncio.run(_run())
+    return jobs
+
+def _parse_BIOGEN(html: str, base_url: str) -> list[tuple]:
+    """Parse the BIOGEN career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
+
+    # Workday pattern
+    for a in soup.find_all('a', attrs={'data-automation-id': 'jobTitle'}):
+        href = a.get('href', '')
+        if href and not href.startswith('http'):
+            href = 'https://biibhr.wd3.myworkdayjobs.com' + href
+        if href in seen:
+            continue
+        seen.add(href)
 
-            if href and not href.startswith('http'):
-                href = f"https://lonza.wd3.myworkdayjobs.com{href}"
+        title = a.get_text(strip=True)
+        if title:
+            jobs.append((title, href))
 
+    # Fallback
+    if not jobs:
+        for a in soup.find_all('a', href=lambda x: x and '/job/' in x):
+            href = a.get('href', '')
+            if not href.startswith('http'):
+                href = 'https://biibhr.wd3.myworkdayjobs.com' + href
             if href in seen:
                 continue
             seen.add(href)
-
+            title = a.get_text(strip=True)
             if title and len(title) > 5:
                 jobs.append((title, href))
 
-        return jobs
+    return jobs
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
-
-@tool
-def get_BIOGEN_jobs() -> str:
+@job_tool
+def get_BIOGEN_jobs() -> list:
     """This tool function helps you get BIOGEN current job list for Switzerland (Workday)"""
     URL = COMPANY_URLS.get("BIOGEN", "https://biibhr.wd3.myworkdayjobs.com/en-US/external?locationCountry=187134fccb084a0ea9b4b95f23890dbe")
 
@@ -1184,43 +1272,43 @@ def get_BIOGEN_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_BIOGEN, html, URL)
 
-        # Workday pattern
-        for a in soup.find_all('a', attrs={'data-automation-id': 'jobTitle'}):
-            href = a.get('href', '')
-            if href and not href.startswith('http'):
-                href = 'https://biibhr.wd3.myworkdayjobs.com' + href
+    jobs = asyncio.run(_run())
+    return jobs
+
+def _parse_SANDOZ(html: str, base_url: str) -> list[tuple]:
+    """Parse the SANDOZ career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
+
+    # Look for job-details links (pattern: /careers/career-search/job-details/REQ-XXXXX)
+    for a in soup.find_all('a', href=True):
+        href = a.get('href', '')
+        if '/career-search/job-details/' in href or '/job-details/' in href:
+            if href.startswith('/'):
+                href = 'https://www.sandoz.com' + href
             if href in seen:
                 continue
             seen.add(href)
 
+            # Get title from link text or parent element
             title = a.get_text(strip=True)
-            if title:
-                jobs.append((title, href))
-
-        # Fallback
-        if not jobs:
-            for a in soup.find_all('a', href=lambda x: x and '/job/' in x):
-                href = a.get('href', '')
-                if not href.startswith('http'):
-                    href = 'https://biibhr.wd3.myworkdayjobs.com' + href
-                if href in seen:
-                    continue
-                seen.add(href)
-                title = a.get_text(strip=True)
-                if title and len(title) > 5:
-                    jobs.append((title, href))
+            if not title or len(title) < 5:
+                parent = a.find_parent(['div', 'li', 'article'])
+                if parent:
+                    h = parent.find(['h2', 'h3', 'h4', 'strong'])
+                    if h:
+                        title = h.get_text(strip=True)
 
-        return jobs
+            if title and len(title) > 5:
+                jobs.append((title, href))
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_SANDOZ_jobs() -> str:
+@job_tool
+def get_SANDOZ_jobs() -> list:
     """This tool function helps you get SANDOZ current job list for Switzerland"""
     URL = COMPANY_URLS.get("SANDOZ", "https://www.sandoz.com/careers/job-search/?field_job_country=LOC_CH")
 
@@ -1240,39 +1328,39 @@ def get_SANDOZ_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_SANDOZ, html, URL)
 
-        # Look for job-details links (pattern: /careers/career-search/job-details/REQ-XXXXX)
-        for a in soup.find_all('a', href=True):
-            href = a.get('href', '')
-            if '/career-search/job-details/' in href or '/job-details/' in href:
-                if href.startswith('/'):
-                    href = 'https://www.sandoz.com' + href
-                if href in seen:
-                    continue
-                seen.add(href)
+    jobs = asyncio.run(_run())
+    return jobs
 
-                # Get title from link text or parent element
-                title = a.get_text(strip=True)
-                if not title or len(title) < 5:
-                    parent = a.find_parent(['div', 'li', 'article'])
-                    if parent:
-                        h = parent.find(['h2', 'h3', 'h4', 'strong'])
-                        if h:
-                            title = h.get_text(strip=True)
+def _parse_ABBVIE(html: str, base_url: str) -> list[tuple]:
+    """Parse the ABBVIE career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-                if title and len(title) > 5:
-                    jobs.append((title, href))
+    anchors = soup.select('a[data-ph-at-id="job-link"]')
+    if not anchors:
+        anchors = soup.find_all('a', href=lambda x: x and '/job/' in x)
 
-        return jobs
+    for a in anchors:
+        href = a.get('href', '').strip()
+        if not href:
+            continue
+        if href.startswith('/'):
+            href = 'https://careers.abbvie.com' + href
+        if href in seen:
+            continue
+        seen.add(href)
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+        title = a.get_text(strip=True)
+        if title and len(title) > 5:
+            jobs.append((title, href))
 
-@tool
-def get_ABBVIE_jobs() -> str:
+    return jobs
+
+@job_tool
+def get_ABBVIE_jobs() -> list:
     """This tool function helps you get ABBVIE current job list for Switzerland"""
     URL = COMPANY_URLS.get("ABBVIE", "https://careers.abbvie.com/en/jobs?ln=Z%C3%BCrich%2C+Switzerland&lr=200")
 
@@ -1291,35 +1379,35 @@ def get_ABBVIE_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_ABBVIE, html, URL)
 
-        anchors = soup.select('a[data-ph-at-id="job-link"]')
-        if not anchors:
-            anchors = soup.find_all('a', href=lambda x: x and '/job/' in x)
+    jobs = asyncio.run(_run())
+    return jobs
 
-        for a in anchors:
-            href = a.get('href', '').strip()
-            if not href:
-                continue
-            if href.startswith('/'):
-                href = 'https://careers.abbvie.com' + href
-            if href in seen:
-                continue
-            seen.add(href)
+def _parse_SANOFI(html: str, base_url: str) -> list[tuple]:
+    """Parse the SANOFI career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-            title = a.get_text(strip=True)
-            if title and len(title) > 5:
-                jobs.append((title, href))
+    for a in soup.find_all('a', href=lambda x: x and '/job/' in x):
+        href = a.get('href', '').strip()
+        if not href:
+            continue
+        if href.startswith('/'):
+            href = 'https://jobs.sanofi.com' + href
+        if href in seen:
+            continue
+        seen.add(href)
 
-        return jobs
+        title = a.get_text(strip=True)
+        if title and len(title) > 5 and title.lower() not in ['apply', 'view job']:
+            jobs.append((title, href))
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_SANOFI_jobs() -> str:
+@job_tool
+def get_SANOFI_jobs() -> list:
     """This tool function helps you get SANOFI current job list for Switzerland"""
     URL = COMPANY_URLS.get("SANOFI", "https://jobs.sanofi.com/en/search-jobs/Switzerland/2649/2/2658434/47x00016/8x01427/50/2")
 
@@ -1338,31 +1426,39 @@ def get_SANOFI_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_SANOFI, html, URL)
 
-        for a in soup.find_all('a', href=lambda x: x and '/job/' in x):
-            href = a.get('href', '').strip()
-            if not href:
-                continue
-            if href.startswith('/'):
-                href = 'https://jobs.sanofi.com' + href
-            if href in seen:
-                continue
-            seen.add(href)
+    jobs = asyncio.run(_run())
+    return jobs
 
-            title = a.get_text(strip=True)
-            if title and len(title) > 5 and title.lower() not in ['apply', 'view job']:
-                jobs.append((title, href))
+def _parse_BAYER(html: str, base_url: str) -> list[tuple]:
+    """Parse the BAYER career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-        return jobs
+    anchors = soup.select('a[data-ph-at-id="job-link"]')
+    if not anchors:
+        anchors = soup.find_all('a', href=lambda x: x and '/job/' in x)
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+    for a in anchors:
+        href = a.get('href', '').strip()
+        if not href:
+            continue
+        if href.startswith('/'):
+            href = 'https://talent.bayer.com' + href
+        if href in seen:
+            continue
+        seen.add(href)
 
-@tool
-def get_BAYER_jobs() -> str:
+        title = a.get_text(strip=True)
+        if title and len(title) > 5:
+            jobs.append((title, href))
+
+    return jobs
+
+@job_tool
+def get_BAYER_jobs() -> list:
     """This tool function helps you get BAYER current job list for Switzerland"""
     URL = COMPANY_URLS.get("BAYER", "https://career.bayer.com/en/job-search?country=Switzerland")
 
@@ -1381,35 +1477,35 @@ def get_BAYER_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_BAYER, html, URL)
 
-        anchors = soup.select('a[data-ph-at-id="job-link"]')
-        if not anchors:
-            anchors = soup.find_all('a', href=lambda x: x and '/job/' in x)
+    jobs = asyncio.run(_run())
+    return jobs
 
-        for a in anchors:
-            href = a.get('href', '').strip()
-            if not href:
-                continue
-            if href.startswith('/'):
-                href = 'https://talent.bayer.com' + href
-            if href in seen:
-                continue
-            seen.add(href)
+def _parse_AZ(html: str, base_url: str) -> list[tuple]:
+    """Parse the AZ career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-            title = a.get_text(strip=True)
-            if title and len(title) > 5:
-                jobs.append((title, href))
+    for a in soup.find_all('a', href=lambda x: x and '/job/' in x):
+        href = a.get('href', '').strip()
+        if not href:
+            continue
+        if href.startswith('/'):
+            href = 'https://careers.astrazeneca.com' + href
+        if href in seen:
+            continue
+        seen.add(href)
 
-        return jobs
+        title = a.get_text(strip=True)
+        if title and len(title) > 5 and title.lower() not in ['apply', 'view job']:
+            jobs.append((title, href))
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_AZ_jobs() -> str:
+@job_tool
+def get_AZ_jobs() -> list:
     """This tool function helps you get AstraZeneca current job list for Switzerland"""
     URL = COMPANY_URLS.get("AZ", "https://careers.astrazeneca.com/search-jobs/Switzerland/7684/2/2658434/47x00016/8x01427/100/2")
 
@@ -1428,31 +1524,39 @@ def get_AZ_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_AZ, html, URL)
 
-        for a in soup.find_all('a', href=lambda x: x and '/job/' in x):
-            href = a.get('href', '').strip()
-            if not href:
-                continue
-            if href.startswith('/'):
-                href = 'https://careers.astrazeneca.com' + href
-            if href in seen:
-                continue
-            seen.add(href)
+    jobs = asyncio.run(_run())
+    return jobs
 
-            title = a.get_text(strip=True)
-            if title and len(title) > 5 and title.lower() not in ['apply', 'view job']:
-                jobs.append((title, href))
+def _parse_BMS(html: str, base_url: str) -> list[tuple]:
+    """Parse the BMS career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-        return jobs
+    anchors = soup.select('a[data-ph-at-id="job-link"]')
+    if not anchors:
+        anchors = soup.find_all('a', href=lambda x: x and '/job/' in x)
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+    for a in anchors:
+        href = a.get('href', '').strip()
+        if not href:
+            continue
+        if href.startswith('/'):
+            href = 'https://jobs.bms.com' + href
+        if href in seen:
+            continue
+        seen.add(href)
 
-@tool
-def get_BMS_jobs() -> str:
+        title = a.get_text(strip=True)
+        if title and len(title) > 5:
+            jobs.append((title, href))
+
+    return jobs
+
+@job_tool
+def get_BMS_jobs() -> list:
     """This tool function helps you get Bristol-Myers Squibb current job list for Switzerland"""
     URL = COMPANY_URLS.get("BMS", "https://jobs.bms.com/careers?location=switzerland&domain=bms.com")
 
@@ -1471,35 +1575,35 @@ def get_BMS_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_BMS, html, URL)
 
-        anchors = soup.select('a[data-ph-at-id="job-link"]')
-        if not anchors:
-            anchors = soup.find_all('a', href=lambda x: x and '/job/' in x)
+    jobs = asyncio.run(_run())
+    return jobs
 
-        for a in anchors:
-            href = a.get('href', '').strip()
-            if not href:
-                continue
-            if href.startswith('/'):
-                href = 'https://jobs.bms.com' + href
-            if href in seen:
-                continue
-            seen.add(href)
+def _parse_BASILEA(html: str, base_url: str) -> list[tuple]:
+    """Parse the BASILEA career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-            title = a.get_text(strip=True)
-            if title and len(title) > 5:
-                jobs.append((title, href))
+    for a in soup.find_all('a', href=lambda x: x and '/job/' in x):
+        href = a.get('href', '').strip()
+        if not href:
+            continue
+        if href.startswith('/'):
+            href = 'https://basilea.jobs.personio.de' + href
+        if href in seen:
+            continue
+        seen.add(href)
 
-        return jobs
+        title = a.get_text(strip=True)
+        if title and len(title) > 5:
+            jobs.append((title, href))
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_BASILEA_jobs() -> str:
+@job_tool
+def get_BASILEA_jobs() -> list:
     """This tool function helps you get BASILEA current job list (Personio-based)"""
     URL = COMPANY_URLS.get("BASILEA", "https://basilea.jobs.personio.de/")
 
@@ -1518,31 +1622,37 @@ def get_BASILEA_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_BASILEA, html, URL)
 
-        for a in soup.find_all('a', href=lambda x: x and '/job/' in x):
-            href = a.get('href', '').strip()
-            if not href:
-                continue
+    jobs = asyncio.run(_run())
+    return jobs
+
+def _parse_DEBIOPHARM(html: str, base_url: str) -> list[tuple]:
+    """Parse the DEBIOPHARM career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
+
+    # Look for job links - they may use various patterns
+    for a in soup.find_all('a', href=True):
+        href = a.get('href', '')
+        text = a.get_text(strip=True)
+
+        # Check if it looks like a job posting
+        if any(kw in href.lower() for kw in ['job', 'career', 'position', 'apply', 'bamboohr', 'greenhouse', 'lever']):
             if href.startswith('/'):
-                href = 'https://basilea.jobs.personio.de' + href
+                href = 'https://www.debiopharm.com' + href
             if href in seen:
                 continue
             seen.add(href)
 
-            title = a.get_text(strip=True)
-            if title and len(title) > 5:
-                jobs.append((title, href))
+            if text and len(text) > 5 and text.lower() not in ['apply', 'learn more', 'careers']:
+                jobs.append((text, href))
 
-        return jobs
-
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_DEBIOPHARM_jobs() -> str:
+@job_tool
+def get_DEBIOPHARM_jobs() -> list:
     """This tool function helps you get DEBIOPHARM current job list"""
     URL = COMPANY_URLS.get("DEBIOPHARM", "https://www.debiopharm.com/careers/#latest-open-positions")
 
@@ -1559,33 +1669,47 @@ def get_DEBIOPHARM_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
-
-        # Look for job links - they may use various patterns
-        for a in soup.find_all('a', href=True):
-            href = a.get('href', '')
-            text = a.get_text(strip=True)
+        return await _parse_off_loop(_parse_DEBIOPHARM, html, URL)
 
-            # Check if it looks like a job posting
-            if any(kw in href.lower() for kw in ['job', 'career', 'position', 'apply', 'bamboohr', 'greenhouse', 'lever']):
-                if href.startswith('/'):
-                    href = 'https://www.debiopharm.com' + href
-                if href in seen:
-                    continue
-                seen.add(href)
+    jobs = asyncio.run(_run())
+    return jobs
+
+def _parse_FERRING(html: str, base_url: str) -> list[tuple]:
+    """Parse the FERRING career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
+
+    # Workday pattern
+    for a in soup.find_all('a', attrs={'data-automation-id': 'jobTitle'}):
+        href = a.get('href', '')
+        if href and not href.startswith('http'):
+            href = 'https://ferring.wd3.myworkdayjobs.com' + href
+        if href in seen:
+            continue
+        seen.add(href)
 
-                if text and len(text) > 5 and text.lower() not in ['apply', 'learn more', 'careers']:
-                    jobs.append((text, href))
+        title = a.get_text(strip=True)
+        if title:
+            jobs.append((title, href))
 
-        return jobs
+    # Fallback
+    if not jobs:
+        for a in soup.find_all('a', href=lambda x: x and '/job/' in x):
+            href = a.get('href', '')
+            if not href.startswith('http'):
+                href = 'https://ferring.wd3.myworkdayjobs.com' + href
+            if href in seen:
+                continue
+            seen.add(href)
+            title = a.get_text(strip=True)
+            if title and len(title) > 5:
+                jobs.append((title, href))
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_FERRING_jobs() -> str:
+@job_tool
+def get_FERRING_jobs() -> list:
     """This tool function helps you get FERRING current job list for Switzerland (Workday)"""
     URL = COMPANY_URLS.get("FERRING", "https://ferring.wd3.myworkdayjobs.com/Ferring?locations=dd8155745d350150f89fb94e4649a7eb")
 
@@ -1599,43 +1723,53 @@ def get_FERRING_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_FERRING, html, URL)
 
-        # Workday pattern
-        for a in soup.find_all('a', attrs={'data-automation-id': 'jobTitle'}):
-            href = a.get('href', '')
-            if href and not href.startswith('http'):
-                href = 'https://ferring.wd3.myworkdayjobs.com' + href
-            if href in seen:
-                continue
-            seen.add(href)
+    jobs = asyncio.run(_run())
+    return jobs
 
-            title = a.get_text(strip=True)
-            if title:
-                jobs.append((title, href))
+def _parse_UCB(html: str, base_url: str) -> list[tuple]:
+    """Parse the UCB career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-        # Fallback
-        if not jobs:
-            for a in soup.find_all('a', href=lambda x: x and '/job/' in x):
-                href = a.get('href', '')
-                if not href.startswith('http'):
-                    href = 'https://ferring.wd3.myworkdayjobs.com' + href
-                if href in seen:
-                    continue
-                seen.add(href)
-                title = a.get_text(strip=True)
-                if title and len(title) > 5:
-                    jobs.append((title, href))
+    anchors = soup.select('a[data-ph-at-id="job-link"]')
+    if not anchors:
+        anchors = soup.find_all('a', href=lambda x: x and '/job/' in x)
 
-        return jobs
+    for a in anchors:
+        href = a.get('href', '').strip()
+        if not href:
+            continue
+        if href.startswith('/'):
+            href = 'https://careers.ucb.com' + href
+        if href in seen:
+            continue
+        seen.add(href)
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+        title = a.get_text(strip=True)
 
-@tool
-def get_UCB_jobs() -> str:
+        # Check for Switzerland in location
+        parent = a.find_parent(['li', 'div', 'tr'])
+        location = ""
+        if parent:
+            loc_elem = parent.select_one('[data-ph-at-id="job-location"]')
+            if loc_elem:
+                location = loc_elem.get_text(strip=True).lower()
+
+        # Filter for Switzerland
+        if 'switzerland' in location or 'zurich' in location or 'basel' in location or 'bern' in location:
+            if title and len(title) > 5:
+                jobs.append((title, href))
+        elif not location:  # If no location found, include it anyway
+            if title and len(title) > 5:
+                jobs.append((title, href))
+
+    return jobs
+
+@job_tool
+def get_UCB_jobs() -> list:
     """This tool function helps you get UCB current job list - filtering for Switzerland"""
     URL = COMPANY_URLS.get("UCB", "https://careers.ucb.com/global/en/search-results?s=1")
 
@@ -1654,49 +1788,36 @@ def get_UCB_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
-
-        anchors = soup.select('a[data-ph-at-id="job-link"]')
-        if not anchors:
-            anchors = soup.find_all('a', href=lambda x: x and '/job/' in x)
+        return await _parse_off_loop(_parse_UCB, html, URL)
 
-        for a in anchors:
-            href = a.get('href', '').strip()
-            if not href:
-                continue
-            if href.startswith('/'):
-                href = 'https://careers.ucb.com' + href
-            if href in seen:
-                continue
-            seen.add(href)
-
-            title = a.get_text(strip=True)
-
-            # Check for Switzerland in location
-            parent = a.find_parent(['li', 'div', 'tr'])
-            location = ""
-            if parent:
-                loc_elem = parent.select_one('[data-ph-at-id="job-location"]')
-                if loc_elem:
-                    location = loc_elem.get_text(strip=True).lower()
-
-            # Filter for Switzerland
-            if 'switzerland' in location or 'zurich' in location or 'basel' in location or 'bern' in location:
-                if title and len(title) > 5:
-                    jobs.append((title, href))
-            elif not location:  # If no location found, include it anyway
-                if title and len(title) > 5:
-                    jobs.append((title, href))
+    jobs = asyncio.run(_run())
+    return jobs
+
+def _parse_RIDGELINE(html: str, base_url: str) -> list[tuple]:
+    """Parse the RIDGELINE career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
+
+    # Greenhouse pattern
+    for a in soup.find_all('a', href=lambda x: x and '/jobs/' in x):
+        href = a.get('href', '').strip()
+        if not href or 'ridgelinediscovery.com/jobs' == href.rstrip('/'):
+            continue
+        if href.startswith('/'):
+            href = 'https://careers.ridgelinediscovery.com' + href
+        if href in seen:
+            continue
+        seen.add(href)
 
-        return jobs
+        title = a.get_text(strip=True)
+        if title and len(title) > 5 and title.lower() not in ['apply', 'jobs']:
+            jobs.append((title, href))
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_RIDGELINE_jobs() -> str:
+@job_tool
+def get_RIDGELINE_jobs() -> list:
     """This tool function helps you get RIDGELINE current job list (Greenhouse-based)"""
     URL = COMPANY_URLS.get("RIDGELINE", "https://careers.ridgelinediscovery.com/jobs")
 
@@ -1710,32 +1831,46 @@ def get_RIDGELINE_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_RIDGELINE, html, URL)
+
+    jobs = asyncio.run(_run())
+    return jobs
 
-        # Greenhouse pattern
-        for a in soup.find_all('a', href=lambda x: x and '/jobs/' in x):
-            href = a.get('href', '').strip()
-            if not href or 'ridgelinediscovery.com/jobs' == href.rstrip('/'):
+def _parse_INTERAX(html: str, base_url: str) -> list[tuple]:
+    """Parse the INTERAX career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
+
+    # Look for PDF job listings (InterAx posts jobs as PDF downloads)
+    for a in soup.find_all('a', href=True):
+        href = a.get('href', '')
+        text = a.get_text(strip=True)
+
+        # Check for PDF job postings in uploads folder
+        if '/wp-content/uploads/' in href and href.endswith('.pdf'):
+            if href in seen:
                 continue
+            seen.add(href)
+            if text and len(text) > 5:
+                jobs.append((text, href))
+            continue
+
+        # Also check for standard job board links
+        if any(kw in href.lower() for kw in ['job', 'position', 'apply', 'bamboohr', 'greenhouse', 'lever']):
             if href.startswith('/'):
-                href = 'https://careers.ridgelinediscovery.com' + href
+                href = 'https://interaxbiotech.com' + href
             if href in seen:
                 continue
             seen.add(href)
 
-            title = a.get_text(strip=True)
-            if title and len(title) > 5 and title.lower() not in ['apply', 'jobs']:
-                jobs.append((title, href))
-
-        return jobs
+            if text and len(text) > 5 and text.lower() not in ['apply', 'learn more', 'careers']:
+                jobs.append((text, href))
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_INTERAX_jobs() -> str:
+@job_tool
+def get_INTERAX_jobs() -> list:
     """This tool function helps you get INTERAX current job list"""
     URL = COMPANY_URLS.get("INTERAX", "https://interaxbiotech.com/interax-homepage/careers/")
 
@@ -1749,42 +1884,35 @@ def get_INTERAX_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_INTERAX, html, URL)
 
-        # Look for PDF job listings (InterAx posts jobs as PDF downloads)
-        for a in soup.find_all('a', href=True):
-            href = a.get('href', '')
-            text = a.get_text(strip=True)
+    jobs = asyncio.run(_run())
+    return jobs
 
-            # Check for PDF job postings in uploads folder
-            if '/wp-content/uploads/' in href and href.endswith('.pdf'):
-                if href in seen:
-                    continue
-                seen.add(href)
-                if text and len(text) > 5:
-                    jobs.append((text, href))
-                continue
+def _parse_PHILOCHEM(html: str, base_url: str) -> list[tuple]:
+    """Parse the PHILOCHEM career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-            # Also check for standard job board links
-            if any(kw in href.lower() for kw in ['job', 'position', 'apply', 'bamboohr', 'greenhouse', 'lever']):
-                if href.startswith('/'):
-                    href = 'https://interaxbiotech.com' + href
-                if href in seen:
-                    continue
-                seen.add(href)
+    for a in soup.find_all('a', href=True):
+        href = a.get('href', '')
+        text = a.get_text(strip=True)
 
-                if text and len(text) > 5 and text.lower() not in ['apply', 'learn more', 'careers']:
-                    jobs.append((text, href))
+        if any(kw in href.lower() or kw in text.lower() for kw in ['job', 'position', 'scientist', 'engineer', 'manager', 'apply']):
+            if href.startswith('/'):
+                href = 'https://www.philochem.ch' + href
+            if href in seen or href == base_url:
+                continue
+            seen.add(href)
 
-        return jobs
+            if text and len(text) > 5 and text.lower() not in ['apply', 'learn more', 'careers', 'work with us']:
+                jobs.append((text, href))
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_PHILOCHEM_jobs() -> str:
+@job_tool
+def get_PHILOCHEM_jobs() -> list:
     """This tool function helps you get PHILOCHEM current job list"""
     URL = COMPANY_URLS.get("PHILOCHEM", "https://www.philochem.ch/work-with-us/careers/")
 
@@ -1798,31 +1926,35 @@ def get_PHILOCHEM_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_PHILOCHEM, html, URL)
 
-        for a in soup.find_all('a', href=True):
-            href = a.get('href', '')
-            text = a.get_text(strip=True)
+    jobs = asyncio.run(_run())
+    return jobs
 
-            if any(kw in href.lower() or kw in text.lower() for kw in ['job', 'position', 'scientist', 'engineer', 'manager', 'apply']):
-                if href.startswith('/'):
-                    href = 'https://www.philochem.ch' + href
-                if href in seen or href == URL:
-                    continue
-                seen.add(href)
+def _parse_SPIROCHEM(html: str, base_url: str) -> list[tuple]:
+    """Parse the SPIROCHEM career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-                if text and len(text) > 5 and text.lower() not in ['apply', 'learn more', 'careers', 'work with us']:
-                    jobs.append((text, href))
+    for a in soup.find_all('a', href=True):
+        href = a.get('href', '')
+        text = a.get_text(strip=True)
 
-        return jobs
+        if any(kw in href.lower() or kw in text.lower() for kw in ['job', 'position', 'scientist', 'chemist', 'apply']):
+            if href.startswith('/'):
+                href = 'https://spirochem.com' + href
+            if href in seen or href == base_url:
+                continue
+            seen.add(href)
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+            if text and len(text) > 5 and text.lower() not in ['apply', 'learn more', 'careers']:
+                jobs.append((text, href))
 
-@tool
-def get_SPIROCHEM_jobs() -> str:
+    return jobs
+
+@job_tool
+def get_SPIROCHEM_jobs() -> list:
     """This tool function helps you get SPIROCHEM current job list"""
     URL = COMPANY_URLS.get("SPIROCHEM", "https://spirochem.com/careers")
 
@@ -1836,31 +1968,35 @@ def get_SPIROCHEM_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_SPIROCHEM, html, URL)
 
-        for a in soup.find_all('a', href=True):
-            href = a.get('href', '')
-            text = a.get_text(strip=True)
+    jobs = asyncio.run(_run())
+    return jobs
 
-            if any(kw in href.lower() or kw in text.lower() for kw in ['job', 'position', 'scientist', 'chemist', 'apply']):
-                if href.startswith('/'):
-                    href = 'https://spirochem.com' + href
-                if href in seen or href == URL:
-                    continue
-                seen.add(href)
+def _parse_NBE(html: str, base_url: str) -> list[tuple]:
+    """Parse the NBE career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-                if text and len(text) > 5 and text.lower() not in ['apply', 'learn more', 'careers']:
-                    jobs.append((text, href))
+    for a in soup.find_all('a', href=True):
+        href = a.get('href', '')
+        text = a.get_text(strip=True)
 
-        return jobs
+        if '/employment/' in href or '/vacancies/' in href or '/job/' in href:
+            if href.startswith('/'):
+                href = 'https://nbe-therapeutics.com' + href
+            if href in seen or href == base_url:
+                continue
+            seen.add(href)
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+            if text and len(text) > 5 and text.lower() not in ['apply', 'vacancies', 'employment']:
+                jobs.append((text, href))
 
-@tool
-def get_NBE_jobs() -> str:
+    return jobs
+
+@job_tool
+def get_NBE_jobs() -> list:
     """This tool function helps you get NBE Therapeutics current job list"""
     URL = COMPANY_URLS.get("NBE", "https://nbe-therapeutics.com/employment/vacancies/")
 
@@ -1874,31 +2010,34 @@ def get_NBE_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_NBE, html, URL)
 
-        for a in soup.find_all('a', href=True):
-            href = a.get('href', '')
-            text = a.get_text(strip=True)
+    jobs = asyncio.run(_run())
+    return jobs
 
-            if '/employment/' in href or '/vacancies/' in href or '/job/' in href:
-                if href.startswith('/'):
-                    href = 'https://nbe-therapeutics.com' + href
-                if href in seen or href == URL:
-                    continue
-                seen.add(href)
+def _parse_CRADLE(html: str, base_url: str) -> list[tuple]:
+    """Parse the CRADLE career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-                if text and len(text) > 5 and text.lower() not in ['apply', 'vacancies', 'employment']:
-                    jobs.append((text, href))
+    # Look for Lever or Greenhouse links (common for startups)
+    for a in soup.find_all('a', href=True):
+        href = a.get('href', '')
+        text = a.get_text(strip=True)
 
-        return jobs
+        if any(kw in href.lower() for kw in ['lever.co', 'greenhouse.io', 'jobs.', 'careers.', '/job/', '/jobs/']):
+            if href in seen:
+                continue
+            seen.add(href)
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+            if text and len(text) > 5 and text.lower() not in ['apply', 'learn more', 'careers']:
+                jobs.append((text, href))
 
-@tool
-def get_CRADLE_jobs() -> str:
+    return jobs
+
+@job_tool
+def get_CRADLE_jobs() -> list:
     """This tool function helps you get CRADLE current job list"""
     URL = COMPANY_URLS.get("CRADLE", "https://www.cradle.bio/careers#careers")
 
@@ -1915,30 +2054,35 @@ def get_CRADLE_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_CRADLE, html, URL)
 
-        # Look for Lever or Greenhouse links (common for startups)
-        for a in soup.find_all('a', href=True):
-            href = a.get('href', '')
-            text = a.get_text(strip=True)
+    jobs = asyncio.run(_run())
+    return jobs
 
-            if any(kw in href.lower() for kw in ['lever.co', 'greenhouse.io', 'jobs.', 'careers.', '/job/', '/jobs/']):
-                if href in seen:
-                    continue
-                seen.add(href)
+def _parse_LEADXPRO(html: str, base_url: str) -> list[tuple]:
+    """Parse the LEADXPRO career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-                if text and len(text) > 5 and text.lower() not in ['apply', 'learn more', 'careers']:
-                    jobs.append((text, href))
+    for a in soup.find_all('a', href=True):
+        href = a.get('href', '')
+        text = a.get_text(strip=True)
 
-        return jobs
+        if '/job/' in href or '/jobs/' in href or 'apply' in href.lower():
+            if href.startswith('/'):
+                href = 'https://careers.leadxpro.com' + href
+            if href in seen:
+                continue
+            seen.add(href)
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+            if text and len(text) > 5 and text.lower() not in ['apply now', 'careers']:
+                jobs.append((text, href))
 
-@tool
-def get_LEADXPRO_jobs() -> str:
+    return jobs
+
+@job_tool
+def get_LEADXPRO_jobs() -> list:
     """This tool function helps you get LEADXPRO current job list"""
     URL = COMPANY_URLS.get("LEADXPRO", "https://careers.leadxpro.com/")
 
@@ -1952,31 +2096,33 @@ def get_LEADXPRO_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_LEADXPRO, html, URL)
 
-        for a in soup.find_all('a', href=True):
-            href = a.get('href', '')
-            text = a.get_text(strip=True)
+    jobs = asyncio.run(_run())
+    return jobs
+
+def _parse_BRIGHTPEAK(html: str, base_url: str) -> list[tuple]:
+    """Parse the BRIGHTPEAK career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-            if '/job/' in href or '/jobs/' in href or 'apply' in href.lower():
-                if href.startswith('/'):
-                    href = 'https://careers.leadxpro.com' + href
-                if href in seen:
-                    continue
-                seen.add(href)
+    for a in soup.find_all('a', href=True):
+        href = a.get('href', '')
+        text = a.get_text(strip=True)
 
-                if text and len(text) > 5 and text.lower() not in ['apply now', 'careers']:
-                    jobs.append((text, href))
+        if any(kw in href.lower() for kw in ['greenhouse', 'lever', 'job', 'apply', 'bamboohr']):
+            if href in seen:
+                continue
+            seen.add(href)
 
-        return jobs
+            if text and len(text) > 5 and text.lower() not in ['apply', 'learn more', 'careers']:
+                jobs.append((text, href))
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_BRIGHTPEAK_jobs() -> str:
+@job_tool
+def get_BRIGHTPEAK_jobs() -> list:
     """This tool function helps you get BRIGHTPEAK current job list"""
     URL = COMPANY_URLS.get("BRIGHTPEAK", "https://brightpeaktx.com/careers/")
 
@@ -1990,29 +2136,35 @@ def get_BRIGHTPEAK_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_BRIGHTPEAK, html, URL)
 
-        for a in soup.find_all('a', href=True):
-            href = a.get('href', '')
-            text = a.get_text(strip=True)
+    jobs = asyncio.run(_run())
+    return jobs
 
-            if any(kw in href.lower() for kw in ['greenhouse', 'lever', 'job', 'apply', 'bamboohr']):
-                if href in seen:
-                    continue
-                seen.add(href)
+def _parse_SOPHIA(html: str, base_url: str) -> list[tuple]:
+    """Parse the SOPHIA career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-                if text and len(text) > 5 and text.lower() not in ['apply', 'learn more', 'careers']:
-                    jobs.append((text, href))
+    for a in soup.find_all('a', href=lambda x: x and '/jobs/' in x):
+        href = a.get('href', '').strip()
+        if not href or '/jobs/search' in href:
+            continue
+        if href.startswith('/'):
+            href = 'https://careers.sophiagenetics.com' + href
+        if href in seen:
+            continue
+        seen.add(href)
 
-        return jobs
+        title = a.get_text(strip=True)
+        if title and len(title) > 5:
+            jobs.append((title, href))
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_SOPHIA_jobs() -> str:
+@job_tool
+def get_SOPHIA_jobs() -> list:
     """This tool function helps you get SOPHiA GENETICS current job list for Switzerland"""
     URL = COMPANY_URLS.get("SOPHIA", "https://careers.sophiagenetics.com/jobs/search?query=switzerland")
 
@@ -2031,31 +2183,36 @@ def get_SOPHIA_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
-
-        for a in soup.find_all('a', href=lambda x: x and '/jobs/' in x):
-            href = a.get('href', '').strip()
-            if not href or '/jobs/search' in href:
-                continue
-            if href.startswith('/'):
-                href = 'https://careers.sophiagenetics.com' + href
-            if href in seen:
-                continue
-            seen.add(href)
+        return await _parse_off_loop(_parse_SOPHIA, html, URL)
 
-            title = a.get_text(strip=True)
-            if title and len(title) > 5:
-                jobs.append((title, href))
+    jobs = asyncio.run(_run())
+    return jobs
+
+def _parse_DANAHER(html: str, base_url: str) -> list[tuple]:
+    """Parse the DANAHER career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
+
+    # Look for job links
+    for a in soup.find_all('a', href=lambda x: x and '/job/' in x):
+        href = a.get('href', '').strip()
+        if not href:
+            continue
+        if href.startswith('/'):
+            href = 'https://jobs.danaher.com' + href
+        if href in seen:
+            continue
+        seen.add(href)
 
-        return jobs
+        title = a.get_text(strip=True)
+        if title and len(title) > 5:
+            jobs.append((title, href))
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_DANAHER_jobs() -> str:
+@job_tool
+def get_DANAHER_jobs() -> list:
     """This tool function helps you get DANAHER current job list for Switzerland"""
     # Use Switzerland location filter in URL
     URL = "https://jobs.danaher.com/global/en/search-results?l=Switzerland&s=1"
@@ -2076,32 +2233,39 @@ def get_DANAHER_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_DANAHER, html, URL)
 
-        # Look for job links
-        for a in soup.find_all('a', href=lambda x: x and '/job/' in x):
-            href = a.get('href', '').strip()
-            if not href:
-                continue
-            if href.startswith('/'):
-                href = 'https://jobs.danaher.com' + href
-            if href in seen:
-                continue
-            seen.add(href)
+    jobs = asyncio.run(_run())
+    return jobs
 
-            title = a.get_text(strip=True)
-            if title and len(title) > 5:
-                jobs.append((title, href))
+def _parse_DSM(html: str, base_url: str) -> list[tuple]:
+    """Parse the DSM career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-        return jobs
+    anchors = soup.select('a[data-ph-at-id="job-link"]')
+    if not anchors:
+        anchors = soup.find_all('a', href=lambda x: x and '/job/' in x)
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+    for a in anchors:
+        href = a.get('href', '').strip()
+        if not href:
+            continue
+        if href.startswith('/'):
+            href = 'https://jobs.dsm-firmenich.com' + href
+        if href in seen:
+            continue
+        seen.add(href)
 
-@tool
-def get_DSM_jobs() -> str:
+        title = a.get_text(strip=True)
+        if title and len(title) > 5:
+            jobs.append((title, href))
+
+    return jobs
+
+@job_tool
+def get_DSM_jobs() -> list:
     """This tool function helps you get DSM-Firmenich current job list for Switzerland"""
     URL = COMPANY_URLS.get("DSM", "https://jobs.dsm-firmenich.com/careers?location=Switzerland")
 
@@ -2120,35 +2284,49 @@ def get_DSM_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
-
-        anchors = soup.select('a[data-ph-at-id="job-link"]')
-        if not anchors:
-            anchors = soup.find_all('a', href=lambda x: x and '/job/' in x)
+        return await _parse_off_loop(_parse_DSM, html, URL)
 
-        for a in anchors:
-            href = a.get('href', '').strip()
-            if not href:
-                continue
-            if href.startswith('/'):
-                href = 'https://jobs.dsm-firmenich.com' + href
-            if href in seen:
-                continue
-            seen.add(href)
+    jobs = asyncio.run(_run())
+    return jobs
+
+def _parse_TETRASCIENCE(html: str, base_url: str) -> list[tuple]:
+    """Parse the TETRASCIENCE career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
+
+    # Workable pattern - find job links
+    for a in soup.find_all('a', href=lambda x: x and '/j/' in x):
+        href = a.get('href', '').strip()
+        if not href:
+            continue
+        if href.startswith('/'):
+            href = 'https://apply.workable.com' + href
+        if href in seen:
+            continue
+        seen.add(href)
 
-            title = a.get_text(strip=True)
-            if title and len(title) > 5:
-                jobs.append((title, href))
+        # Get title from link text or parent element
+        title = a.get_text(strip=True)
+        if not title or len(title) < 5:
+            # Try to get title from parent container
+            parent = a.find_parent(['li', 'div', 'article'])
+            if parent:
+                # Look for heading or strong text
+                h = parent.find(['h2', 'h3', 'h4', 'strong', 'span'])
+                if h:
+                    title = h.get_text(strip=True)
+                else:
+                    # Get first significant text
+                    title = parent.get_text(strip=True)[:100]
 
-        return jobs
+        if title and len(title) > 5:
+            jobs.append((title, href))
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_TETRASCIENCE_jobs() -> str:
+@job_tool
+def get_TETRASCIENCE_jobs() -> list:
     """This tool function helps you get TETRASCIENCE current job list (Workable)"""
     URL = COMPANY_URLS.get("TETRASCIENCE", "https://apply.workable.com/tetrascience/#jobs")
 
@@ -2168,45 +2346,39 @@ def get_TETRASCIENCE_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_TETRASCIENCE, html, URL)
 
-        # Workable pattern - find job links
-        for a in soup.find_all('a', href=lambda x: x and '/j/' in x):
-            href = a.get('href', '').strip()
-            if not href:
-                continue
+    jobs = asyncio.run(_run())
+    return jobs
+
+def _parse_DEEPMIND(html: str, base_url: str) -> list[tuple]:
+    """Parse the DEEPMIND career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
+
+    for a in soup.find_all('a', href=True):
+        href = a.get('href', '')
+        if '/careers/' in href and href != base_url:
             if href.startswith('/'):
-                href = 'https://apply.workable.com' + href
+                href = 'https://deepmind.google' + href
             if href in seen:
                 continue
             seen.add(href)
 
-            # Get title from link text or parent element
-            title = a.get_text(strip=True)
-            if not title or len(title) < 5:
-                # Try to get title from parent container
-                parent = a.find_parent(['li', 'div', 'article'])
-                if parent:
-                    # Look for heading or strong text
-                    h = parent.find(['h2', 'h3', 'h4', 'strong', 'span'])
-                    if h:
-                        title = h.get_text(strip=True)
-                    else:
-                        # Get first significant text
-                        title = parent.get_text(strip=True)[:100]
-
-            if title and len(title) > 5:
-                jobs.append((title, href))
+            # Check for Zurich/Switzerland
+            parent = a.find_parent(['div', 'li', 'article'])
+            text = parent.get_text().lower() if parent else ''
 
-        return jobs
+            if 'zurich' in text or 'zürich' in text or 'switzerland' in text:
+                title = a.get_text(strip=True)
+                if title and len(title) > 5:
+                    jobs.append((title, href))
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_DEEPMIND_jobs() -> str:
+@job_tool
+def get_DEEPMIND_jobs() -> list:
     """This tool function helps you get DEEPMIND current job list - filtering for Switzerland/Zurich"""
     URL = COMPANY_URLS.get("DEEPMIND", "https://deepmind.google/careers/")
 
@@ -2224,35 +2396,35 @@ def get_DEEPMIND_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_DEEPMIND, html, URL)
 
-        for a in soup.find_all('a', href=True):
-            href = a.get('href', '')
-            if '/careers/' in href and href != URL:
-                if href.startswith('/'):
-                    href = 'https://deepmind.google' + href
-                if href in seen:
-                    continue
-                seen.add(href)
+    jobs = asyncio.run(_run())
+    return jobs
 
-                # Check for Zurich/Switzerland
-                parent = a.find_parent(['div', 'li', 'article'])
-                text = parent.get_text().lower() if parent else ''
+def _parse_FMI(html: str, base_url: str) -> list[tuple]:
+    """Parse the FMI career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-                if 'zurich' in text or 'zürich' in text or 'switzerland' in text:
-                    title = a.get_text(strip=True)
-                    if title and len(title) > 5:
-                        jobs.append((title, href))
+    for a in soup.find_all('a', href=True):
+        href = a.get('href', '')
+        text = a.get_text(strip=True)
 
-        return jobs
+        if '/positions/' in href or '/job' in href.lower():
+            if href.startswith('/'):
+                href = 'https://www.fmi.ch' + href
+            if href in seen or href == base_url:
+                continue
+            seen.add(href)
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+            if text and len(text) > 5 and text.lower() not in ['positions', 'careers']:
+                jobs.append((text, href))
 
-@tool
-def get_FMI_jobs() -> str:
+    return jobs
+
+@job_tool
+def get_FMI_jobs() -> list:
     """This tool function helps you get FMI (Friedrich Miescher Institute) current job list"""
     URL = COMPANY_URLS.get("FMI", "https://www.fmi.ch/education-careers/positions/")
 
@@ -2266,31 +2438,35 @@ def get_FMI_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_FMI, html, URL)
 
-        for a in soup.find_all('a', href=True):
-            href = a.get('href', '')
-            text = a.get_text(strip=True)
+    jobs = asyncio.run(_run())
+    return jobs
 
-            if '/positions/' in href or '/job' in href.lower():
-                if href.startswith('/'):
-                    href = 'https://www.fmi.ch' + href
-                if href in seen or href == URL:
-                    continue
-                seen.add(href)
+def _parse_HELSINN(html: str, base_url: str) -> list[tuple]:
+    """Parse the HELSINN career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-                if text and len(text) > 5 and text.lower() not in ['positions', 'careers']:
-                    jobs.append((text, href))
+    for a in soup.find_all('a', href=True):
+        href = a.get('href', '')
+        text = a.get_text(strip=True)
 
-        return jobs
+        if '/node/' in href and href != base_url:
+            if href.startswith('/'):
+                href = 'https://www.e-lavoro.ch' + href
+            if href in seen:
+                continue
+            seen.add(href)
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+            if text and len(text) > 5:
+                jobs.append((text, href))
 
-@tool
-def get_HELSINN_jobs() -> str:
+    return jobs
+
+@job_tool
+def get_HELSINN_jobs() -> list:
     """This tool function helps you get HELSINN current job list"""
     URL = COMPANY_URLS.get("HELSINN", "https://www.e-lavoro.ch/node/76")
 
@@ -2304,31 +2480,35 @@ def get_HELSINN_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_HELSINN, html, URL)
 
-        for a in soup.find_all('a', href=True):
-            href = a.get('href', '')
-            text = a.get_text(strip=True)
+    jobs = asyncio.run(_run())
+    return jobs
 
-            if '/node/' in href and href != URL:
-                if href.startswith('/'):
-                    href = 'https://www.e-lavoro.ch' + href
-                if href in seen:
-                    continue
-                seen.add(href)
+def _parse_GIVAUDAN(html: str, base_url: str) -> list[tuple]:
+    """Parse the GIVAUDAN career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-                if text and len(text) > 5:
-                    jobs.append((text, href))
+    for a in soup.find_all('a', href=lambda x: x and '/job/' in x):
+        href = a.get('href', '').strip()
+        if not href:
+            continue
+        if href.startswith('/'):
+            href = 'https://jobs.givaudan.com' + href
+        if href in seen:
+            continue
+        seen.add(href)
 
-        return jobs
+        title = a.get_text(strip=True)
+        if title and len(title) > 5:
+            jobs.append((title, href))
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_GIVAUDAN_jobs() -> str:
+@job_tool
+def get_GIVAUDAN_jobs() -> list:
     """This tool function helps you get GIVAUDAN current job list for Switzerland"""
     URL = COMPANY_URLS.get("GIVAUDAN", "https://jobs.givaudan.com/search/?q=switzerland")
 
@@ -2347,31 +2527,35 @@ def get_GIVAUDAN_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_GIVAUDAN, html, URL)
 
-        for a in soup.find_all('a', href=lambda x: x and '/job/' in x):
-            href = a.get('href', '').strip()
-            if not href:
-                continue
-            if href.startswith('/'):
-                href = 'https://jobs.givaudan.com' + href
-            if href in seen:
-                continue
-            seen.add(href)
+    jobs = asyncio.run(_run())
+    return jobs
 
-            title = a.get_text(strip=True)
-            if title and len(title) > 5:
-                jobs.append((title, href))
+def _parse_CLARIANT(html: str, base_url: str) -> list[tuple]:
+    """Parse the CLARIANT career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-        return jobs
+    for a in soup.find_all('a', href=lambda x: x and '/job/' in x):
+        href = a.get('href', '').strip()
+        if not href:
+            continue
+        if href.startswith('/'):
+            href = 'https://careers.clariant.com' + href
+        if href in seen:
+            continue
+        seen.add(href)
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+        title = a.get_text(strip=True)
+        if title and len(title) > 5:
+            jobs.append((title, href))
 
-@tool
-def get_CLARIANT_jobs() -> str:
+    return jobs
+
+@job_tool
+def get_CLARIANT_jobs() -> list:
     """This tool function helps you get CLARIANT current job list for Switzerland"""
     URL = COMPANY_URLS.get("CLARIANT", "https://careers.clariant.com/search/?q=switzerland")
 
@@ -2390,31 +2574,35 @@ def get_CLARIANT_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_CLARIANT, html, URL)
 
-        for a in soup.find_all('a', href=lambda x: x and '/job/' in x):
-            href = a.get('href', '').strip()
-            if not href:
-                continue
-            if href.startswith('/'):
-                href = 'https://careers.clariant.com' + href
-            if href in seen:
-                continue
-            seen.add(href)
+    jobs = asyncio.run(_run())
+    return jobs
 
-            title = a.get_text(strip=True)
-            if title and len(title) > 5:
-                jobs.append((title, href))
+def _parse_CERTARA(html: str, base_url: str) -> list[tuple]:
+    """Parse the CERTARA career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-        return jobs
+    for a in soup.find_all('a', href=lambda x: x and '/jobs/' in x):
+        href = a.get('href', '').strip()
+        if not href or href.endswith('/jobs/') or href.endswith('/jobs'):
+            continue
+        if href.startswith('/'):
+            href = 'https://careers.certara.com' + href
+        if href in seen:
+            continue
+        seen.add(href)
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+        title = a.get_text(strip=True)
+        if title and len(title) > 5:
+            jobs.append((title, href))
 
-@tool
-def get_CERTARA_jobs() -> str:
+    return jobs
+
+@job_tool
+def get_CERTARA_jobs() -> list:
     """This tool function helps you get CERTARA current job list for Switzerland"""
     URL = COMPANY_URLS.get("CERTARA", "https://careers.certara.com/jobs?location=Switzerland")
 
@@ -2433,31 +2621,35 @@ def get_CERTARA_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_CERTARA, html, URL)
 
-        for a in soup.find_all('a', href=lambda x: x and '/jobs/' in x):
-            href = a.get('href', '').strip()
-            if not href or href.endswith('/jobs/') or href.endswith('/jobs'):
-                continue
-            if href.startswith('/'):
-                href = 'https://careers.certara.com' + href
-            if href in seen:
-                continue
-            seen.add(href)
+    jobs = asyncio.run(_run())
+    return jobs
 
-            title = a.get_text(strip=True)
-            if title and len(title) > 5:
-                jobs.append((title, href))
+def _parse_BIOTECHJOBS(html: str, base_url: str) -> list[tuple]:
+    """Parse the BIOTECHJOBS career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-        return jobs
+    for a in soup.find_all('a', href=lambda x: x and '/job/' in x):
+        href = a.get('href', '').strip()
+        if not href:
+            continue
+        if href.startswith('/'):
+            href = 'https://www.swissbiotech.org' + href
+        if href in seen:
+            continue
+        seen.add(href)
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+        title = a.get_text(strip=True)
+        if title and len(title) > 5:
+            jobs.append((title, href))
 
-@tool
-def get_BIOTECHJOBS_jobs() -> str:
+    return jobs
+
+@job_tool
+def get_BIOTECHJOBS_jobs() -> list:
     """This tool function helps you get Swiss Biotech job board listings"""
     URL = COMPANY_URLS.get("BIOTECHJOBS", "https://www.swissbiotech.org/jobs/?type=job&search_location=Switzerland")
 
@@ -2476,31 +2668,34 @@ def get_BIOTECHJOBS_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_BIOTECHJOBS, html, URL)
 
-        for a in soup.find_all('a', href=lambda x: x and '/job/' in x):
-            href = a.get('href', '').strip()
-            if not href:
-                continue
+    jobs = asyncio.run(_run())
+    return jobs
+
+def _parse_GOOGLE(html: str, base_url: str) -> list[tuple]:
+    """Parse the GOOGLE career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
+
+    for a in soup.find_all('a', href=True):
+        href = a.get('href', '')
+        if '/jobs/results/' in href and href != base_url:
             if href.startswith('/'):
-                href = 'https://www.swissbiotech.org' + href
+                href = 'https://www.google.com' + href
             if href in seen:
                 continue
             seen.add(href)
 
             title = a.get_text(strip=True)
-            if title and len(title) > 5:
+            if title and len(title) > 5 and title.lower() not in ['apply', 'learn more']:
                 jobs.append((title, href))
 
-        return jobs
-
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+    return jobs
 
-@tool
-def get_GOOGLE_jobs() -> str:
+@job_tool
+def get_GOOGLE_jobs() -> list:
     """This tool function helps you get GOOGLE current job list for Zurich, Switzerland"""
     URL = COMPANY_URLS.get("GOOGLE", "https://www.google.com/about/careers/applications/jobs/results/?location=Zurich%2C%20Switzerland")
 
@@ -2518,30 +2713,34 @@ def get_GOOGLE_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_GOOGLE, html, URL)
 
-        for a in soup.find_all('a', href=True):
-            href = a.get('href', '')
-            if '/jobs/results/' in href and href != URL:
-                if href.startswith('/'):
-                    href = 'https://www.google.com' + href
-                if href in seen:
-                    continue
-                seen.add(href)
+    jobs = asyncio.run(_run())
+    return jobs
 
-                title = a.get_text(strip=True)
-                if title and len(title) > 5 and title.lower() not in ['apply', 'learn more']:
-                    jobs.append((title, href))
+def _parse_IBM(html: str, base_url: str) -> list[tuple]:
+    """Parse the IBM career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-        return jobs
+    for a in soup.find_all('a', href=True):
+        href = a.get('href', '')
+        if '/job/' in href or 'careers' in href and 'job' in href.lower():
+            if href.startswith('/'):
+                href = 'https://www.ibm.com' + href
+            if href in seen or href == base_url:
+                continue
+            seen.add(href)
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+            title = a.get_text(strip=True)
+            if title and len(title) > 5 and title.lower() not in ['apply', 'careers', 'search']:
+                jobs.append((title, href))
 
-@tool
-def get_IBM_jobs() -> str:
+    return jobs
+
+@job_tool
+def get_IBM_jobs() -> list:
     """This tool function helps you get IBM current job list for Switzerland"""
     URL = COMPANY_URLS.get("IBM", "https://www.ibm.com/careers/search?field_keyword_05%5B0%5D=Switzerland")
 
@@ -2555,30 +2754,34 @@ def get_IBM_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_IBM, html, URL)
 
-        for a in soup.find_all('a', href=True):
-            href = a.get('href', '')
-            if '/job/' in href or 'careers' in href and 'job' in href.lower():
-                if href.startswith('/'):
-                    href = 'https://www.ibm.com' + href
-                if href in seen or href == URL:
-                    continue
-                seen.add(href)
+    jobs = asyncio.run(_run())
+    return jobs
 
-                title = a.get_text(strip=True)
-                if title and len(title) > 5 and title.lower() not in ['apply', 'careers', 'search']:
-                    jobs.append((title, href))
+def _parse_APPLE(html: str, base_url: str) -> list[tuple]:
+    """Parse the APPLE career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-        return jobs
+    for a in soup.find_all('a', href=True):
+        href = a.get('href', '')
+        if '/details/' in href or '/job/' in href:
+            if href.startswith('/'):
+                href = 'https://jobs.apple.com' + href
+            if href in seen:
+                continue
+            seen.add(href)
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+            title = a.get_text(strip=True)
+            if title and len(title) > 5 and title.lower() not in ['apply', 'learn more']:
+                jobs.append((title, href))
 
-@tool
-def get_APPLE_jobs() -> str:
+    return jobs
+
+@job_tool
+def get_APPLE_jobs() -> list:
     """This tool function helps you get APPLE current job list for Switzerland (ML/AI teams)"""
     URL = COMPANY_URLS.get("APPLE", "https://jobs.apple.com/en-us/search?location=switzerland-CHEC")
 
@@ -2592,30 +2795,34 @@ def get_APPLE_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_APPLE, html, URL)
 
-        for a in soup.find_all('a', href=True):
-            href = a.get('href', '')
-            if '/details/' in href or '/job/' in href:
-                if href.startswith('/'):
-                    href = 'https://jobs.apple.com' + href
-                if href in seen:
-                    continue
-                seen.add(href)
+    jobs = asyncio.run(_run())
+    return jobs
 
-                title = a.get_text(strip=True)
-                if title and len(title) > 5 and title.lower() not in ['apply', 'learn more']:
-                    jobs.append((title, href))
+def _parse_MICROSOFT(html: str, base_url: str) -> list[tuple]:
+    """Parse the MICROSOFT career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-        return jobs
+    for a in soup.find_all('a', href=True):
+        href = a.get('href', '')
+        if '/job/' in href or '/jobs/' in href:
+            if href.startswith('/'):
+                href = 'https://careers.microsoft.com' + href
+            if href in seen:
+                continue
+            seen.add(href)
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+            title = a.get_text(strip=True)
+            if title and len(title) > 5 and title.lower() not in ['apply', 'learn more', 'search']:
+                jobs.append((title, href))
 
-@tool
-def get_MICROSOFT_jobs() -> str:
+    return jobs
+
+@job_tool
+def get_MICROSOFT_jobs() -> list:
     """This tool function helps you get MICROSOFT current job list for Switzerland"""
     URL = COMPANY_URLS.get("MICROSOFT", "https://careers.microsoft.com/v2/global/en/search?l=en_us&pg=1&pgSz=20&o=Relevance&flt=true&loc=Switzerland")
 
@@ -2629,30 +2836,34 @@ def get_MICROSOFT_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
+        return await _parse_off_loop(_parse_MICROSOFT, html, URL)
 
-        for a in soup.find_all('a', href=True):
-            href = a.get('href', '')
-            if '/job/' in href or '/jobs/' in href:
-                if href.startswith('/'):
-                    href = 'https://careers.microsoft.com' + href
-                if href in seen:
-                    continue
-                seen.add(href)
+    jobs = asyncio.run(_run())
+    return jobs
 
-                title = a.get_text(strip=True)
-                if title and len(title) > 5 and title.lower() not in ['apply', 'learn more', 'search']:
-                    jobs.append((title, href))
+def _parse_META(html: str, base_url: str) -> list[tuple]:
+    """Parse the META career page HTML into (title, url) tuples."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    seen = set()
 
-        return jobs
+    for a in soup.find_all('a', href=True):
+        href = a.get('href', '')
+        if '/jobs/' in href and 'jobsearch' not in href:
+            if href.startswith('/'):
+                href = 'https://www.metacareers.com' + href
+            if href in seen:
+                continue
+            seen.add(href)
 
-    jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+            title = a.get_text(strip=True)
+            if title and len(title) > 5 and title.lower() not in ['apply', 'view job']:
+                jobs.append((title, href))
 
-@tool
-def get_META_jobs() -> str:
+    return jobs
+
+@job_tool
+def get_META_jobs() -> list:
     """This tool function helps you get META current job list for Switzerland (AI teams)"""
     URL = COMPANY_URLS.get("META", "https://www.metacareers.com/jobs?q=switzerland")
 
@@ -2670,24 +2881,7 @@ def get_META_jobs() -> str:
             html = await page.content()
             await browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        seen = set()
-
-        for a in soup.find_all('a', href=True):
-            href = a.get('href', '')
-            if '/jobs/' in href and 'jobsearch' not in href:
-                if href.startswith('/'):
-                    href = 'https://www.metacareers.com' + href
-                if href in seen:
-                    continue
-                seen.add(href)
-
-                title = a.get_text(strip=True)
-                if title and len(title) > 5 and title.lower() not in ['apply', 'view job']:
-                    jobs.append((title, href))
-
-        return jobs
+        return await _parse_off_loop(_parse_META, html, URL)
 
     jobs = asyncio.run(_run())
-    return _jobs_to_json(jobs)
+    return jobs
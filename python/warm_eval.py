@@ -0,0 +1,376 @@
+"""
+Warm evaluation worker for generated scrapers (code_eval in graph/nodes.py).
+
+A cold sandbox run (python/sandbox.py) starts a new interpreter, imports bs4 and
+playwright and launches Chromium before the generated code does anything. The warm
+worker is started once per run: it imports those modules, launches one headless
+Chromium and then takes scripts over a pipe (one JSON line per request). Every
+script runs in a child forked from the warm worker, in a fresh namespace and its own
+temp directory, under the sandbox limits (wall clock, CPU, memory, output), so
+several evaluations run in parallel and a crashing script never takes the worker
+down. Inside the child, chromium.launch() connects over CDP to the running browser
+instead of starting a new one (launch options such as headless or args are ignored);
+each script still gets its own browser context.
+
+    python -m python.warm_eval ./tmp/script.py   # one evaluation through a warm worker
+
+Set JSA_WARM_EVAL=0 to always use the cold sandbox. If the worker cannot start (no
+fork, no playwright), it is restarted on the next evaluation; after MAX_FAILURES
+failures in a row, code_eval falls back to the cold sandbox for the rest of the run.
+"""
+import os
+import sys
+import json
+import time
+import signal
+import select
+import shutil
+import asyncio
+import tempfile
+import importlib
+import itertools
+import traceback
+import subprocess
+
+from python.sandbox import (SandboxResult, WALL_TIMEOUT, CPU_SECONDS, MEMORY_MB, MAX_OUTPUT,
+                            apply_limits, limit_note, run_code)
+
+WARM_EVAL       = os.environ.get('JSA_WARM_EVAL', '1') != '0'
+WARM_MODULES    = ['asyncio', 'json', 're', 'requests', 'bs4', 'playwright.async_api', 'playwright.sync_api']
+STARTUP_TIMEOUT = 60    # seconds for the worker to import and launch the browser
+BROWSER_TIMEOUT = 20    # seconds for Chromium to open its debugging port
+POLL            = 0.05  # seconds between checks of the running children
+MAX_FAILURES    = 3     # consecutive worker failures before the run falls back to the cold sandbox
+OUTPUT_SLACK    = 65536 # bytes a script's output files may grow past max_output (so truncation is seen)
+JSON_ESCAPE     = 6     # worst-case JSON bytes per output byte (\u0000, \ufffd)
+PROJECT_ROOT    = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# WORKER (runs in its own process)
+# =======================
+
+def _launch_browser() -> tuple[subprocess.Popen | None, str | None, str | None]:
+    """Start headless Chromium with a debugging port; returns (process, CDP endpoint, profile dir)."""
+    try:
+        from playwright.sync_api import sync_playwright
+        with sync_playwright() as p:
+            path = p.chromium.executable_path
+    except Exception as e:
+        print(f'>> warm worker: no playwright browser ({type(e).__name__}: {e})', file=sys.stderr)
+        return None, None, None
+    if not os.path.exists(path):
+        return None, None, None
+
+    profile = tempfile.mkdtemp(prefix='jsa_chromium_')
+    browser = subprocess.Popen([path, '--headless=new', '--remote-debugging-port=0', f'--user-data-dir={profile}',
+                                '--no-first-run', '--no-default-browser-check', 'about:blank'],
+                               stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                               start_new_session=True)
+    # Chromium writes the port it picked to <profile>/DevToolsActivePort
+    port_file = os.path.join(profile, 'DevToolsActivePort')
+    deadline  = time.monotonic() + BROWSER_TIMEOUT
+    while time.monotonic() < deadline and browser.poll() is None:
+        try:
+            with open(port_file) as f:
+                port = f.readline().strip()
+            if port:
+                return browser, f'http://127.0.0.1:{port}', profile
+        except FileNotFoundError:
+            pass
+        time.sleep(POLL)
+    _stop_browser(browser, profile)
+    return None, None, None
+
+
+def _stop_browser(browser: subprocess.Popen | None, profile: str | None) -> None:
+    if browser is not None:
+        try:
+            os.killpg(browser.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        browser.wait()
+    if profile:
+        shutil.rmtree(profile, ignore_errors=True)
+
+
+def _use_warm_browser(endpoint: str) -> None:
+    """Make chromium.launch() (async and sync API) connect to the warm browser."""
+    from playwright.async_api import BrowserType as AsyncBrowserType
+    from playwright.sync_api import BrowserType as SyncBrowserType
+
+    async_launch, sync_launch = AsyncBrowserType.launch, SyncBrowserType.launch
+
+    async def launch_async(self, *args, **kwargs):
+        if self.name == 'chromium':
+            return await self.connect_over_cdp(endpoint)
+        return await async_launch(self, *args, **kwargs)
+
+    def launch_sync(self, *args, **kwargs):
+        if self.name == 'chromium':
+            return self.connect_over_cdp(endpoint)
+        return sync_launch(self, *args, **kwargs)
+
+    AsyncBrowserType.launch, SyncBrowserType.launch = launch_async, launch_sync
+
+
+def _child(code: str, workdir: str, cpu_seconds: int, memory_mb: int, max_output: int) -> None:
+    """
+    Forked child: run the script in a fresh namespace with its output in workdir; never returns.
+    RLIMIT_FSIZE keeps those files (and any the script writes) just above max_output: a script
+    printing past it is killed by SIGXFSZ instead of filling the disk until the wall clock.
+    """
+    status = 1
+    try:
+        os.setsid()
+        os.chdir(workdir)
+        os.dup2(os.open(os.devnull, os.O_RDONLY), 0)  # the request pipe stays the worker's
+        for fd, name in [(1, 'stdout'), (2, 'stderr')]:
+            os.dup2(os.open(name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), fd)
+        sys.stdout = open(1, 'w', buffering=1, closefd=False)
+        sys.stderr = open(2, 'w', buffering=1, closefd=False)
+        sys.argv   = ['script.py']
+        signal.signal(signal.SIGXFSZ, signal.SIG_DFL)  # Python ignores it: an oversized write kills the script
+        apply_limits(cpu_seconds, memory_mb, max_output + OUTPUT_SLACK)
+        namespace = {'__name__': '__main__', '__file__': os.path.join(workdir, 'script.py')}
+        try:
+            exec(compile(code, 'script.py', 'exec'), namespace)
+            status = 0
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                status = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+        except BaseException:
+            traceback.print_exc()
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(status)
+
+
+def _read(path: str, limit: int) -> tuple[str, bool]:
+    """First `limit` bytes of a file and whether there was more."""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read(limit + 1)
+    except FileNotFoundError:
+        return '', False
+    return data[:limit].decode(errors='replace'), len(data) > limit
+
+
+def _serve() -> None:
+    """Worker loop: fork one child per request line on stdin, answer one JSON line per finished child."""
+    answers = os.fdopen(os.dup(1), 'w', buffering=1)
+    os.dup2(2, 1)  # stray prints of the worker must not corrupt the answers
+    for name in WARM_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+    browser, endpoint, profile = _launch_browser()
+    if endpoint:
+        _use_warm_browser(endpoint)
+    answers.write(json.dumps({'ready': True, 'browser': endpoint is not None}) + '\n')
+
+    running, pending = {}, b''  # running: pid -> (request, workdir, start, timed out)
+    try:
+        while True:
+            if select.select([0], [], [], POLL)[0]:
+                data = os.read(0, 65536)
+                if not data:
+                    break  # the run is over (or died): stop the children too
+                pending += data
+                while b'\n' in pending:
+                    line, pending = pending.split(b'\n', 1)
+                    request = json.loads(line)
+                    workdir = tempfile.mkdtemp(prefix='jsa_eval_')
+                    with open(os.path.join(workdir, 'script.py'), 'w') as f:
+                        f.write(request['code'])
+                    pid = os.fork()
+                    if pid == 0:
+                        _child(request['code'], workdir, request['cpu_seconds'], request['memory_mb'], request['max_output'])
+                    running[pid] = (request, workdir, time.perf_counter(), False)
+
+            now = time.perf_counter()
+            for pid, (request, workdir, start, timed_out) in list(running.items()):
+                done, status = os.waitpid(pid, os.WNOHANG)
+                if done:
+                    # kill what the script left behind in its session (e.g. a playwright driver)
+                    try:
+                        os.killpg(pid, signal.SIGKILL)
+                    except (ProcessLookupError, PermissionError):
+                        pass
+                    returncode        = os.waitstatus_to_exitcode(status)
+                    stdout, cut_out   = _read(os.path.join(workdir, 'stdout'), request['max_output'])
+                    stderr, cut_err   = _read(os.path.join(workdir, 'stderr'), request['max_output'])
+                    stderr           += limit_note(returncode, timed_out, request['timeout'], request['cpu_seconds'],
+                                                   request['max_output'])
+                    shutil.rmtree(workdir, ignore_errors=True)
+                    del running[pid]
+                    answers.write(json.dumps({'id': request['id'], 'returncode': returncode, 'stdout': stdout,
+                                              'stderr': stderr, 'seconds': now - start, 'timed_out': timed_out,
+                                              'truncated': cut_out or cut_err}) + '\n')
+                elif not timed_out and now - start > request['timeout']:
+                    try:
+                        os.killpg(pid, signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass  # exited since waitpid: reaped on the next poll
+                    running[pid] = (request, workdir, start, True)
+    finally:
+        for pid, (_, workdir, _, _) in running.items():
+            try:
+                os.killpg(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+            shutil.rmtree(workdir, ignore_errors=True)
+        _stop_browser(browser, profile)
+
+
+# CLIENT (runs in the graph process)
+# =======================
+
+class WarmEvaluator:
+    """Client of one warm worker; evaluations are sent concurrently and answered as they finish."""
+
+    def __init__(self, max_output: int = MAX_OUTPUT):
+        self.browser    = False
+        self.max_output = max_output
+        self._proc      = None
+        self._ids       = itertools.count()
+        self._pending   = {}  # request id -> future of its SandboxResult
+        self._started   = asyncio.ensure_future(self._start())
+
+    async def _start(self) -> None:
+        # one answer line holds stdout and stderr (max_output bytes each) JSON-escaped, plus the sandbox note
+        self._proc = await asyncio.create_subprocess_exec(
+            sys.executable, '-m', 'python.warm_eval', '--worker', cwd=PROJECT_ROOT,
+            stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE,
+            limit=2 * JSON_ESCAPE * self.max_output + 65536)
+        line = await asyncio.wait_for(self._proc.stdout.readline(), STARTUP_TIMEOUT)
+        if not line:
+            raise RuntimeError(f'warm worker exited with status {await self._proc.wait()}')
+        self.browser = json.loads(line)['browser']
+        asyncio.ensure_future(self._answers())
+
+    async def _answers(self) -> None:
+        while line := await self._proc.stdout.readline():
+            answer = json.loads(line)
+            future = self._pending.pop(answer.pop('id'), None)
+            if future is not None and not future.done():
+                future.set_result(SandboxResult(**answer))
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(RuntimeError('warm worker exited'))
+        self._pending.clear()
+
+    async def run(self, code: str, timeout: float = WALL_TIMEOUT, cpu_seconds: int = CPU_SECONDS,
+                  memory_mb: int = MEMORY_MB, max_output: int = MAX_OUTPUT) -> SandboxResult:
+        """Run a script on the warm worker under the sandbox limits (output capped at the worker's max_output)."""
+        max_output = min(max_output, self.max_output)
+        await self._started
+        if self._proc.returncode is not None:
+            raise RuntimeError('warm worker exited')
+        request_id = next(self._ids)
+        future     = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self._proc.stdin.write((json.dumps({'id': request_id, 'code': code, 'timeout': timeout, 'cpu_seconds': cpu_seconds,
+                                            'memory_mb': memory_mb, 'max_output': max_output}) + '\n').encode())
+        await self._proc.stdin.drain()
+        # the worker enforces the timeout, this only guards against a stuck worker
+        return await asyncio.wait_for(future, timeout + 30)
+
+    async def close(self) -> None:
+        """Stop the worker; it stops its children and the browser when its stdin closes."""
+        if self._proc is not None and self._proc.returncode is None:
+            self._proc.stdin.close()
+            await self._proc.wait()
+
+    def abandon(self) -> None:
+        """Stop the worker from outside its event loop (already finished): close the request pipe directly."""
+        if self._proc is not None and self._proc.returncode is None:
+            pipe = self._proc.stdin.get_extra_info('pipe')
+            if pipe is not None:
+                pipe.close()
+
+
+_evaluator = None
+_loop      = None
+_failures  = 0  # consecutive failures of the worker; MAX_FAILURES of them disable it for the run
+
+
+def _replace(loop) -> None:
+    """Start a worker for `loop`, stopping the one of an earlier event loop (its server and browser)."""
+    global _evaluator, _loop
+    if _evaluator is not None:
+        if _loop.is_running() and not _loop.is_closed():
+            asyncio.run_coroutine_threadsafe(_evaluator.close(), _loop)
+        else:
+            _evaluator.abandon()
+    _evaluator, _loop = WarmEvaluator(), loop
+
+
+async def evaluate(code: str, **limits) -> SandboxResult:
+    """
+    Run generated code on the process-wide warm worker (started on first use), or in the
+    cold sandbox when warm evaluation is off or the worker is unavailable. A failed worker is
+    restarted on the next evaluation, up to MAX_FAILURES failures in a row.
+    """
+    global _evaluator, _failures
+    if WARM_EVAL and _failures < MAX_FAILURES and hasattr(os, 'fork'):
+        loop = asyncio.get_running_loop()
+        if _evaluator is None or _loop is not loop:
+            _replace(loop)
+        evaluator = _evaluator
+        try:
+            result    = await evaluator.run(code, **limits)
+            _failures = 0
+            return result
+        except Exception as e:
+            # concurrent evaluations of the same worker fail together: count the worker once
+            if _evaluator is evaluator:
+                _evaluator = None
+                _failures += 1
+                fallback   = 'for the rest of the run' if _failures >= MAX_FAILURES else 'for this script'
+                print(f'>> warm evaluator unavailable ({type(e).__name__}: {e}), using the cold sandbox {fallback}')
+                await evaluator.close()
+    return await run_code(code, **limits)
+
+
+async def shutdown() -> None:
+    """Stop the warm worker of this run, if one was started."""
+    global _evaluator
+    if _evaluator is not None and _loop is asyncio.get_running_loop():
+        await _evaluator.close()
+    _evaluator = None
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Warm evaluation worker for generated scrapers')
+    parser.add_argument('script', nargs='?', help='Python script to evaluate through a warm worker')
+    parser.add_argument('--worker', action='store_true', help='Serve requests on stdin (started by WarmEvaluator)')
+    parser.add_argument('--timeout', type=float, default=WALL_TIMEOUT, help='Wall-clock limit in seconds')
+    args = parser.parse_args()
+
+    if args.worker:
+        _serve()
+    elif args.script:
+        with open(args.script) as f:
+            code = f.read()
+
+        async def _once():
+            evaluator = WarmEvaluator()
+            try:
+                return await evaluator.run(code, timeout=args.timeout), evaluator.browser
+            finally:
+                await evaluator.close()
+
+        result, warm_browser = asyncio.run(_once())
+        print(result.stdout)
+        print(result.stderr, file=sys.stderr)
+        print(f'>> exit {result.returncode} in {result.seconds:.1f}s' + (' (timed out)' if result.timed_out else '')
+              + (' (output truncated)' if result.truncated else '') + ('' if warm_browser else ' (no warm browser)'))